@@ -0,0 +1,72 @@
+"""Benchmark per-raid generation with each Xoroshiro128+ implementation"""
+
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# pylint: disable=wrong-import-position
+from sv_live_map_core.raid_block import TeraRaid
+from sv_live_map_core.rng import Xoroshiro128Plus, Xoroshiro128PlusInt
+from sv_live_map_core.personal_data_handler import PersonalDataHandler
+from sv_live_map_core.sv_enums import (
+    Species,
+    GenderGeneration,
+    TeraTypeGeneration,
+    NatureGeneration,
+    AbilityGeneration,
+    IVGeneration,
+    ShinyGeneration,
+)
+
+RAID_ENEMY_INFO = SimpleNamespace(
+    difficulty = None,
+    boss_poke_para = SimpleNamespace(
+        dev_id = Species.PIKACHU,
+        form_id = 0,
+        sex = GenderGeneration.RANDOM_GENDER,
+        gem_type = TeraTypeGeneration.RANDOM,
+        seikaku = NatureGeneration.NONE,
+        tokusei = AbilityGeneration.RANDOM_12,
+        talent_type = IVGeneration.SET_GUARANTEED_IVS,
+        talent_vnum = 3,
+        rare_type = ShinyGeneration.RANDOM_SHININESS,
+    )
+)
+
+def benchmark(rng_type: type, count: int) -> float:
+    """Time full generation of count raids, returning seconds per raid"""
+    TeraRaid.rng_type = rng_type
+    raids = [
+        TeraRaid(
+            is_enabled = 1,
+            area_id = 0,
+            display_type = 0,
+            den_id = 0,
+            seed = seed * 0x9E3779B1 & 0xFFFFFFFF,
+            _unused_14 = 0,
+            content = 0,
+            collected_league_points = 0,
+        )
+        for seed in range(count)
+    ]
+    def work():
+        for raid in raids:
+            raid.generate_pokemon(RAID_ENEMY_INFO)
+            # derived fields are lazy, access them to generate the full chain
+            _ = raid.tera_type, raid.scale
+    return min(timeit.repeat(work, number = 1, repeat = 5)) / count
+
+def main():
+    """Compare numpy and pure int generation"""
+    PersonalDataHandler()
+    count = 2000
+    numpy_time = benchmark(Xoroshiro128Plus, count)
+    int_time = benchmark(Xoroshiro128PlusInt, count)
+    print(f"numpy Xoroshiro128Plus:  {numpy_time * 1e6:8.2f} us/raid")
+    print(f"int Xoroshiro128PlusInt: {int_time * 1e6:8.2f} us/raid")
+    print(f"speedup: {numpy_time / int_time:.2f}x")
+
+if __name__ == "__main__":
+    main()
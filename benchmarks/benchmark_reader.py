@@ -0,0 +1,64 @@
+"""Benchmark NXReader throughput and latency against the sys-botbase emulator"""
+
+import os
+import sys
+import random
+import timeit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# pylint: disable=wrong-import-position
+from sv_live_map_core.nxreader import NXReader
+from sv_live_map_core.raid_reader import RaidReader
+from sv_live_map_core.memory_snapshot import MemorySnapshot
+from sv_live_map_core.sysbot_emulator import SysBotEmulator
+
+def build_snapshot() -> MemorySnapshot:
+    """Snapshot with random encounter binaries"""
+    rand = random.Random(0)
+    snapshot = MemorySnapshot()
+    for i, (_, pointer, size) in enumerate(RaidReader.raid_enemy_table_reads()):
+        snapshot.add_pointer(pointer, 0x8800000000 + i * 0x10000, rand.randbytes(size))
+    return snapshot
+
+def benchmark(reader: NXReader, pipelined: bool) -> float:
+    """Time reading all encounter binaries, returning seconds per full read"""
+    reads = RaidReader.raid_enemy_table_reads()
+    def work():
+        if pipelined:
+            reader.read_many(reads)
+        else:
+            for _, pointer, size in reads:
+                reader.read_pointer(pointer, size)
+    return min(timeit.repeat(work, number = 1, repeat = 5))
+
+def main():
+    """Compare sequential and pipelined reads under simulated switch conditions"""
+    snapshot = build_snapshot()
+    total_size = sum(size for _, _, size in RaidReader.raid_enemy_table_reads())
+    for latency, bandwidth, fragment_size in (
+        (0, None, None),
+        (0.005, None, 0x5B4),
+        (0.02, 2_000_000, 0x5B4),
+    ):
+        with SysBotEmulator(
+            snapshot,
+            latency = latency,
+            bandwidth = bandwidth,
+            fragment_size = fragment_size
+        ) as emulator:
+            reader = NXReader(emulator.host, emulator.port)
+            sequential_time = benchmark(reader, False)
+            pipelined_time = benchmark(reader, True)
+            reader.socket.close()
+        print(f"{latency=} {bandwidth=} {fragment_size=}")
+        print(
+            f"  sequential: {sequential_time * 1e3:8.2f} ms "
+            f"({total_size / sequential_time / 1e6:6.2f} MB/s)"
+        )
+        print(
+            f"  pipelined:  {pipelined_time * 1e3:8.2f} ms "
+            f"({total_size / pipelined_time / 1e6:6.2f} MB/s)"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@
 import binascii
 from functools import partial
 import sys
-import pickle
 import os
 import os.path
 import threading
@@ -18,7 +17,7 @@ from sv_live_map_core.poke_sprite_handler import PokeSpriteHandler
 from sv_live_map_core.scrollable_frame import ScrollableFrame
 from sv_live_map_core.raid_info_widget import RaidInfoWidget
 from sv_live_map_core.sv_enums import StarLevel
-from sv_live_map_core.raid_enemy_table_array import RaidEnemyTableArray
+from sv_live_map_core.raid_table_cache import RaidTableCache
 from sv_live_map_core.raid_block import RaidBlock, TeraRaid
 from sv_live_map_core.corrected_marker import CorrectedMarker
 from sv_live_map_core.personal_data_handler import PersonalDataHandler
@@ -38,6 +37,7 @@ class Application(customtkinter.CTk):
     PLAYER_POS_ADDRESS = 0x4380340
     ICON_PATH = "./resources/icons8/icon.png"
     SEPARATOR_COLOR = "#949392"
+    TABLE_CACHE_PATH = "./cached_tables/raid_tables.bin"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -228,70 +228,50 @@ class Application(customtkinter.CTk):
             )
         )
 
-    def read_cached_tables(self) -> tuple[RaidEnemyTableArray]:
-        """Read cached encounter tables"""
-        tables = []
-        for level in StarLevel:
-            if not os.path.exists(f"./cached_tables/{level.name}.pkl"):
-                self.error_message_window(
-                    "File Missing",
-                    f"cached table ./cached_tables/{level.name}.pkl does not exist."
-                )
-                return None
-            with open(f"./cached_tables/{level.name}.pkl", "rb") as file:
-                tables.append(pickle.load(file))
-        return tuple(tables)
+    def read_cached_tables(self) -> RaidTableCache:
+        """Read cached encounter tables, None if there are none to reuse"""
+        if not os.path.exists(self.TABLE_CACHE_PATH):
+            return None
+        try:
+            return RaidTableCache.load(self.TABLE_CACHE_PATH)
+        except ValueError as error:
+            print(f"{error}, reading all tables")
+            return None
 
     def dump_cached_tables(self):
         """Dump cached encounter tables"""
         if not os.path.exists("./cached_tables/"):
             os.mkdir("./cached_tables/")
-        for level in StarLevel:
-            with open(f"./cached_tables/{level.name}.pkl", "wb+") as file:
-                pickle.dump(self.reader.raid_enemy_table_arrays[level], file)
+        self.reader.table_cache.save(self.TABLE_CACHE_PATH)
 
     def connect(self) -> bool:
         """Connect to switch and return True if success"""
         try:
-            if self.use_cached_tables.get():
-                cached_tables = self.read_cached_tables()
-                if cached_tables is None:
-                    return False
-                self.reader = RaidReader(
-                    self.ip_entry.get(),
-                    read_safety = False,
-                    usb_connection = self.usb_check.get(),
-                    raid_enemy_table_arrays = cached_tables
-                )
-                if len(self.reader.raid_enemy_table_arrays[0].raid_enemy_tables) == 0:
-                    return self.connection_error(
-                        "Cached raid data is invalid. Ensure the game is loaded in when reading."
-                    )
-
-            else:
-                self.reader = RaidReader(
-                    self.ip_entry.get(),
-                    usb_connection = self.usb_check.get(),
-                    read_safety = True
+            # only the event table and cached tables whose fingerprint changed are read again
+            table_cache = self.read_cached_tables() if self.use_cached_tables.get() else None
+            self.reader = RaidReader(
+                self.ip_entry.get(),
+                usb_connection = self.usb_check.get(),
+                table_cache = table_cache
+            )
+            if 0 in (
+                len(self.reader.raid_enemy_table_arrays[StarLevel.ONE_STAR].raid_enemy_tables),
+                len(self.reader.raid_enemy_table_arrays[StarLevel.TWO_STAR].raid_enemy_tables),
+                len(self.reader.raid_enemy_table_arrays[StarLevel.THREE_STAR].raid_enemy_tables),
+                len(self.reader.raid_enemy_table_arrays[StarLevel.FOUR_STAR].raid_enemy_tables),
+                len(self.reader.raid_enemy_table_arrays[StarLevel.FIVE_STAR].raid_enemy_tables),
+                len(self.reader.raid_enemy_table_arrays[StarLevel.SIX_STAR].raid_enemy_tables),
+                len(self.reader.raid_enemy_table_arrays[StarLevel.EVENT].raid_enemy_tables)
+            ):
+                return self.connection_error(
+                    "Raid data is invalid. Ensure the game is loaded in."
                 )
-                # disable after the tables are read
-                self.reader.read_safety = False
-                if 0 in (
-                    len(self.reader.raid_enemy_table_arrays[StarLevel.ONE_STAR].raid_enemy_tables),
-                    len(self.reader.raid_enemy_table_arrays[StarLevel.TWO_STAR].raid_enemy_tables),
-                    len(self.reader.raid_enemy_table_arrays[StarLevel.THREE_STAR].raid_enemy_tables),
-                    len(self.reader.raid_enemy_table_arrays[StarLevel.FOUR_STAR].raid_enemy_tables),
-                    len(self.reader.raid_enemy_table_arrays[StarLevel.FIVE_STAR].raid_enemy_tables),
-                    len(self.reader.raid_enemy_table_arrays[StarLevel.SIX_STAR].raid_enemy_tables),
-                    len(self.reader.raid_enemy_table_arrays[StarLevel.EVENT].raid_enemy_tables)
-                ):
-                    return self.connection_error(
-                        "Raid data is invalid. Ensure the game is loaded in."
-                    )
-
+            if self.reader.table_cache is not table_cache:
+                # release the mapping of the file about to be replaced
+                table_cache = None
                 self.dump_cached_tables()
             return True
-        except (TimeoutError, struct.error, binascii.Error) as error:
+        except (TimeoutError, ConnectionError, struct.error, binascii.Error) as error:
             self.reader = None
             self.error_message_window("TimeoutError", "Connection timed out.")
             print(error)
@@ -315,24 +295,14 @@ class Application(customtkinter.CTk):
     def read_all_raids(self, render: bool = True) -> RaidBlock:
         """Read and display all raid information"""
         if self.reader:
-            # struct.error/binascii.Error when connection terminates before all bytes are read
+            # ConnectionError when connection terminates before all bytes are read
             try:
-                # try reading up to 5 times before erroring
-                for i in range(5):
-                    try:
-                        raid_block_data = self.reader.read_raid_block_data()
-                        break
-                    except binascii.Error as error:
-                        self.reader.read_safety = True
-                        print(f"Failed to read {i}")
-                        if i == 4:
-                            raise error
-                self.reader.read_safety = False
+                raid_block_data = self.reader.read_raid_block_data()
                 if render:
                     self.info_frame_horizontal_separator.grid_forget()
                     self.render_thread = self.render_raids(raid_block_data)
                 return raid_block_data
-            except (TimeoutError, struct.error, binascii.Error) as error:
+            except (TimeoutError, ConnectionError, struct.error, binascii.Error) as error:
                 if 'position' in self.background_workers \
                       and self.background_workers['position']['active']:
                     self.toggle_position_work()
@@ -479,7 +449,7 @@ class Application(customtkinter.CTk):
             # omit Y (height) coordinate
             game_x, _, game_z = \
                     struct.unpack("fff", self.reader.read_main(self.PLAYER_POS_ADDRESS, 12))
-        except (TimeoutError, struct.error, binascii.Error) as error:
+        except (TimeoutError, ConnectionError, struct.error, binascii.Error) as error:
             self.connection_timeout(error)
         pos_x, pos_y = self.map_widget.game_coordinates_to_deg(game_x, _, game_z)
         if 'marker' not in self.background_workers['position']:
@@ -0,0 +1,244 @@
+"""asyncio class to read information from sys-botbase"""
+
+import asyncio
+import binascii
+from typing import Self
+from .nxreader import pointer_jumps, read_command
+
+class AsyncNXReader:
+    """asyncio version of NXReader over tcp, requests of concurrent tasks are queued onto
+       one connection and responses are matched to requests in the order they were sent"""
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    def __init__(
+        self,
+        ip_address: str,
+        port: int = 6000,
+        timeout: float = 1,
+        transfer_rate: float = 0x10000
+    ) -> None:
+        self.ip_address = ip_address
+        self.port = port
+        self.timeout = timeout
+        # slowest expected rate of response bytes per second, large reads get extra time
+        self.transfer_rate = transfer_rate
+        self.reader: asyncio.StreamReader = None
+        self.writer: asyncio.StreamWriter = None
+        # (response size, future) of every request awaiting a response, in send order
+        self._pending: asyncio.Queue[tuple[int, asyncio.Future]] = None
+        self._send_lock: asyncio.Lock = None
+        self._receive_task: asyncio.Task = None
+        self._connection_error: Exception = None
+        self.ls_lastx: int = 0
+        self.ls_lasty: int = 0
+        self.rs_lastx: int = 0
+        self.rs_lasty: int = 0
+
+    async def connect(self) -> Self:
+        """Connect to sys-botbase and start receiving responses"""
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.ip_address, self.port),
+            self.timeout
+        )
+        self._pending = asyncio.Queue()
+        self._send_lock = asyncio.Lock()
+        self._receive_task = asyncio.create_task(self._receive_responses())
+        print('Connected')
+        await self._configure()
+        return self
+
+    async def _receive_responses(self) -> None:
+        """Receive responses in order and resolve the future of each request"""
+        future = None
+        try:
+            while True:
+                size, future = await self._pending.get()
+                # hex encoded bytes + newline
+                data = await asyncio.wait_for(
+                    self.reader.readexactly(2 * size + 1),
+                    self.response_timeout(size)
+                )
+                if not future.done():
+                    future.set_result(binascii.unhexlify(data[:-1]))
+                future = None
+        except TimeoutError:
+            # responses can no longer be matched to requests once one is missed
+            self._connection_error = TimeoutError("Timed out waiting for sys-botbase")
+            self._fail_pending(future)
+        except (asyncio.IncompleteReadError, ConnectionError, binascii.Error) as error:
+            self._connection_error = ConnectionError(f"Connection to sys-botbase lost: {error}")
+            self._fail_pending(future)
+        except asyncio.CancelledError:
+            # cancelled by close, the response being received is failed too
+            if self._connection_error is None:
+                self._connection_error = ConnectionError("Connection to sys-botbase closed")
+            self._fail_pending(future)
+            raise
+
+    def _fail_pending(self, future: asyncio.Future) -> None:
+        """Fail future and every request still awaiting a response with the connection error"""
+        if future is not None and not future.done():
+            future.set_exception(self._connection_error)
+        while not self._pending.empty():
+            _, future = self._pending.get_nowait()
+            if not future.done():
+                future.set_exception(self._connection_error)
+
+    async def _send_command(self, content: str) -> None:
+        """Send a command to sys-botbase on the switch"""
+        async with self._send_lock:
+            self.writer.write(f"{content}\r\n".encode())
+            await self.writer.drain()
+
+    async def _request(self, command: str, size: int) -> bytes:
+        """Send a command and wait for its size byte response"""
+        if self._connection_error is not None:
+            raise self._connection_error
+        future = asyncio.get_running_loop().create_future()
+        async with self._send_lock:
+            # the receiver may have stopped while waiting for the lock,
+            # nothing would resolve a request queued after that
+            if self._connection_error is not None:
+                raise self._connection_error
+            # queued under the send lock so queue order always matches send order
+            self._pending.put_nowait((size, future))
+            self.writer.write(f"{command}\r\n".encode())
+            await self.writer.drain()
+        return await future
+
+    def response_timeout(self, size: int) -> float:
+        """Seconds to wait for a size byte response, scaled by its hex encoded length"""
+        return self.timeout + (2 * size + 1) / self.transfer_rate
+
+    async def _configure(self) -> None:
+        await self._send_command('configure echoCommands 0')
+
+    async def detach(self) -> None:
+        """Detach controller from switch"""
+        await self._send_command('detachController')
+
+    async def close(self) -> None:
+        """Close connection to switch"""
+        print("Exiting...")
+        await self.detach()
+        await self.pause(0.5)
+        self._connection_error = ConnectionError("Connection to sys-botbase closed")
+        self._receive_task.cancel()
+        self._fail_pending(None)
+        self.writer.close()
+        await self.writer.wait_closed()
+        print('Disconnected')
+
+    async def click(self, button: str) -> None:
+        """Press and release button"""
+        await self._send_command(f'click {button}')
+
+    async def press(self, button: str) -> None:
+        """Press and hold button"""
+        await self._send_command(f'press {button}')
+
+    async def release(self, button: str) -> None:
+        """Release held button"""
+        await self._send_command(f'release {button}')
+
+    async def manual_click(self, button: str, delay: float = 0.1, init_count = 1):
+        """Manually press and release button"""
+        for _ in range(init_count):
+            await self.press(button)
+        await self.pause(delay)
+        await self.release(button)
+
+    async def touch_hold(self, x_val: int, y_val: int, delay_ms: int) -> None:
+        """Hold the touch screen at (x, y) for delay ms"""
+        await self._send_command(f"touchHold {x_val} {y_val} {delay_ms}")
+
+    async def move_stick(self, stick: str, x_val: int, y_val: int) -> None:
+        """Move stick to position"""
+        await self._send_command(f"setStick {stick} 0x{x_val:X} 0x{y_val:X}")
+
+    async def move_left_stick(self, x_val: int = None, y_val: int = None) -> None:
+        """Move the left stick to position"""
+        if x_val is not None:
+            self.ls_lastx = x_val
+        if y_val is not None:
+            self.ls_lasty = y_val
+        await self.move_stick('LEFT', self.ls_lastx, self.ls_lasty)
+
+    async def move_right_stick(self, x_val: int = None, y_val: int = None) -> None:
+        """Move the right stick to position"""
+        if x_val is not None:
+            self.rs_lastx = x_val
+        if y_val is not None:
+            self.rs_lasty = y_val
+        await self.move_stick('RIGHT', self.rs_lastx, self.rs_lasty)
+
+    async def read_many(self, reads: list[tuple[str, int | str, int]]) -> list[bytes]:
+        """Read several (kind, location, size) locations with all commands sent back to back"""
+        return list(
+            await asyncio.gather(
+                *(self._request(read_command(*read), read[2]) for read in reads)
+            )
+        )
+
+    async def resolve_pointers(self, pointers: list[str]) -> list[int]:
+        """Resolve pointer chains to absolute addresses, 0 if any jump is invalid"""
+        return [
+            int.from_bytes(data, 'big')
+            for data in await self.read_many([("resolve", pointer, 8) for pointer in pointers])
+        ]
+
+    async def resolve_pointer(self, pointer: str) -> int:
+        """Resolve a pointer chain to an absolute address, 0 if any jump is invalid"""
+        return (await self.resolve_pointers([pointer]))[0]
+
+    async def read_main_nso_base(self) -> int:
+        """Read the absolute address of main"""
+        return int.from_bytes(await self._request(read_command("main_base", None, 8), 8), 'big')
+
+    async def read(self, address: int, size: int) -> bytes:
+        """Read bytes from heap"""
+        return await self._request(read_command("heap", address, size), size)
+
+    async def read_int(self, address: int, size: int) -> int:
+        """Read integer from heap"""
+        return int.from_bytes(await self.read(address, size), 'little')
+
+    async def read_absolute(self, address: int, size: int) -> bytes:
+        """Read bytes from absolute address"""
+        return await self._request(read_command("absolute", address, size), size)
+
+    async def read_absolute_int(self, address: int, size: int) -> int:
+        """Read integer from absolute address"""
+        return int.from_bytes(await self.read_absolute(address, size), 'little')
+
+    async def write(self, address: int, data: str) -> None:
+        """Write data to heap"""
+        await self._send_command(f'poke 0x{address:X} 0x{data}')
+
+    async def read_main(self, address: int, size: int) -> bytes:
+        """Read bytes from main"""
+        return await self._request(read_command("main", address, size), size)
+
+    async def read_main_int(self, address: int, size: int) -> int:
+        """Read integer from main"""
+        return int.from_bytes(await self.read_main(address, size), 'little')
+
+    async def write_main(self, address, data) -> None:
+        """Write data to main"""
+        await self._send_command(f'pokeMain 0x{address:X} 0x{data}')
+
+    async def read_pointer(self, pointer: str, size: int) -> bytes:
+        """Read bytes from pointer"""
+        return await self._request(read_command("pointer", pointer, size), size)
+
+    async def read_pointer_int(self, pointer: str, size: int) -> int:
+        """Read integer from pointer"""
+        return int.from_bytes(await self.read_pointer(pointer, size), 'little')
+
+    async def write_pointer(self, pointer: str, data: str) -> None:
+        """Write data to pointer"""
+        await self._send_command(f'pointerPoke 0x{data} {pointer_jumps(pointer)}')
+
+    @staticmethod
+    async def pause(duration: float):
+        """Pause without blocking other tasks"""
+        await asyncio.sleep(duration)
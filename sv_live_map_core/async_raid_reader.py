@@ -0,0 +1,133 @@
+"""Subclass of AsyncNXReader with functions specifically for raids"""
+
+import asyncio
+from typing import Self
+from PIL import Image
+from sv_live_map_core.async_nxreader import AsyncNXReader
+from sv_live_map_core.raid_reader import RaidReader
+from sv_live_map_core.sv_enums import StoryProgress, Game
+from sv_live_map_core.raid_enemy_table_array import RaidEnemyTableArray
+from sv_live_map_core.raid_block import RaidBlock, RaidBlockView
+from sv_live_map_core.encounter_index import EncounterIndex
+from sv_live_map_core.rng import KeystreamCache
+
+class AsyncRaidReader(AsyncNXReader):
+    """asyncio version of RaidReader sharing its pointers and parsing"""
+    def __init__(
+        self,
+        ip_address: str,
+        port: int = 6000,
+        timeout: float = 1,
+        raid_enemy_table_arrays: tuple[RaidEnemyTableArray, 7] = None,
+        transfer_rate: float = 0x10000,
+    ) -> None:
+        super().__init__(ip_address, port, timeout, transfer_rate)
+        # save block keys are constant for the session
+        self.keystream_cache: KeystreamCache = KeystreamCache()
+        self.raid_enemy_table_arrays: tuple[RaidEnemyTableArray, 7] = raid_enemy_table_arrays
+        self.encounter_index: EncounterIndex = None
+        self.delivery_raid_priority: tuple[int] = None
+        self.story_progress: StoryProgress = None
+        self.game_version: Game = None
+
+    async def connect(self) -> Self:
+        """Connect to sys-botbase and read the data needed to generate raids"""
+        await super().connect()
+        if self.raid_enemy_table_arrays is None:
+            self.raid_enemy_table_arrays = await self.read_raid_enemy_table_arrays()
+        self.encounter_index = EncounterIndex(self.raid_enemy_table_arrays)
+        self.delivery_raid_priority, self.story_progress, self.game_version = \
+            await asyncio.gather(
+                self.read_delivery_raid_priority(),
+                self.read_story_progess(),
+                self.read_game_version(),
+            )
+        return self
+
+    async def read_delivery_raid_priority(self) -> tuple[int]:
+        """Read the delivery priority flatbuffer from memory"""
+        return RaidReader.parse_delivery_raid_priority(
+            await self.read_pointer(*RaidReader.RAID_PRIORITY_PTR)
+        )
+
+    async def read_story_progess(self) -> StoryProgress:
+        """Read and decrypt story progress from save blocks"""
+        return RaidReader.parse_story_progress(
+            await self.read_save_blocks(
+                [(offset, 1) for offset in reversed(RaidReader.DIFFICULTY_FLAG_LOCATIONS)]
+            )
+        )
+
+    async def read_game_version(self) -> Game:
+        """Read game version"""
+        return Game.from_game_id(await self.read_main_int(0x4385FD0, 4))
+
+    async def read_save_block(self, offset: int, size: int) -> bytearray:
+        """Read decrypted save block at offset"""
+        return (await self.read_save_blocks([(offset, size)]))[0]
+
+    async def read_save_blocks(self, blocks: list[tuple[int, int]]) -> list[bytearray]:
+        """Read decrypted save blocks of (offset, size)"""
+        return RaidReader.decrypt_save_blocks(
+            self.keystream_cache,
+            await self.read_many(RaidReader.save_block_reads(blocks))
+        )
+
+    async def read_save_block_int(self, offset: int) -> int:
+        """Read decrypted save block u32 at offset"""
+        return int.from_bytes((await self.read_save_block(offset, 5))[1:], 'little')
+
+    async def read_save_block_object(self, offset: int) -> bytearray:
+        """Read decrypted save block object at offset"""
+        key_data, header = await self.read_many(RaidReader.save_block_object_header_reads(offset))
+        key = int.from_bytes(key_data, 'little')
+        size = RaidReader.parse_save_block_object_size(self.keystream_cache, key, header)
+        full_object = await self.read_pointer(
+            f"[{RaidReader.SAVE_BLOCK_PTR}+{offset + 8:X}]",
+            5 + size
+        )
+        # discard type and size bytes
+        return self.keystream_cache.decrypt(key, full_object)[5:]
+
+    async def read_trainer_icon(self) -> Image:
+        """Read trainer icon as PIL image"""
+        (width, height), icon = await asyncio.gather(
+            self.read_save_blocks([
+                (RaidReader.TRAINER_ICON_WIDTH_OFFSET, 5),
+                (RaidReader.TRAINER_ICON_HEIGHT_OFFSET, 5),
+            ]),
+            self.read_save_block_object(RaidReader.TRAINER_ICON_OFFSET),
+        )
+        return RaidReader.parse_trainer_icon(
+            int.from_bytes(width[1:], 'little'),
+            int.from_bytes(height[1:], 'little'),
+            icon
+        )
+
+    async def read_raid_enemy_table_arrays(self) -> tuple[RaidEnemyTableArray, 7]:
+        """Read all raid flatbuffer binaries from memory"""
+        return tuple(
+            RaidEnemyTableArray(raid_binary)
+            for raid_binary in await self.read_many(RaidReader.raid_enemy_table_reads())
+        )
+
+    async def read_raid_block_seeds(self) -> tuple[int, int]:
+        """Read only the current_seed and tomorrow_seed header of the raid block"""
+        return RaidReader.parse_raid_block_seeds(
+            await self.read_pointer(RaidReader.RAID_BLOCK_PTR[0], RaidReader.RAID_BLOCK_HEADER_SIZE)
+        )
+
+    async def read_raid_block_view(self) -> RaidBlockView:
+        """Read raid block data from memory as a columnar view"""
+        return RaidBlockView(await self.read_pointer(*RaidReader.RAID_BLOCK_PTR))
+
+    async def read_raid_block_data(self) -> RaidBlock:
+        """Read raid block data from memory and process"""
+        raid_block = (await self.read_raid_block_view()).to_raid_block()
+        raid_block.initialize_data(
+            self.encounter_index,
+            self.story_progress,
+            self.game_version,
+            self.delivery_raid_priority
+        )
+        return raid_block
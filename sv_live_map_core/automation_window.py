@@ -12,6 +12,7 @@ import customtkinter
 import discord_webhook
 from .raid_info_widget import RaidInfoWidget
 from .raid_filter import RaidFilter
+from .raid_block import generate_if_matches
 from .iv_filter_widget import IVFilterWidget
 from .sv_enums import Nature, AbilityIndex, Gender, Species, StarLevel
 from .checked_combobox import CheckedCombobox
@@ -79,9 +80,11 @@ class AutomationWindow(customtkinter.CTkToplevel):
                 total_raid_count, total_reset_count, last_seed, raid_block = \
                     self.read_raids(total_raid_count, total_reset_count, last_seed)
 
-                popup_display_builder, webhook_display_builder = self.define_builders()
+                # duplicate seeds have already been filtered
+                if raid_block is not None:
+                    popup_display_builder, webhook_display_builder = self.define_builders()
 
-                self.filter_raids(raid_block, popup_display_builder, webhook_display_builder)
+                    self.filter_raids(raid_block, popup_display_builder, webhook_display_builder)
 
                 if self.target_found:
                     break
@@ -99,14 +102,20 @@ class AutomationWindow(customtkinter.CTkToplevel):
         total_reset_count: int,
         last_seed: int
     ) -> tuple[int, int, int, RaidBlock]:
-        """Read and parse raids"""
-        raid_block = self.master.read_all_raids(self.map_render_check.get())
-        if raid_block.current_seed != last_seed:
-            last_seed = raid_block.current_seed
-            total_reset_count += 1
-            total_raid_count += 69
+        """Read and parse raids, the full raid block is only read once the seed has changed"""
+        # the seed flips as soon as the game has processed the date skip
+        if last_seed is None:
+            timeout = 0
         else:
+            timeout = 3 if self.master.reader.usb_connection else 5
+        current_seed = self.master.reader.wait_for_seed_change(last_seed, timeout)
+        if current_seed == last_seed:
             print("WARNING raid seed is a duplicate of the previous day")
+            return total_raid_count, total_reset_count, last_seed, None
+        raid_block = self.master.read_all_raids(self.map_render_check.get())
+        last_seed = raid_block.current_seed
+        total_reset_count += 1
+        total_raid_count += 69
         print(
             f"RAIDS PROCESSED {total_reset_count=} "
             f"{total_raid_count=} "
@@ -220,13 +229,13 @@ class AutomationWindow(customtkinter.CTkToplevel):
             species_filter = self.species_filter.get(),
             shiny_filter = self.shiny_filter.get(),
             star_filter = self.difficulty_filter.get()
-        )
+        ).compile()
 
         for raid in raid_block.raids:
             if not raid.is_enabled:
                 continue
 
-            matches_filters = raid_filter.compare(raid)
+            matches_filters = generate_if_matches(raid, raid_filter)
             self.target_found |= matches_filters
 
             self.handle_displays(
@@ -278,7 +287,9 @@ class AutomationWindow(customtkinter.CTkToplevel):
         self.master.reader.manual_click("HOME")
         self.master.reader.pause(0.8)
         self.master.reader.manual_click("HOME")
-        self.master.reader.pause(3 if self.master.reader.usb_connection else 5)
+        # no fixed wait for the game to load back in, read_raids polls for the new seed
+        # resolved pointers are only valid as long as the game has not been restarted
+        self.master.reader.validate_pointer_cache()
 
     def skip_date(self):
         """Skip date with touch screen"""
@@ -1,4 +1,7 @@
 """Array of DeliveryRaidPriority"""
+# generated from DELIVERY_RAID_PRIORITY_ARRAY in flatbuffer_schema.py, do not edit
+
+from __future__ import annotations
 
 from .flatbuffer_object import (
     I8,
@@ -8,47 +11,97 @@ from .flatbuffer_object import (
 
 class DeliveryRaidPriorityArray(FlatBufferObject):
     """Array of DeliveryRaidPriority (root object)"""
-    def __init__(self, buf: bytearray):
-        FlatBufferObject.__init__(self, buf)
-        self.delivery_raid_prioritys: list[DeliveryRaidPriority] = \
-            self.read_init_object_array(DeliveryRaidPriority)
+    __slots__ = ("delivery_raid_prioritys",)
+    delivery_raid_prioritys: list[DeliveryRaidPriority]
+
+    def _decode_delivery_raid_prioritys(self) -> list[DeliveryRaidPriority]:
+        return self.read_object_array(0, DeliveryRaidPriority)
 
 class DeliveryRaidPriority(FlatBufferObject):
     """Data that describes the priority of event dens"""
-    def __init__(self, buf: bytearray, offset: int):
-        super().__init__(buf, offset)
-        self.version_no: int = self.read_init_int(I32)
-        self.delivery_group_id: DeliveryGroupID = self.read_init_object(DeliveryGroupID)
+    __slots__ = ("version_no", "delivery_group_id")
+    version_no: int
+    delivery_group_id: DeliveryGroupID
+
+    def _decode_version_no(self) -> int:
+        if field_offset := self.field_offset(0):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_delivery_group_id(self) -> DeliveryGroupID:
+        return self.read_object(1, DeliveryGroupID)
 
 class DeliveryGroupID(FlatBufferObject):
     """Data that describes how many dens are in each group"""
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, buf: bytearray, offset: int):
-        super().__init__(buf, offset)
-        self.group_id_01 = self.read_init_int(I8)
-        self.group_id_02 = self.read_init_int(I8)
-        self.group_id_03 = self.read_init_int(I8)
-        self.group_id_04 = self.read_init_int(I8)
-        self.group_id_05 = self.read_init_int(I8)
-        self.group_id_06 = self.read_init_int(I8)
-        self.group_id_07 = self.read_init_int(I8)
-        self.group_id_08 = self.read_init_int(I8)
-        self.group_id_09 = self.read_init_int(I8)
-        self.group_id_10 = self.read_init_int(I8)
-
-    @property
-    def group_counts(self) -> tuple[int]:
-        """Grab the amount of each group in tuple form"""
-        return (
-            0, # padding to ensure that id == index
-            self.group_id_01,
-            self.group_id_02,
-            self.group_id_03,
-            self.group_id_04,
-            self.group_id_05,
-            self.group_id_06,
-            self.group_id_07,
-            self.group_id_08,
-            self.group_id_09,
-            self.group_id_10,
-        )
+    __slots__ = (
+        "group_id_01",
+        "group_id_02",
+        "group_id_03",
+        "group_id_04",
+        "group_id_05",
+        "group_id_06",
+        "group_id_07",
+        "group_id_08",
+        "group_id_09",
+        "group_id_10",
+    )
+    group_id_01: int
+    group_id_02: int
+    group_id_03: int
+    group_id_04: int
+    group_id_05: int
+    group_id_06: int
+    group_id_07: int
+    group_id_08: int
+    group_id_09: int
+    group_id_10: int
+
+    def _decode_group_id_01(self) -> int:
+        if field_offset := self.field_offset(0):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_02(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_03(self) -> int:
+        if field_offset := self.field_offset(2):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_04(self) -> int:
+        if field_offset := self.field_offset(3):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_05(self) -> int:
+        if field_offset := self.field_offset(4):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_06(self) -> int:
+        if field_offset := self.field_offset(5):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_07(self) -> int:
+        if field_offset := self.field_offset(6):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_08(self) -> int:
+        if field_offset := self.field_offset(7):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_09(self) -> int:
+        if field_offset := self.field_offset(8):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_group_id_10(self) -> int:
+        if field_offset := self.field_offset(9):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
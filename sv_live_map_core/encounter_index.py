@@ -0,0 +1,133 @@
+"""Precomputed encounter tables of a loaded set of RaidEnemyTableArrays"""
+
+from dataclasses import dataclass
+from itertools import accumulate
+from .raid_enemy_table_array import RaidEnemyTableArray, RaidEnemyInfo
+from .sv_enums import StarLevel, StoryProgress, Game
+
+@dataclass(frozen = True)
+class EncounterTable:
+    """Possible encounter slots of a raid along with their cumulative rates"""
+    slots: tuple[RaidEnemyInfo]
+    cumulative_rates: tuple[int]
+    total: int
+
+class EncounterIndex:
+    """Encounter tables keyed by (difficulty, story progress, game, delivery group),
+       each table is built on first use and reused for every following raid"""
+    def __init__(self, raid_enemy_table_arrays: tuple[RaidEnemyTableArray]) -> None:
+        self.raid_enemy_table_arrays = raid_enemy_table_arrays
+        self._encounter_tables: dict[tuple, EncounterTable] = {}
+        self._delivery_group_ids: dict[tuple, tuple[int]] = {}
+
+    def get(
+        self,
+        difficulty: StarLevel,
+        story_progress: StoryProgress,
+        game: Game,
+        delivery_group_id: int = None
+    ) -> EncounterTable:
+        """Get the encounter table of a raid"""
+        # only event tables depend on story progress and delivery group
+        if difficulty == StarLevel.EVENT:
+            key = (difficulty, story_progress, game, delivery_group_id)
+        else:
+            key = (difficulty, None, game, None)
+        if (encounter_table := self._encounter_tables.get(key)) is None:
+            encounter_table = self._encounter_tables[key] = self.build_encounter_table(*key)
+        return encounter_table
+
+    def get_delivery_group_ids(
+        self,
+        delivery_raid_priority: tuple[int],
+        story_progress: StoryProgress,
+        game: Game,
+        raid_count: int
+    ) -> tuple[int]:
+        """Get the delivery group id of each raid index in the raid block,
+           resolved once per (delivery_raid_priority, story_progress, game)"""
+        key = (tuple(delivery_raid_priority), story_progress, game, raid_count)
+        if (delivery_group_ids := self._delivery_group_ids.get(key)) is None:
+            delivery_group_ids = self._delivery_group_ids[key] = tuple(
+                self.resolve_delivery_group_id(*key[:3], raid_index)
+                for raid_index in range(raid_count)
+            )
+        return delivery_group_ids
+
+    def resolve_delivery_group_id(
+        self,
+        delivery_raid_priority: tuple[int],
+        story_progress: StoryProgress,
+        game: Game,
+        raid_index: int
+    ) -> int:
+        """Find the delivery group id of a raid index based on its position in the raid block"""
+        for delivery_group_id, delivery_group_size in enumerate(delivery_raid_priority):
+            if raid_index < delivery_group_size:
+                # groups without spawnable pokemon are skipped
+                if self.get(StarLevel.EVENT, story_progress, game, delivery_group_id).total == 0:
+                    continue
+                return delivery_group_id
+            raid_index -= delivery_group_size
+        return None
+
+    def build_encounter_table(
+        self,
+        difficulty: StarLevel,
+        story_progress: StoryProgress,
+        game: Game,
+        delivery_group_id: int
+    ) -> EncounterTable:
+        """Build possible encounter table"""
+        slots = tuple(
+            table.raid_enemy_info
+            for table in self.raid_enemy_table_arrays[difficulty].raid_enemy_tables
+            if self.valid_slot(
+                difficulty,
+                story_progress,
+                game,
+                delivery_group_id,
+                table.raid_enemy_info
+            )
+        )
+        cumulative_rates = tuple(accumulate(slot.rate for slot in slots))
+        return EncounterTable(
+            slots,
+            cumulative_rates,
+            cumulative_rates[-1] if cumulative_rates else 0
+        )
+
+    @staticmethod
+    def valid_slot_event(
+        story_progress: StoryProgress,
+        game: Game,
+        delivery_group_id: int,
+        raid_enemy_info: RaidEnemyInfo
+    ) -> bool:
+        """Check if a RaidEnemyInfo is possible to be selected for events"""
+        return (
+            raid_enemy_info.delivery_group_id == delivery_group_id and
+            (
+                raid_enemy_info.difficulty is None
+                or raid_enemy_info.difficulty.is_unlocked(story_progress)
+            ) and
+            raid_enemy_info.rom_ver in (None, game, Game.BOTH)
+        )
+
+    @staticmethod
+    def valid_slot(
+        difficulty: StarLevel,
+        story_progress: StoryProgress,
+        game: Game,
+        delivery_group_id: int,
+        raid_enemy_info: RaidEnemyInfo
+    ) -> bool:
+        """Check if a RaidEnemyInfo is possible to be selected"""
+        if difficulty == StarLevel.EVENT:
+            return EncounterIndex.valid_slot_event(
+                story_progress,
+                game,
+                delivery_group_id,
+                raid_enemy_info
+            )
+        return raid_enemy_info.rom_ver in (None, game, Game.BOTH)
@@ -1,115 +1,94 @@
 """Generic FlatBuffer object"""
 
-from enum import IntEnum
-from typing import Type, Self, Callable
-import flatbuffers
+import struct
+from typing import Any, Type, Self
 
-# type union not yet supported by pylint
-# pylint: disable=unsupported-binary-operation
+# unpackers of scalar field types
+U8 = struct.Struct("<B")
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+U64 = struct.Struct("<Q")
+I8 = struct.Struct("<b")
+I16 = struct.Struct("<h")
+I32 = struct.Struct("<i")
+I64 = struct.Struct("<q")
 
-U8 = flatbuffers.number_types.Uint8Flags
-U16 = flatbuffers.number_types.Uint16Flags
-U32 = flatbuffers.number_types.Uint32Flags
-U64 = flatbuffers.number_types.Uint64Flags
-I8 = flatbuffers.number_types.Int8Flags
-I16 = flatbuffers.number_types.Int16Flags
-I32 = flatbuffers.number_types.Int32Flags
-I64 = flatbuffers.number_types.Int64Flags
+class FlatBufferObject:
+    """Generic FlatBuffer object, subclasses are generated by flatbuffer_schema.py
 
-INT_TYPES = (
-    Type[U8]
-    | Type[U16]
-    | Type[U32]
-    | Type[U64]
-    | Type[I8]
-    | Type[I16]
-    | Type[I32]
-    | Type[I64]
-)
+       Every field of a subclass is a slot filled on first access by its _decode_<name> method,
+       so fields that are never used are never decoded"""
+    __slots__ = ("_buf", "_offset", "_vtable")
 
-class FlatBufferObject:
-    """Generic FlatBuffer object"""
-    def __init__(self, buf: bytearray, offset: int = None):
+    def __init__(self, buf: bytes, offset: int = None):
         # offset is None implies this is a root object
         if offset is None:
-            offset = flatbuffers.encode.Get(
-                flatbuffers.packer.uoffset,
-                buf,
-                0
-            )
-        self._table = flatbuffers.table.Table(
+            offset = U32.unpack_from(buf, 0)[0]
+        self._buf = buf
+        self._offset = offset
+        # vtable is parsed once, field offsets relative to the table (0 for absent fields)
+        vtable = offset - I32.unpack_from(buf, offset)[0]
+        vtable_size = U16.unpack_from(buf, vtable)[0]
+        self._vtable: tuple[int] = struct.unpack_from(
+            f"<{(vtable_size - 4) >> 1}H",
             buf,
-            offset
+            vtable + 4
         )
-        self._offset = offset
-        self._counter = 4
 
-    def read_int(self, _type: INT_TYPES, position: int, default = None):
-        """Read value of _type at position"""
-        if pos_offset := self._table.Offset(position):
-            return self._table.Get(_type, pos_offset + self._offset)
-        return default
+    def __getattr__(self, name: str) -> Any:
+        # only called for slots that have not been filled yet
+        if (decode := getattr(type(self), f"_decode_{name}", None)) is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = decode(self)
+        setattr(self, name, value)
+        return value
 
-    def read_int_enum(
-        self,
-        _type: INT_TYPES,
-        position: int,
-        _enum: Type[IntEnum] | Callable,
-        default = None
-    ):
-        """Read value of _type at position as _enum"""
-        if pos_offset := self._table.Offset(position):
-            return _enum(self._table.Get(_type, pos_offset + self._offset))
-        return default
+    def __reduce__(self) -> tuple:
+        # views of a memory mapped file cannot be pickled, decoded fields are dropped
+        return (type(self), (bytes(self._buf), self._offset))
 
-    def read_init_int(self, _type: INT_TYPES, default = None):
-        """Read value of _type at the position of self._counter
-           and increment the counter"""
-        value = self.read_int(_type, self._counter, default = default)
-        self._counter += 2
-        return value
+    def detach(self, buffers: dict[int, bytes] = None) -> Self:
+        """Copy of this object over a bytes copy of its buffer, objects detached with the same
+           buffers dict share one copy of each buffer"""
+        if buffers is None:
+            buffers = {}
+        if (buf := buffers.get(id(self._buf))) is None:
+            buf = buffers[id(self._buf)] = bytes(self._buf)
+        return type(self)(buf, self._offset)
 
-    def read_init_int_enum(self, _type: INT_TYPES, _enum: Type[IntEnum] | Callable, default = None):
-        """Read value of _type at the position of self._counter as _enum
-           and increment the counter"""
-        value = self.read_int_enum(_type, self._counter, _enum, default = default)
-        self._counter += 2
-        return value
+    @property
+    def buf(self) -> bytes:
+        """Buffer the object is read from"""
+        return self._buf
 
-    def read_object(self, _object_type: Type[Self], position: int, default = None):
-        """Read FlatBufferObject of _object_type at position"""
-        if pos_offset := self._table.Offset(position):
-            val_offset = self._table.Indirect(pos_offset + self._offset)
-            return _object_type(
-                self._table.Bytes,
-                offset = val_offset
-            )
-        return default
+    def field_offset(self, slot: int) -> int:
+        """Offset of the field at slot relative to the table, 0 if absent"""
+        return self._vtable[slot] if slot < len(self._vtable) else 0
 
-    def read_init_object(self, _object_type: Type[Self], default = None):
-        """Read FlatBufferObject of _object_type at the position of self._counter
-           and increment the counter"""
-        value = self.read_object(_object_type, self._counter, default = default)
-        self._counter += 2
-        return value
+    def read_scalar(self, slot: int, unpacker: struct.Struct, default = None):
+        """Read the scalar at slot with unpacker"""
+        if field_offset := self.field_offset(slot):
+            return unpacker.unpack_from(self._buf, self._offset + field_offset)[0]
+        return default
 
-    def read_object_array(self, _object_type: Type[Self], position: int):
-        """Read an array of FlatBufferObjects of _object_type at position"""
-        array = []
-        if pos_offset := self._table.Offset(position):
-            array_offset = self._table.Vector(pos_offset)
-            array_len = self._table.VectorLen(pos_offset)
-            for array_offset in range(array_offset, array_offset + array_len * 4, 4):
-                val_offset = self._table.Indirect(array_offset)
-                array.append(_object_type(
-                    self._table.Bytes,
-                    offset = val_offset
-                ))
-        return array
+    def read_object(self, slot: int, _object_type: Type[Self], default = None):
+        """Read FlatBufferObject of _object_type at slot"""
+        if field_offset := self.field_offset(slot):
+            position = self._offset + field_offset
+            return _object_type(self._buf, position + U32.unpack_from(self._buf, position)[0])
+        return default
 
-    def read_init_object_array(self, _object_type: Type[Self]):
-        """Read an array of FlatBufferObjects of _object_type at the position of self._counter
-           and increment the counter"""
-        array = self.read_object_array(_object_type, self._counter)
-        self._counter += 2
-        return array
+    def read_object_array(self, slot: int, _object_type: Type[Self]):
+        """Read an array of FlatBufferObjects of _object_type at slot"""
+        if not (field_offset := self.field_offset(slot)):
+            return []
+        position = self._offset + field_offset
+        position += U32.unpack_from(self._buf, position)[0]
+        array_len = U32.unpack_from(self._buf, position)[0]
+        # elements are offsets relative to their own position
+        return [
+            _object_type(self._buf, position + 4 + index * 4 + element_offset)
+            for index, element_offset in enumerate(
+                struct.unpack_from(f"<{array_len}I", self._buf, position + 4)
+            )
+        ]
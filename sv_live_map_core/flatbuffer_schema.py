@@ -0,0 +1,270 @@
+"""Declarative schemas of the game's FlatBuffer binaries and the generator of their readers
+
+Run `python -m sv_live_map_core.flatbuffer_schema` to regenerate the reader modules
+after changing a schema"""
+
+import builtins
+import os
+from dataclasses import dataclass
+
+SCALAR_TYPES = ("U8", "U16", "U32", "U64", "I8", "I16", "I32", "I64")
+
+@dataclass(frozen = True)
+class Field:
+    """Field of a table
+
+       type_name is a scalar type of SCALAR_TYPES, the name of a table or [name] for an array of
+       tables, enum is the callable scalars are converted with (an sv_enums name or builtin)"""
+    name: str
+    slot: int
+    type_name: str
+    enum: str = None
+
+    @property
+    def is_scalar(self) -> bool:
+        """Whether the field is a scalar rather than a table or an array of tables"""
+        return self.type_name in SCALAR_TYPES
+
+    @property
+    def annotation(self) -> str:
+        """Type annotation of the decoded value"""
+        if self.type_name.startswith("["):
+            return f"list[{self.type_name[1:-1]}]"
+        if not self.is_scalar:
+            return self.type_name
+        return self.enum.split(".")[0] if self.enum else "int"
+
+    def source(self) -> str:
+        """Source of the decode method of the field"""
+        lines = [f"    def _decode_{self.name}(self) -> {self.annotation}:"]
+        if self.type_name.startswith("["):
+            table = self.type_name[1:-1]
+            lines.append(f"        return self.read_object_array({self.slot}, {table})")
+        elif not self.is_scalar:
+            lines.append(f"        return self.read_object({self.slot}, {self.type_name})")
+        else:
+            value = f"{self.type_name}.unpack_from(self._buf, self._offset + field_offset)[0]"
+            if self.enum:
+                value = f"{self.enum}({value})"
+            lines.extend((
+                f"        if field_offset := self.field_offset({self.slot}):",
+                f"            return {value}",
+                "        return None",
+            ))
+        return "\n".join(lines)
+
+@dataclass(frozen = True)
+class Table:
+    """FlatBuffer table, base is a hand-written FlatBufferObject subclass adding methods"""
+    name: str
+    doc: str
+    fields: tuple[Field]
+    base: str = "FlatBufferObject"
+
+    def source(self) -> str:
+        """Source of the FlatBufferObject subclass of the table"""
+        names = ", ".join(f'"{field.name}"' for field in self.fields)
+        lines = [
+            f"class {self.name}({self.base}):",
+            f'    """{self.doc}"""',
+            f"    __slots__ = ({names}{',' if len(self.fields) == 1 else ''})",
+        ]
+        if len(lines[-1]) > 100:
+            lines[-1:] = [
+                "    __slots__ = (",
+                *(f'        "{field.name}",' for field in self.fields),
+                "    )",
+            ]
+        lines.extend(f"    {field.name}: {field.annotation}" for field in self.fields)
+        for field in self.fields:
+            lines.extend(("", field.source()))
+        return "\n".join(lines)
+
+@dataclass(frozen = True)
+class Schema:
+    """Module of FlatBuffer tables, the first table is the root object,
+       imports are extra import lines such as those of table bases"""
+    module: str
+    doc: str
+    tables: tuple[Table]
+    imports: tuple[str] = ()
+
+    @property
+    def path(self) -> str:
+        """Path of the generated module"""
+        return os.path.join(os.path.dirname(__file__), f"{self.module}.py")
+
+    def source(self) -> str:
+        """Source of the generated module"""
+        fields = [field for table in self.tables for field in table.fields]
+        enums = list(dict.fromkeys(
+            field.enum.split(".")[0]
+            for field in fields
+            if field.enum and not hasattr(builtins, field.enum)
+        ))
+        scalars = [
+            type_name for type_name in SCALAR_TYPES
+            if any(field.type_name == type_name for field in fields)
+        ]
+        lines = [
+            f'"""{self.doc}"""',
+            f"# generated from {self.module.upper()} in flatbuffer_schema.py, do not edit",
+            "",
+            "from __future__ import annotations",
+            "",
+        ]
+        if enums:
+            lines.extend(("from .sv_enums import (", *(f"    {enum}," for enum in enums), ")"))
+        lines.extend((
+            "from .flatbuffer_object import (",
+            *(f"    {scalar}," for scalar in scalars),
+            "    FlatBufferObject,",
+            ")",
+            *self.imports,
+        ))
+        for table in self.tables:
+            lines.extend(("", table.source()))
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Regenerate the module"""
+        with open(self.path, "w", encoding = "utf-8") as module_file:
+            module_file.write(self.source())
+
+RAID_ENEMY_TABLE_ARRAY = Schema(
+    "raid_enemy_table_array",
+    "Array of RaidEnemyInfoTable",
+    (
+        Table(
+            "RaidEnemyTableArray",
+            "Array of RaidEnemyInfoTable (root object)",
+            (Field("raid_enemy_tables", 0, "[RaidEnemyTable]"),),
+            base = "RaidEnemyColumns"
+        ),
+        Table("RaidEnemyTable", "Table containing only RaidEnemyInfo", (
+            Field("raid_enemy_info", 0, "RaidEnemyInfo"),
+        )),
+        Table("RaidEnemyInfo", "Spawn info of raid pokemon", (
+            Field("rom_ver", 0, "I16", "Game"),
+            Field("no", 1, "I32"),
+            Field("delivery_group_id", 2, "I8"),
+            Field("difficulty", 3, "I32", "StarLevel.from_game"),
+            Field("rate", 4, "I8"),
+            Field("drop_table_fix", 5, "U64"),
+            Field("drop_table_random", 6, "U64"),
+            Field("capture_rate", 7, "I8"),
+            Field("capture_lv", 8, "I8"),
+            Field("boss_poke_para", 9, "PokeDataBattle"),
+            Field("boss_poke_size", 10, "RaidBossSizeData"),
+            Field("boss_desc", 11, "RaidBossData"),
+            Field("raid_time_data", 12, "RaidTimeData"),
+        )),
+        Table("PokeDataBattle", "Data that describes attributes of the pokemon itself", (
+            Field("dev_id", 0, "U16", "Species"),
+            Field("form_id", 1, "I16"),
+            Field("sex", 2, "I32", "GenderGeneration"),
+            Field("item", 3, "I32", "Item"),
+            Field("level", 4, "I32"),
+            Field("ball_id", 5, "I32", "Ball"),
+            Field("waza_type", 6, "I32", "MovesetType"),
+            Field("waza_1", 7, "WazaSet"),
+            Field("waza_2", 8, "WazaSet"),
+            Field("waza_3", 9, "WazaSet"),
+            Field("waza_4", 10, "WazaSet"),
+            Field("gem_type", 11, "I32", "TeraTypeGeneration"),
+            Field("seikaku", 12, "I32", "NatureGeneration"),
+            Field("tokusei", 13, "I32", "AbilityGeneration"),
+            Field("talent_type", 14, "I32", "IVGeneration"),
+            Field("talent_value", 15, "ParamSet"),
+            Field("talent_vnum", 16, "I8"),
+            Field("effort_value", 17, "ParamSet"),
+            Field("rare_type", 18, "I32", "ShinyGeneration"),
+            Field("scale_type", 19, "I32", "SizeGeneration"),
+            Field("scale_value", 20, "I16"),
+        )),
+        Table("WazaSet", "Data that describes a learnt move", (
+            Field("waza_id", 0, "U16", "Move"),
+            Field("point_up", 1, "I8"),
+        )),
+        Table("ParamSet", "Data that describes pokemon stats (IVs or EVs)", (
+            Field("hp", 0, "I32"),
+            Field("atk", 1, "I32"),
+            Field("def_", 2, "I32"),
+            Field("spa", 3, "I32"),
+            Field("spd", 4, "I32"),
+            Field("spe", 5, "I32"),
+        )),
+        Table("RaidBossSizeData", "Data that describes the size of raid bosses", (
+            Field("height_type", 0, "I32", "SizeGeneration"),
+            Field("heignt_value", 1, "I16"),
+            Field("weight_type", 2, "I32", "SizeGeneration"),
+            Field("waight_value", 3, "I16"),
+            Field("scale_type", 4, "I32", "SizeGeneration"),
+            Field("scale_value", 5, "I16"),
+        )),
+        Table("RaidBossData", "Data that describes raid boss behavior", (
+            Field("hp_coef", 0, "I16"),
+            Field("power_charge_triger_hp", 1, "I8"),
+            Field("power_charge_triger_time", 2, "I8"),
+            Field("power_charge_limit_time", 3, "I16"),
+            Field("power_charge_cancel_damage", 4, "I8"),
+            Field("power_charge_penalty_time", 5, "I16"),
+            Field("power_charge_penalty_action", 6, "U16"),
+            Field("power_charge_damage_rate", 7, "I8"),
+            Field("power_charge_gem_damage_rate", 8, "I8"),
+            Field("power_charge_change_gem_damage_rate", 9, "I8"),
+            Field("extra_action_1", 10, "RaidBossExtraData"),
+            Field("extra_action_2", 11, "RaidBossExtraData"),
+            Field("extra_action_3", 12, "RaidBossExtraData"),
+            Field("extra_action_4", 13, "RaidBossExtraData"),
+            Field("extra_action_5", 14, "RaidBossExtraData"),
+            Field("extra_action_6", 15, "RaidBossExtraData"),
+            Field("double_action_triger_hp", 16, "I8"),
+            Field("double_action_triger_time", 17, "I8"),
+            Field("double_action_rate", 18, "I8"),
+        )),
+        Table(
+            "RaidBossExtraData",
+            "Data describing special actions a raid boss can do during a raid",
+            (
+                Field("timming", 0, "I16", "ExtraTimingType"),
+                Field("action", 1, "I16", "ExtraActType"),
+                Field("value", 2, "I16"),
+                Field("waza_no", 3, "U16", "Move"),
+            )
+        ),
+        Table("RaidTimeData", "Data that describes the timer during raid battle", (
+            Field("is_active", 0, "U8", "bool"),
+            Field("game_limit", 1, "I32"),
+            Field("client_limit", 2, "I32"),
+            Field("command_limit", 3, "I32"),
+            Field("poke_revive_time", 4, "I32"),
+            Field("ai_interval_time", 5, "I32"),
+            Field("ai_interval_rand", 6, "I32"),
+        )),
+    ),
+    imports = ("from .raid_enemy_columns import RaidEnemyColumns",)
+)
+
+DELIVERY_RAID_PRIORITY_ARRAY = Schema(
+    "delivery_raid_priority_array",
+    "Array of DeliveryRaidPriority",
+    (
+        Table("DeliveryRaidPriorityArray", "Array of DeliveryRaidPriority (root object)", (
+            Field("delivery_raid_prioritys", 0, "[DeliveryRaidPriority]"),
+        )),
+        Table("DeliveryRaidPriority", "Data that describes the priority of event dens", (
+            Field("version_no", 0, "I32"),
+            Field("delivery_group_id", 1, "DeliveryGroupID"),
+        )),
+        Table("DeliveryGroupID", "Data that describes how many dens are in each group", tuple(
+            Field(f"group_id_{group_id:02}", group_id - 1, "I8") for group_id in range(1, 11)
+        )),
+    )
+)
+
+SCHEMAS = (RAID_ENEMY_TABLE_ARRAY, DELIVERY_RAID_PRIORITY_ARRAY)
+
+if __name__ == "__main__":
+    for schema in SCHEMAS:
+        schema.write()
@@ -0,0 +1,133 @@
+"""Recorded switch memory answering sys-botbase commands"""
+
+import struct
+import zlib
+from dataclasses import dataclass, field
+from .nxreader import pointer_jumps
+
+SNAPSHOT_MAGIC = b"SVMS"
+SNAPSHOT_VERSION = 1
+# magic, version, main base, region count, pointer count
+SNAPSHOT_HEADER = struct.Struct("<4sHQII")
+# region kind index, start address, size, followed by the data
+SNAPSHOT_REGION = struct.Struct("<BQI")
+# size of the jump arguments, resolved address, followed by the utf-8 jump arguments
+SNAPSHOT_POINTER = struct.Struct("<HQ")
+SNAPSHOT_REGIONS = ("heap", "main", "absolute")
+
+@dataclass
+class MemorySnapshot:
+    """Recorded switch memory, regions map start addresses to the bytes stored there
+       and pointers map sys-botbase jump arguments to their resolved absolute address"""
+    heap: dict[int, bytes] = field(default_factory = dict)
+    main: dict[int, bytes] = field(default_factory = dict)
+    absolute: dict[int, bytes] = field(default_factory = dict)
+    pointers: dict[str, int] = field(default_factory = dict)
+    main_base: int = 0x8500000000
+
+    def save(self, path: str) -> None:
+        """Save snapshot to a compressed file of raw regions"""
+        parts = [SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            self.main_base,
+            sum(len(self.region(kind)) for kind in SNAPSHOT_REGIONS),
+            len(self.pointers)
+        )]
+        for kind_index, kind in enumerate(SNAPSHOT_REGIONS):
+            for address, data in self.region(kind).items():
+                parts.append(SNAPSHOT_REGION.pack(kind_index, address, len(data)))
+                parts.append(data)
+        for jumps, address in self.pointers.items():
+            jumps = jumps.encode()
+            parts.append(SNAPSHOT_POINTER.pack(len(jumps), address))
+            parts.append(jumps)
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(zlib.compress(b"".join(parts)))
+
+    @staticmethod
+    def load(path: str) -> "MemorySnapshot":
+        """Load snapshot from a file written by save"""
+        with open(path, "rb") as snapshot_file:
+            try:
+                data = zlib.decompress(snapshot_file.read())
+                magic, version, main_base, region_count, pointer_count = \
+                    SNAPSHOT_HEADER.unpack_from(data)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                    raise ValueError("Snapshot is of an unknown format")
+                snapshot = MemorySnapshot(main_base = main_base)
+                offset = SNAPSHOT_HEADER.size
+                for _ in range(region_count):
+                    kind_index, address, size = SNAPSHOT_REGION.unpack_from(data, offset)
+                    offset += SNAPSHOT_REGION.size
+                    snapshot.add(SNAPSHOT_REGIONS[kind_index], address, data[offset:offset + size])
+                    offset += size
+                for _ in range(pointer_count):
+                    size, address = SNAPSHOT_POINTER.unpack_from(data, offset)
+                    offset += SNAPSHOT_POINTER.size
+                    snapshot.pointers[data[offset:offset + size].decode()] = address
+                    offset += size
+            except (zlib.error, struct.error, IndexError, UnicodeDecodeError) as error:
+                raise ValueError(f"Snapshot is corrupt: {error}") from error
+        if offset != len(data):
+            raise ValueError("Snapshot is corrupt: unexpected trailing data")
+        return snapshot
+
+    def region(self, kind: str) -> dict[int, bytes]:
+        """Region of a heap, main or absolute read"""
+        match kind:
+            case "heap":
+                return self.heap
+            case "main":
+                return self.main
+            case "absolute":
+                return self.absolute
+        raise ValueError(f"Unknown region {kind}")
+
+    def add(self, kind: str, address: int, data: bytes) -> None:
+        """Store data at address of a region"""
+        self.region(kind)[address] = bytes(data)
+
+    def add_pointer(self, pointer: str, address: int, data: bytes = None) -> None:
+        """Store the resolved address of a pointer and optionally the data it points to"""
+        self.pointers[pointer_jumps(pointer)] = address
+        if data is not None:
+            self.add("absolute", address, data)
+
+    def read(self, kind: str, address: int, size: int) -> bytes:
+        """Read size bytes at address of a region, unrecorded bytes read as 0"""
+        data = bytearray(size)
+        for start, stored in self.region(kind).items():
+            begin = max(start, address)
+            end = min(start + len(stored), address + size)
+            if begin < end:
+                data[begin - address:end - address] = stored[begin - start:end - start]
+        return bytes(data)
+
+    def resolve(self, jumps: str) -> int:
+        """Resolved address of sys-botbase jump arguments, 0 if unrecorded"""
+        return self.pointers.get(jumps, 0)
+
+    def respond(self, command: str, args: list[str]) -> bytes:
+        """sys-botbase tcp response to a command, None for commands without a response"""
+        match command:
+            case "peek":
+                data = self.read("heap", int(args[0], 16), int(args[1], 16))
+            case "peekMain":
+                data = self.read("main", int(args[0], 16), int(args[1], 16))
+            case "peekAbsolute":
+                data = self.read("absolute", int(args[0], 16), int(args[1], 16))
+            case "pointerPeek":
+                data = self.read(
+                    "absolute",
+                    self.resolve(" ".join(args[1:])),
+                    int(args[0], 16)
+                )
+            case "pointerAll":
+                return f"{self.resolve(' '.join(args)):016X}\n".encode()
+            case "getMainNsoBase":
+                return f"{self.main_base:016X}\n".encode()
+            case _:
+                # configure, click, press, release, touchHold, setStick, detachController, pokes
+                return None
+        return data.hex().upper().encode() + b"\n"
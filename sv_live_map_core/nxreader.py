@@ -11,16 +11,44 @@ import usb.util
 class USBError(Exception):
     """Error to be raised for usb connections"""
 
+def pointer_jumps(pointer: str) -> str:
+    """Convert a pointer string to sys-botbase jump arguments"""
+    jumps = pointer.replace('[', '').replace('main', '').split(']')
+    return f'0x{" 0x".join(jump.replace("+", "") for jump in jumps)}'
+
+def read_command(kind: str, location: int | str, size: int) -> str:
+    """Build the command of a heap, absolute, main or pointer read,
+       a pointer resolution or a main base read"""
+    match kind:
+        case "heap":
+            return f'peek 0x{location:X} 0x{size:X}'
+        case "absolute":
+            return f'peekAbsolute 0x{location:X} 0x{size:X}'
+        case "main":
+            return f'peekMain 0x{location:X} 0x{size:X}'
+        case "pointer":
+            return f'pointerPeek 0x{size:X} {pointer_jumps(location)}'
+        case "resolve":
+            return f'pointerAll {pointer_jumps(location)}'
+        case "main_base":
+            return 'getMainNsoBase'
+    raise ValueError(f"Unknown read kind {kind}")
+
 class NXReader:
     """Simplified class to read information from sys-botbase"""
+    # commands sent ahead of the response currently being received by read_many
+    PIPELINE_DEPTH = 8
+
     def __init__(
         self,
         ip_address: str = None,
         port: int = 6000,
-        usb_connection: bool = False
+        usb_connection: bool = False,
+        usb_chunk_size: int = 4080
     ) -> None:
         assert usb_connection or ip_address is not None
         self.usb_connection = usb_connection
+        self.usb_chunk_size = usb_chunk_size
         if self.usb_connection:
             # nintendo switch vendor and product
             self.global_dev = usb.core.find(idVendor = 0x057E, idProduct = 0x3000)
@@ -39,9 +67,7 @@ class NXReader:
                   lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_IN
             )
         else:
-            self.socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(1)
-            self.socket.connect((ip_address, port))
+            self._connect(ip_address, port)
         print('Connected')
         self.ls_lastx: int = 0
         self.ls_lasty: int = 0
@@ -49,6 +75,14 @@ class NXReader:
         self.rs_lasty: int = 0
         self._configure()
 
+    def _connect(self, ip_address: str, port: int) -> None:
+        """Connect to sys-botbase over tcp"""
+        self.socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.settimeout(1)
+        self.socket.connect((ip_address, port))
+        # reused by every response, grown to the largest response seen
+        self._recv_buffer: bytearray = bytearray(0x10000)
+
     def _send_command(self, content: str) -> None:
         """Send a command to sys-botbase on the switch"""
         if self.usb_connection:
@@ -65,27 +99,36 @@ class NXReader:
         """Detach controller from switch"""
         self._send_command('detachController')
 
+    def _recv_exact(self, size: int) -> memoryview:
+        """Receive exactly size bytes from the socket into the reusable receive buffer"""
+        if len(self._recv_buffer) < size:
+            self._recv_buffer = bytearray(size)
+        view = memoryview(self._recv_buffer)[:size]
+        received = 0
+        while received < size:
+            count = self.socket.recv_into(view[received:], size - received)
+            if count == 0:
+                raise ConnectionError("Connection closed before the full response was received")
+            received += count
+        return view
+
     def _recv(self, size: int) -> bytes:
         """Receive response from sys-botbase"""
         if not self.usb_connection:
-            return binascii.unhexlify(self.socket.recv(2 * size + 1)[:-1])
+            # hex encoded bytes + newline
+            return binascii.unhexlify(self._recv_exact(2 * size + 1)[:-1])
         size = int(struct.unpack("<L", self.global_in.read(4, timeout = 0).tobytes())[0])
-        data = [0 for _ in range(size)]
-        if size > 4080:
-            i = 0
-            while i < size:
-                chunk_size = 4080
-                if size - i < 4080:
-                    chunk_size = size - i
-                read_data = self.global_in.read(chunk_size, timeout = 0).tobytes()
-                for byte in read_data:
-                    data[i] = int(byte)
-                    i += 1
-        else:
-            read_data = self.global_in.read(size, timeout = 0).tobytes()
-            for i, byte in enumerate(read_data):
-                data[i] = byte
-        return bytes(data)
+        # each response gets its own buffer as read_many holds onto several at once
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            chunk = self.global_in.read(min(self.usb_chunk_size, size - received), timeout = 0)
+            if len(chunk) == 0:
+                raise USBError("Connection closed before the full response was received")
+            view[received:received + len(chunk)] = chunk
+            received += len(chunk)
+        return data
 
     def close(self) -> None:
         """Close connection to switch"""
@@ -143,11 +186,47 @@ class NXReader:
             self.rs_lasty = y_val
         self.move_stick('RIGHT', self.rs_lastx, self.rs_lasty)
 
+    def read_many(self, reads: list[tuple[str, int | str, int]]) -> list[bytes]:
+        """Read several (kind, location, size) locations with their commands pipelined,
+           responses are matched to reads in the order they arrive"""
+        if self.usb_connection:
+            # usb-botbase answers each command before accepting the next
+            results = []
+            for kind, location, size in reads:
+                self._send_command(read_command(kind, location, size))
+                results.append(self._recv(size))
+            return results
+        results = []
+        sent = 0
+        for index, (_, _, size) in enumerate(reads):
+            while sent < len(reads) and sent - index < self.PIPELINE_DEPTH:
+                self._send_command(read_command(*reads[sent]))
+                sent += 1
+            results.append(self._recv(size))
+        return results
+
+    def _address_from_response(self, data: bytes) -> int:
+        """Addresses are sent as big endian hex over tcp and raw little endian over usb"""
+        return int.from_bytes(data, 'little' if self.usb_connection else 'big')
+
+    def resolve_pointers(self, pointers: list[str]) -> list[int]:
+        """Resolve pointer chains to absolute addresses, 0 if any jump is invalid"""
+        return [
+            self._address_from_response(data)
+            for data in self.read_many([("resolve", pointer, 8) for pointer in pointers])
+        ]
+
+    def resolve_pointer(self, pointer: str) -> int:
+        """Resolve a pointer chain to an absolute address, 0 if any jump is invalid"""
+        return self.resolve_pointers([pointer])[0]
+
+    def read_main_nso_base(self) -> int:
+        """Read the absolute address of main"""
+        return self._address_from_response(self.read_many([("main_base", None, 8)])[0])
+
     def read(self, address: int, size: int) -> bytes:
         """Read bytes from heap"""
-        self._send_command(f'peek 0x{address:X} 0x{size:X}')
-        sleep(size / 0x8000)
-        return self._recv(size)
+        return self.read_many([("heap", address, size)])[0]
 
     def read_int(self, address: int, size: int) -> int:
         """Read integer from heap"""
@@ -155,9 +234,7 @@ class NXReader:
 
     def read_absolute(self, address: int, size: int) -> bytes:
         """Read bytes from absolute address"""
-        self._send_command(f'peekAbsolute 0x{address:X} 0x{size:X}')
-        sleep(size / 0x8000)
-        return self._recv(size)
+        return self.read_many([("absolute", address, size)])[0]
 
     def read_absolute_int(self, address: int, size: int) -> int:
         """Read integer from absolute address"""
@@ -169,9 +246,7 @@ class NXReader:
 
     def read_main(self, address: int, size: int) -> bytes:
         """Read bytes from main"""
-        self._send_command(f'peekMain 0x{address:X} 0x{size:X}')
-        sleep(size / 0x8000)
-        return self._recv(size)
+        return self.read_many([("main", address, size)])[0]
 
     def read_main_int(self, address: int, size: int) -> int:
         """Read integer from main"""
@@ -183,11 +258,7 @@ class NXReader:
 
     def read_pointer(self, pointer: str, size: int) -> bytes:
         """Read bytes from pointer"""
-        jumps = pointer.replace('[', '').replace('main', '').split(']')
-        command = f'pointerPeek 0x{size:X} 0x{" 0x".join(jump.replace("+", "") for jump in jumps)}'
-        self._send_command(command)
-        sleep(size / 0x4000)
-        return self._recv(size)
+        return self.read_many([("pointer", pointer, size)])[0]
 
     def read_pointer_int(self, pointer: str, size: int) -> int:
         """Read integer from pointer"""
@@ -195,9 +266,7 @@ class NXReader:
 
     def write_pointer(self, pointer: str, data: str) -> None:
         """Write data to pointer"""
-        jumps = pointer.replace('[', '').replace('main', '').split(']')
-        command = f'pointerPoke 0x{data} 0x{" 0x".join(jump.replace("+", "") for jump in jumps)}'
-        self._send_command(command)
+        self._send_command(f'pointerPoke 0x{data} {pointer_jumps(pointer)}')
 
     @staticmethod
     def pause(duration: float):
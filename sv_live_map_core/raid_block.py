@@ -2,10 +2,14 @@
    https://github.com/kwsch/PKHeX/blob/master/PKHeX.Core/Saves/Substructures/Gen9/RaidSpawnList9.cs
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, ClassVar, Type
+import numpy as np
 from bytechomp import Annotated, ByteOrder, Reader
 from bytechomp.datatypes import U32, U64
-from .rng import Xoroshiro128Plus
+from .rng import Xoroshiro128PlusInt, Xoroshiro128PlusScalar
 from .sv_enums import (
     StoryProgress,
     StarLevel,
@@ -23,10 +27,29 @@ from .sv_enums import (
     Gender,
     AbilityIndex,
 )
-from .raid_enemy_table_array import RaidEnemyTableArray, RaidEnemyTable, RaidEnemyInfo
+from .raid_enemy_table_array import RaidEnemyInfo
+from .encounter_index import EncounterIndex, EncounterTable
 from .personal_data_handler import PersonalDataHandler
 
+if TYPE_CHECKING:
+    from .raid_filter import CompiledRaidFilter
+
 RAID_COUNT = 72
+TERA_RAID_DTYPE = np.dtype([
+    ("is_enabled", "<u4"),
+    ("area_id", "<u4"),
+    ("display_type", "<u4"),
+    ("den_id", "<u4"),
+    ("seed", "<u4"),
+    ("_unused_14", "<u4"),
+    ("content", "<u4"),
+    ("collected_league_points", "<u4"),
+])
+RAID_BLOCK_DTYPE = np.dtype([
+    ("current_seed", "<u8"),
+    ("tomorrow_seed", "<u8"),
+    ("raids", TERA_RAID_DTYPE, (RAID_COUNT,)),
+])
 TOXTRICITY_AMPED_NATURES = (
     Nature.ADAMANT,
     Nature.NAUGHTY,
@@ -127,10 +150,66 @@ def calc_difficulty(story_progress: StoryProgress, difficulty_rand: int) -> Star
             )
     return None
 
+class GenerationStage(IntEnum):
+    """Steps of the main rng chain of a TeraRaid, in the order they are generated"""
+    NONE = 0
+    ENCRYPTION_CONSTANT = 1
+    SIDTID = 2
+    PID = 3
+    IVS = 4
+    ABILITY = 5
+    GENDER = 6
+    NATURE = 7
+    HEIGHT = 8
+    WEIGHT = 9
+    SCALE = 10
+
 @dataclass
 class TeraRaid:
-    """Single Tera Raid Data"""
+    """Single Tera Raid Data
+
+       Everything derived from the main rng is generated lazily on first access,
+       advancing the rng chain only as far as the accessed field"""
     # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        # information directly present in raid block
+        "is_enabled",
+        "area_id",
+        "display_type",
+        "den_id",
+        "seed",
+        "_unused_14",
+        "content",
+        "collected_league_points",
+        # information that needs to be derived
+        "delivery_group_id",
+        "difficulty",
+        "raid_enemy_info",
+        "species",
+        "form",
+        "is_event",
+        # lazily derived information
+        "_tera_type",
+        "_rng",
+        "_stage",
+        "_encryption_constant",
+        "_sidtid",
+        "_pid",
+        "_is_shiny",
+        "_ivs",
+        "_ability",
+        "_ability_index",
+        "_gender",
+        "_nature",
+        "_height",
+        "_weight",
+        "_scale",
+        "_id_str",
+    )
+    # pure python rng is considerably faster for the few advances done per raid,
+    # the numpy implementation is kept as a reference
+    rng_type: ClassVar[Type[Xoroshiro128PlusScalar]] = Xoroshiro128PlusInt
+
     # information directly present in raid block
     is_enabled: U32
     area_id: U32
@@ -144,36 +223,169 @@ class TeraRaid:
     def __post_init__(self) -> None:
         # information that needs to be derived
         self.delivery_group_id: int = None
-        self.tera_type: TeraType = None
         self.difficulty: StarLevel = None
         self.raid_enemy_info: RaidEnemyInfo = None
         self.species: Species = None
         self.form: int = None
         self.is_event: bool = None
-        self.encryption_constant: int = None
-        self.pid: int = None
-        self.sidtid: int = None
-        self.is_shiny: bool = None
-        self.ivs: tuple[int, 6] = None
 
-        self.ability: Ability = None
-        self.ability_index: AbilityIndex = None
-        self.gender: Gender = None
-
-        self.nature: Nature = None
-        self.height: int = None
-        self.weight: int = None
-        self.scale: int = None
-
-        # for map display
-        self.id_str: str = f"{self.area_id}-{self.den_id}"
+        # for map display, derived from area_id and den_id unless overwritten
+        self._id_str: str = None
+
+        self._tera_type: TeraType = None
+        self._reset_generation()
+
+    def _reset_generation(self) -> None:
+        """Restart the main rng chain"""
+        self._rng: Xoroshiro128PlusScalar = None
+        self._stage: GenerationStage = GenerationStage.NONE
+        self._encryption_constant: int = None
+        self._sidtid: int = None
+        self._pid: int = None
+        self._is_shiny: bool = None
+        self._ivs: tuple[int, 6] = None
+        self._ability: Ability = None
+        self._ability_index: AbilityIndex = None
+        self._gender: Gender = None
+        self._nature: Nature = None
+        self._height: int = None
+        self._weight: int = None
+        self._scale: int = None
+
+    def generate_until(self, stage: GenerationStage) -> None:
+        """Advance the main rng chain until stage has been generated"""
+        if self._stage >= stage or self.raid_enemy_info is None:
+            return
+        if self._rng is None:
+            # main rng is only built once something past the slot is needed
+            self._rng = self.rng_type(self.seed)
+        rng = self._rng
+        while self._stage < stage:
+            self._stage += 1
+            match self._stage:
+                case GenerationStage.ENCRYPTION_CONSTANT:
+                    self._encryption_constant = rng.rand()
+                case GenerationStage.SIDTID:
+                    self._sidtid = rng.rand()
+                case GenerationStage.PID:
+                    self._pid = rng.rand()
+                    self._is_shiny = is_shiny(
+                        self.raid_enemy_info.boss_poke_para.rare_type,
+                        self._pid,
+                        self._sidtid
+                    )
+                case GenerationStage.IVS:
+                    self._ivs = self.rand_ivs(rng)
+                case GenerationStage.ABILITY:
+                    self._ability_index, self._ability = self.rand_ability(rng)
+                case GenerationStage.GENDER:
+                    self._gender = self.rand_gender(rng)
+                case GenerationStage.NATURE:
+                    self._nature = self.rand_nature(rng)
+                case GenerationStage.HEIGHT:
+                    self._height = self.rand_size(rng)
+                case GenerationStage.WEIGHT:
+                    self._weight = self.rand_size(rng)
+                case GenerationStage.SCALE:
+                    self._scale = self.rand_size(rng)
+                    # chain is complete, rng is no longer needed
+                    self._rng = None
+
+    @property
+    def id_str(self) -> str:
+        """Identifier of the den for map display"""
+        return self._id_str or f"{self.area_id}-{self.den_id}"
+
+    @id_str.setter
+    def id_str(self, value: str) -> None:
+        self._id_str = value
+
+    @property
+    def tera_type(self) -> TeraType:
+        """Tera type, generated by its own rng"""
+        if self._tera_type is None and self.raid_enemy_info is not None:
+            self._tera_type = self.rand_tera_type()
+        return self._tera_type
+
+    @property
+    def encryption_constant(self) -> int:
+        """Encryption constant"""
+        self.generate_until(GenerationStage.ENCRYPTION_CONSTANT)
+        return self._encryption_constant
+
+    @property
+    def sidtid(self) -> int:
+        """Combined SID and TID"""
+        self.generate_until(GenerationStage.SIDTID)
+        return self._sidtid
+
+    @property
+    def pid(self) -> int:
+        """PID"""
+        self.generate_until(GenerationStage.PID)
+        return self._pid
+
+    @property
+    def is_shiny(self) -> bool:
+        """Shininess"""
+        self.generate_until(GenerationStage.PID)
+        return self._is_shiny
+
+    @property
+    def ivs(self) -> tuple[int, 6]:
+        """IVs"""
+        self.generate_until(GenerationStage.IVS)
+        return self._ivs
+
+    @property
+    def ability_index(self) -> AbilityIndex:
+        """Ability index"""
+        self.generate_until(GenerationStage.ABILITY)
+        return self._ability_index
+
+    @property
+    def ability(self) -> Ability:
+        """Ability"""
+        self.generate_until(GenerationStage.ABILITY)
+        return self._ability
+
+    @property
+    def gender(self) -> Gender:
+        """Gender"""
+        self.generate_until(GenerationStage.GENDER)
+        return self._gender
+
+    @property
+    def nature(self) -> Nature:
+        """Nature"""
+        self.generate_until(GenerationStage.NATURE)
+        return self._nature
+
+    @property
+    def height(self) -> int:
+        """Height scalar"""
+        self.generate_until(GenerationStage.HEIGHT)
+        return self._height
+
+    @property
+    def weight(self) -> int:
+        """Weight scalar"""
+        self.generate_until(GenerationStage.WEIGHT)
+        return self._weight
+
+    @property
+    def scale(self) -> int:
+        """Scale scalar"""
+        self.generate_until(GenerationStage.SCALE)
+        return self._scale
 
     def generate_pokemon(self, raid_enemy_info: RaidEnemyInfo):
-        """Derive pokemon data from seed and slot"""
+        """Derive pokemon data from seed and slot,
+           everything past species and form is generated on first access"""
         self.raid_enemy_info = raid_enemy_info
 
-        # events who force their own difficulty
-        if self.raid_enemy_info.difficulty:
+        # events who force their own difficulty, ONE_STAR (0) included
+        if self.raid_enemy_info.difficulty is not None:
             self.difficulty = self.raid_enemy_info.difficulty
 
         # slot directly determines species + form
@@ -181,33 +393,22 @@ class TeraRaid:
         self.form = raid_enemy_info.boss_poke_para.form_id
 
         # own rng
-        self.tera_type = self.rand_tera_type()
+        self._tera_type = None
 
         # main rng
-        rng = Xoroshiro128Plus(self.seed)
-        self.encryption_constant = rng.rand()
-        self.sidtid = rng.rand()
-        self.pid = rng.rand()
-        self.is_shiny = is_shiny(raid_enemy_info.boss_poke_para.rare_type, self.pid, self.sidtid)
-        self.ivs = self.rand_ivs(rng)
-        self.ability_index, self.ability = self.rand_ability(rng)
-        self.gender = self.rand_gender(rng)
-        self.nature = self.rand_nature(rng)
-        self.height = self.rand_size(rng)
-        self.weight = self.rand_size(rng)
-        self.scale = self.rand_size(rng)
+        self._reset_generation()
 
     def rand_tera_type(self) -> TeraType:
         """Generate tera type"""
         match self.raid_enemy_info.boss_poke_para.gem_type:
             case None | TeraTypeGeneration.NONE | TeraTypeGeneration.RANDOM:
                 # rng object used only for tera type
-                rng_tera = Xoroshiro128Plus(self.seed)
+                rng_tera = self.rng_type(self.seed)
                 return TeraType(rng_tera.rand(18))
             case _:
                 return TeraType.from_generation(self.raid_enemy_info.boss_poke_para.gem_type)
 
-    def rand_ivs(self, rng: Xoroshiro128Plus) -> tuple:
+    def rand_ivs(self, rng: Xoroshiro128PlusScalar) -> tuple:
         """Generate ivs"""
         match self.raid_enemy_info.boss_poke_para.talent_type:
             case IVGeneration.RANDOM_IVS:
@@ -233,7 +434,7 @@ class TeraRaid:
                     self.raid_enemy_info.boss_poke_para.talent_value.spe
                 )
 
-    def rand_ability(self, rng: Xoroshiro128Plus) -> tuple[AbilityIndex, Ability]:
+    def rand_ability(self, rng: Xoroshiro128PlusScalar) -> tuple[AbilityIndex, Ability]:
         """Generate ability"""
         raid_fixed_ability = self.raid_enemy_info.boss_poke_para.tokusei
         match raid_fixed_ability:
@@ -252,7 +453,7 @@ class TeraRaid:
             )
         )
 
-    def rand_gender(self, rng: Xoroshiro128Plus) -> Gender:
+    def rand_gender(self, rng: Xoroshiro128PlusScalar) -> Gender:
         """Generate gender"""
         raid_fixed_gender = self.raid_enemy_info.boss_poke_para.sex
         match raid_fixed_gender:
@@ -270,7 +471,7 @@ class TeraRaid:
             case _:
                 return Gender.from_generation(raid_fixed_gender)
 
-    def rand_nature(self, rng: Xoroshiro128Plus) -> Nature:
+    def rand_nature(self, rng: Xoroshiro128PlusScalar) -> Nature:
         """Generate nature"""
         raid_fixed_nature = self.raid_enemy_info.boss_poke_para.seikaku
         match raid_fixed_nature:
@@ -285,14 +486,14 @@ class TeraRaid:
             case _:
                 return Nature.from_generation(raid_fixed_nature)
 
-    def rand_size(self, rng: Xoroshiro128Plus) -> int:
+    def rand_size(self, rng: Xoroshiro128PlusScalar) -> int:
         """Generate size scalar"""
         # TODO: deal with forced size ranges
         return rng.rand(0x81) + rng.rand(0x80)
 
     def initialize_data(
         self,
-        raid_enemy_table_arrays: tuple[RaidEnemyTableArray],
+        encounter_index: EncounterIndex,
         story_progress: StoryProgress,
         game: Game,
         delivery_group_id: int
@@ -303,19 +504,23 @@ class TeraRaid:
         self.is_event = self.content >= 2
 
         # rng object used for difficulty and slot
-        rng_slot = Xoroshiro128Plus(self.seed)
+        rng_slot = self.rng_type(self.seed)
 
         self.difficulty = self.rand_difficulty(story_progress, rng_slot)
 
-        possible_encounter_slots, encounter_slot_total = \
-            self.build_encounter_table(raid_enemy_table_arrays, story_progress, game)
+        encounter_table = encounter_index.get(
+            self.difficulty,
+            story_progress,
+            game,
+            self.delivery_group_id
+        )
 
-        self.generate_from_slots(rng_slot, possible_encounter_slots, encounter_slot_total)
+        self.generate_from_slots(rng_slot, encounter_table)
 
     def rand_difficulty(
         self,
         story_progress: StoryProgress,
-        rng_slot: Xoroshiro128Plus
+        rng_slot: Xoroshiro128PlusScalar
     ) -> StarLevel:
         """Set difficulty based on raid and progress"""
         if self.content == 1:
@@ -329,64 +534,17 @@ class TeraRaid:
 
     def generate_from_slots(
         self,
-        rng_slot: Xoroshiro128Plus,
-        possible_encounter_slots: list[RaidEnemyTable],
-        encounter_slot_total: int
+        rng_slot: Xoroshiro128PlusScalar,
+        encounter_table: EncounterTable
     ):
         """Generate pokemon based on possible slots"""
-        encounter_slot_rand = rng_slot.rand(encounter_slot_total)
-        for table in possible_encounter_slots:
-            if encounter_slot_rand < table.raid_enemy_info.rate:
-                self.generate_pokemon(table.raid_enemy_info)
-                break
-            encounter_slot_rand -= table.raid_enemy_info.rate
-
-    def build_encounter_table(
-        self,
-        raid_enemy_table_arrays: list[RaidEnemyTableArray],
-        story_progress: StoryProgress,
-        game: Game
-    ) -> tuple[list[RaidEnemyTable], int]:
-        """Build possible encounter table array"""
-        raid_enemy_table_array = raid_enemy_table_arrays[self.difficulty]
-
-        possible_encounter_tables = []
-        encounter_slot_total = 0
-
-        for table in raid_enemy_table_array.raid_enemy_tables:
-            if self.valid_table(story_progress, game, table):
-                possible_encounter_tables.append(table)
-                encounter_slot_total += table.raid_enemy_info.rate
-
-        return possible_encounter_tables, encounter_slot_total
-
-    def valid_table_event(
-        self,
-        story_progress: StoryProgress,
-        game: Game,
-        table: RaidEnemyTable
-    ) -> bool:
-        """Check if a RaidEnemyTable is possible to be selected for events"""
-        return (
-            table.raid_enemy_info.delivery_group_id == self.delivery_group_id and
-            (
-                table.raid_enemy_info.difficulty is None
-                or table.raid_enemy_info.difficulty.is_unlocked(story_progress)
-            ) and
-            table.raid_enemy_info.rom_ver in (None, game, Game.BOTH)
+        encounter_slot_rand = rng_slot.rand(encounter_table.total)
+        self.generate_pokemon(
+            encounter_table.slots[
+                bisect_right(encounter_table.cumulative_rates, encounter_slot_rand)
+            ]
         )
 
-    def valid_table(
-        self,
-        story_progress: StoryProgress,
-        game: Game,
-        table: RaidEnemyTable
-    ) -> bool:
-        """Check if a RaidEnemyTable is possible to be selected"""
-        if self.is_event:
-            return self.valid_table_event(story_progress, game, table)
-        return table.raid_enemy_info.rom_ver in (None, game, Game.BOTH)
-
     def __str__(self) -> str:
         if not self.is_enabled:
             return "Empty Den"
@@ -415,52 +573,30 @@ class RaidBlock:
 
     def initialize_data(
         self,
-        raid_enemy_table_arrays: tuple[RaidEnemyTableArray],
+        encounter_index: EncounterIndex,
         story_progress: StoryProgress,
         game: Game,
         delivery_raid_priority: tuple[int]
     ) -> None:
         """Initialize each raid with derived information"""
-        for i, raid in enumerate(self.raids):
-            # check the event delivery group
-            den_delivery_group_id = None
-            for delivery_group_id, delivery_group_size in enumerate(delivery_raid_priority):
-                if i < delivery_group_size:
-                    if not self.validate_event_slots(raid_enemy_table_arrays, story_progress, game, delivery_group_id):
-                        continue
-                    den_delivery_group_id = delivery_group_id
-                    break
-                i -= delivery_group_size
+        delivery_group_ids = encounter_index.get_delivery_group_ids(
+            delivery_raid_priority,
+            story_progress,
+            game,
+            len(self.raids)
+        )
+        for raid, delivery_group_id in zip(self.raids, delivery_group_ids):
             raid.initialize_data(
-                raid_enemy_table_arrays,
+                encounter_index,
                 story_progress,
                 game,
-                den_delivery_group_id
+                delivery_group_id
             )
 
-    def validate_event_slots(
-        self,
-        raid_enemy_table_arrays: tuple[RaidEnemyTableArray],
-        story_progress: StoryProgress,
-        game: Game,
-        delivery_group_id: int
-    ):
-        """Check if a delivery group id has spawnable pokemon"""
-        dummy_raid = TeraRaid(
-            is_enabled = 1,
-            area_id = 0,
-            display_type = 0,
-            den_id = 0,
-            seed = 0,
-            _unused_14 = 0,
-            content = 0,
-            collected_league_points = 0,
-        )
-        dummy_raid.delivery_group_id = delivery_group_id
-        dummy_raid.is_event = True
-        dummy_raid.difficulty = StarLevel.EVENT
-        total = dummy_raid.build_encounter_table(raid_enemy_table_arrays, story_progress, game)[1]
-        return total != 0
+def generate_if_matches(raid: TeraRaid, compiled_filter: "CompiledRaidFilter") -> bool:
+    """Compare an initialized raid to a filter compiled once with RaidFilter.compile,
+       generating the main rng chain only until the first field that fails"""
+    return compiled_filter.compare(raid)
 
 def process_raid_block(raid_block: bytes) -> RaidBlock:
     """Process raid block with bytechomp"""
@@ -468,3 +604,54 @@ def process_raid_block(raid_block: bytes) -> RaidBlock:
     reader.feed(raid_block)
     assert reader.is_complete(), "Invalid data size"
     return reader.build()
+
+class RaidBlockView:
+    """Columnar view of raid block data decoded without copying,
+       TeraRaid objects are only built when asked for"""
+    def __init__(self, raid_block: bytes) -> None:
+        assert len(raid_block) >= RAID_BLOCK_DTYPE.itemsize, "Invalid data size"
+        data = np.frombuffer(raid_block, dtype = RAID_BLOCK_DTYPE, count = 1)[0]
+        self.current_seed: int = int(data["current_seed"])
+        self.tomorrow_seed: int = int(data["tomorrow_seed"])
+        self.raids: np.ndarray = data["raids"]
+
+    def __len__(self) -> int:
+        return len(self.raids)
+
+    @property
+    def is_enabled(self) -> np.ndarray:
+        """is_enabled of each raid"""
+        return self.raids["is_enabled"]
+
+    @property
+    def area_ids(self) -> np.ndarray:
+        """Area id of each raid"""
+        return self.raids["area_id"]
+
+    @property
+    def den_ids(self) -> np.ndarray:
+        """Den id of each raid"""
+        return self.raids["den_id"]
+
+    @property
+    def seeds(self) -> np.ndarray:
+        """Seed of each raid"""
+        return self.raids["seed"]
+
+    @property
+    def content(self) -> np.ndarray:
+        """Content type of each raid"""
+        return self.raids["content"]
+
+    def build_raid(self, index: int) -> TeraRaid:
+        """Build the TeraRaid at index"""
+        # field order of TERA_RAID_DTYPE matches TeraRaid
+        return TeraRaid(*self.raids[index].tolist())
+
+    def to_raid_block(self) -> RaidBlock:
+        """Build a full RaidBlock"""
+        return RaidBlock(
+            current_seed = self.current_seed,
+            tomorrow_seed = self.tomorrow_seed,
+            raids = [TeraRaid(*raid) for raid in self.raids.tolist()],
+        )
@@ -0,0 +1,67 @@
+"""Columnar export of RaidEnemyTableArray"""
+
+from typing import TYPE_CHECKING
+import numpy as np
+from .flatbuffer_object import FlatBufferObject
+from .sv_enums import StarLevel
+
+if TYPE_CHECKING:
+    from .raid_enemy_table_array import RaidEnemyInfo
+
+# absent fields hold their flatbuffer default, 0 or StarLevel.EVENT (-1) for difficulty
+RAID_ENEMY_DTYPE = np.dtype([
+    ("species", "<u2"),
+    ("form", "<i2"),
+    ("rate", "i1"),
+    ("rom_ver", "<i2"),
+    ("delivery_group_id", "i1"),
+    ("difficulty", "i1"),
+    ("gem_type", "u1"),
+    ("seikaku", "u1"),
+    ("tokusei", "u1"),
+    ("talent_type", "u1"),
+    ("talent_vnum", "u1"),
+    ("sex", "u1"),
+    ("rare_type", "u1"),
+    # only meaningful for IVGeneration.SET_IVS
+    ("ivs", "u1", (6,)),
+])
+
+class RaidEnemyColumns(FlatBufferObject):
+    """Base of RaidEnemyTableArray exporting its slots as a structured array"""
+    __slots__ = ()
+
+    def to_columns(self) -> np.ndarray:
+        """Structured array of RAID_ENEMY_DTYPE with one row per slot,
+           save with np.save and reload with np.load to skip parsing"""
+        # pylint: disable=no-member
+        return np.array(
+            [
+                self.slot_row(table.raid_enemy_info)
+                for table in self.raid_enemy_tables
+            ],
+            dtype = RAID_ENEMY_DTYPE
+        )
+
+    @staticmethod
+    def slot_row(raid_enemy_info: "RaidEnemyInfo") -> tuple:
+        """Row of RAID_ENEMY_DTYPE describing a RaidEnemyInfo"""
+        poke = raid_enemy_info.boss_poke_para
+        ivs = poke.talent_value
+        return (
+            poke.dev_id or 0,
+            poke.form_id or 0,
+            raid_enemy_info.rate or 0,
+            raid_enemy_info.rom_ver or 0,
+            raid_enemy_info.delivery_group_id or 0,
+            StarLevel.EVENT if raid_enemy_info.difficulty is None else raid_enemy_info.difficulty,
+            poke.gem_type or 0,
+            poke.seikaku or 0,
+            poke.tokusei or 0,
+            poke.talent_type or 0,
+            poke.talent_vnum or 0,
+            poke.sex or 0,
+            poke.rare_type or 0,
+            (0, 0, 0, 0, 0, 0) if ivs is None else
+            (ivs.hp or 0, ivs.atk or 0, ivs.def_ or 0, ivs.spa or 0, ivs.spd or 0, ivs.spe or 0),
+        )
@@ -1,22 +1,25 @@
 """Array of RaidEnemyInfoTable"""
+# generated from RAID_ENEMY_TABLE_ARRAY in flatbuffer_schema.py, do not edit
+
+from __future__ import annotations
 
 from .sv_enums import (
-    StarLevel,
     Game,
-    Move,
+    StarLevel,
     Species,
     GenderGeneration,
-    NatureGeneration,
     Item,
+    Ball,
+    MovesetType,
     TeraTypeGeneration,
+    NatureGeneration,
     AbilityGeneration,
-    Ball,
     IVGeneration,
     ShinyGeneration,
     SizeGeneration,
-    MovesetType,
+    Move,
+    ExtraTimingType,
     ExtraActType,
-    ExtraTimingType
 )
 from .flatbuffer_object import (
     U8,
@@ -27,136 +30,559 @@ from .flatbuffer_object import (
     I32,
     FlatBufferObject,
 )
+from .raid_enemy_columns import RaidEnemyColumns
 
-class RaidEnemyTableArray(FlatBufferObject):
+class RaidEnemyTableArray(RaidEnemyColumns):
     """Array of RaidEnemyInfoTable (root object)"""
-    def __init__(self, buf: bytearray):
-        FlatBufferObject.__init__(self, buf)
-        self.raid_enemy_tables: list[RaidEnemyTable] = self.read_init_object_array(RaidEnemyTable)
+    __slots__ = ("raid_enemy_tables",)
+    raid_enemy_tables: list[RaidEnemyTable]
+
+    def _decode_raid_enemy_tables(self) -> list[RaidEnemyTable]:
+        return self.read_object_array(0, RaidEnemyTable)
 
 class RaidEnemyTable(FlatBufferObject):
     """Table containing only RaidEnemyInfo"""
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.raid_enemy_info: RaidEnemyInfo = self.read_init_object(RaidEnemyInfo)
+    __slots__ = ("raid_enemy_info",)
+    raid_enemy_info: RaidEnemyInfo
+
+    def _decode_raid_enemy_info(self) -> RaidEnemyInfo:
+        return self.read_object(0, RaidEnemyInfo)
 
 class RaidEnemyInfo(FlatBufferObject):
     """Spawn info of raid pokemon"""
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.rom_ver: Game = self.read_init_int_enum(I16, Game)
-        self.no: int = self.read_init_int(I32)
-        self.delivery_group_id: int = self.read_init_int(I8)
-        self.difficulty: StarLevel = self.read_init_int_enum(I32, StarLevel.from_game)
-        self.rate: int = self.read_init_int(I8)
-        self.drop_table_fix: int = self.read_init_int(U64)
-        self.drop_table_random: int = self.read_init_int(U64)
-        self.capture_rate: int = self.read_init_int(I8)
-        self.capture_lv: int = self.read_init_int(I8)
-        self.boss_poke_para: PokeDataBattle = self.read_init_object(PokeDataBattle)
-        self.boss_poke_size: RaidBossSizeData = self.read_init_object(RaidBossSizeData)
-        self.boss_desc: RaidBossData = self.read_init_object(RaidBossData)
-        self.raid_time_data: RaidTimeData = self.read_init_object(RaidTimeData)
+    __slots__ = (
+        "rom_ver",
+        "no",
+        "delivery_group_id",
+        "difficulty",
+        "rate",
+        "drop_table_fix",
+        "drop_table_random",
+        "capture_rate",
+        "capture_lv",
+        "boss_poke_para",
+        "boss_poke_size",
+        "boss_desc",
+        "raid_time_data",
+    )
+    rom_ver: Game
+    no: int
+    delivery_group_id: int
+    difficulty: StarLevel
+    rate: int
+    drop_table_fix: int
+    drop_table_random: int
+    capture_rate: int
+    capture_lv: int
+    boss_poke_para: PokeDataBattle
+    boss_poke_size: RaidBossSizeData
+    boss_desc: RaidBossData
+    raid_time_data: RaidTimeData
+
+    def _decode_rom_ver(self) -> Game:
+        if field_offset := self.field_offset(0):
+            return Game(I16.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_no(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_delivery_group_id(self) -> int:
+        if field_offset := self.field_offset(2):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_difficulty(self) -> StarLevel:
+        if field_offset := self.field_offset(3):
+            return StarLevel.from_game(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_rate(self) -> int:
+        if field_offset := self.field_offset(4):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_drop_table_fix(self) -> int:
+        if field_offset := self.field_offset(5):
+            return U64.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_drop_table_random(self) -> int:
+        if field_offset := self.field_offset(6):
+            return U64.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_capture_rate(self) -> int:
+        if field_offset := self.field_offset(7):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_capture_lv(self) -> int:
+        if field_offset := self.field_offset(8):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_boss_poke_para(self) -> PokeDataBattle:
+        return self.read_object(9, PokeDataBattle)
+
+    def _decode_boss_poke_size(self) -> RaidBossSizeData:
+        return self.read_object(10, RaidBossSizeData)
+
+    def _decode_boss_desc(self) -> RaidBossData:
+        return self.read_object(11, RaidBossData)
+
+    def _decode_raid_time_data(self) -> RaidTimeData:
+        return self.read_object(12, RaidTimeData)
 
 class PokeDataBattle(FlatBufferObject):
     """Data that describes attributes of the pokemon itself"""
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.dev_id: Species = self.read_init_int_enum(U16, Species)
-        self.form_id: int = self.read_init_int(I16)
-        self.sex: GenderGeneration = self.read_init_int_enum(I32, GenderGeneration)
-        self.item: Item = self.read_init_int_enum(I32, Item)
-        self.level: int = self.read_init_int(I32)
-        self.ball_id: Ball = self.read_init_int_enum(I32, Ball)
-        self.waza_type: MovesetType = self.read_init_int_enum(I32, MovesetType)
-        self.waza_1: WazaSet = self.read_init_object(WazaSet)
-        self.waza_2: WazaSet = self.read_init_object(WazaSet)
-        self.waza_3: WazaSet = self.read_init_object(WazaSet)
-        self.waza_4: WazaSet = self.read_init_object(WazaSet)
-        self.gem_type: TeraTypeGeneration = self.read_init_int_enum(I32, TeraTypeGeneration)
-        self.seikaku: NatureGeneration = self.read_init_int_enum(I32, NatureGeneration)
-        self.tokusei: AbilityGeneration = self.read_init_int_enum(I32, AbilityGeneration)
-        self.talent_type: IVGeneration = self.read_init_int_enum(I32, IVGeneration)
-        self.talent_value: ParamSet = self.read_init_object(ParamSet)
-        self.talent_vnum: int = self.read_init_int(I8)
-        self.effort_value: ParamSet = self.read_init_object(ParamSet)
-        self.rare_type: ShinyGeneration = self.read_init_int_enum(I32, ShinyGeneration)
-        self.scale_type: SizeGeneration = self.read_init_int_enum(I32, SizeGeneration)
-        self.scale_value: int = self.read_init_int(I16)
+    __slots__ = (
+        "dev_id",
+        "form_id",
+        "sex",
+        "item",
+        "level",
+        "ball_id",
+        "waza_type",
+        "waza_1",
+        "waza_2",
+        "waza_3",
+        "waza_4",
+        "gem_type",
+        "seikaku",
+        "tokusei",
+        "talent_type",
+        "talent_value",
+        "talent_vnum",
+        "effort_value",
+        "rare_type",
+        "scale_type",
+        "scale_value",
+    )
+    dev_id: Species
+    form_id: int
+    sex: GenderGeneration
+    item: Item
+    level: int
+    ball_id: Ball
+    waza_type: MovesetType
+    waza_1: WazaSet
+    waza_2: WazaSet
+    waza_3: WazaSet
+    waza_4: WazaSet
+    gem_type: TeraTypeGeneration
+    seikaku: NatureGeneration
+    tokusei: AbilityGeneration
+    talent_type: IVGeneration
+    talent_value: ParamSet
+    talent_vnum: int
+    effort_value: ParamSet
+    rare_type: ShinyGeneration
+    scale_type: SizeGeneration
+    scale_value: int
+
+    def _decode_dev_id(self) -> Species:
+        if field_offset := self.field_offset(0):
+            return Species(U16.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_form_id(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_sex(self) -> GenderGeneration:
+        if field_offset := self.field_offset(2):
+            return GenderGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_item(self) -> Item:
+        if field_offset := self.field_offset(3):
+            return Item(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_level(self) -> int:
+        if field_offset := self.field_offset(4):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_ball_id(self) -> Ball:
+        if field_offset := self.field_offset(5):
+            return Ball(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_waza_type(self) -> MovesetType:
+        if field_offset := self.field_offset(6):
+            return MovesetType(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_waza_1(self) -> WazaSet:
+        return self.read_object(7, WazaSet)
+
+    def _decode_waza_2(self) -> WazaSet:
+        return self.read_object(8, WazaSet)
+
+    def _decode_waza_3(self) -> WazaSet:
+        return self.read_object(9, WazaSet)
+
+    def _decode_waza_4(self) -> WazaSet:
+        return self.read_object(10, WazaSet)
+
+    def _decode_gem_type(self) -> TeraTypeGeneration:
+        if field_offset := self.field_offset(11):
+            return TeraTypeGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_seikaku(self) -> NatureGeneration:
+        if field_offset := self.field_offset(12):
+            return NatureGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_tokusei(self) -> AbilityGeneration:
+        if field_offset := self.field_offset(13):
+            return AbilityGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_talent_type(self) -> IVGeneration:
+        if field_offset := self.field_offset(14):
+            return IVGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_talent_value(self) -> ParamSet:
+        return self.read_object(15, ParamSet)
+
+    def _decode_talent_vnum(self) -> int:
+        if field_offset := self.field_offset(16):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_effort_value(self) -> ParamSet:
+        return self.read_object(17, ParamSet)
+
+    def _decode_rare_type(self) -> ShinyGeneration:
+        if field_offset := self.field_offset(18):
+            return ShinyGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_scale_type(self) -> SizeGeneration:
+        if field_offset := self.field_offset(19):
+            return SizeGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_scale_value(self) -> int:
+        if field_offset := self.field_offset(20):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
 
 class WazaSet(FlatBufferObject):
     """Data that describes a learnt move"""
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.waza_id: Move = self.read_init_int_enum(U16, Move)
-        self.point_up: int = self.read_init_int(I8)
+    __slots__ = ("waza_id", "point_up")
+    waza_id: Move
+    point_up: int
+
+    def _decode_waza_id(self) -> Move:
+        if field_offset := self.field_offset(0):
+            return Move(U16.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_point_up(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
 
 class ParamSet(FlatBufferObject):
     """Data that describes pokemon stats (IVs or EVs)"""
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.hp: int = self.read_init_int(I32)
-        self.atk: int = self.read_init_int(I32)
-        self.def_: int = self.read_init_int(I32)
-        self.spa: int = self.read_init_int(I32)
-        self.spd: int = self.read_init_int(I32)
-        self.spe: int = self.read_init_int(I32)
+    __slots__ = ("hp", "atk", "def_", "spa", "spd", "spe")
+    hp: int
+    atk: int
+    def_: int
+    spa: int
+    spd: int
+    spe: int
+
+    def _decode_hp(self) -> int:
+        if field_offset := self.field_offset(0):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_atk(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_def_(self) -> int:
+        if field_offset := self.field_offset(2):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_spa(self) -> int:
+        if field_offset := self.field_offset(3):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_spd(self) -> int:
+        if field_offset := self.field_offset(4):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_spe(self) -> int:
+        if field_offset := self.field_offset(5):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
 
 class RaidBossSizeData(FlatBufferObject):
     """Data that describes the size of raid bosses"""
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.height_type: SizeGeneration = self.read_init_int_enum(I32, SizeGeneration)
-        self.heignt_value: int = self.read_init_int(I16)
-        self.weight_type: SizeGeneration = self.read_init_int_enum(I32, SizeGeneration)
-        self.waight_value: int = self.read_init_int(I16)
-        self.scale_type: SizeGeneration = self.read_init_int_enum(I32, SizeGeneration)
-        self.scale_value: int = self.read_init_int(I16)
+    __slots__ = (
+        "height_type",
+        "heignt_value",
+        "weight_type",
+        "waight_value",
+        "scale_type",
+        "scale_value",
+    )
+    height_type: SizeGeneration
+    heignt_value: int
+    weight_type: SizeGeneration
+    waight_value: int
+    scale_type: SizeGeneration
+    scale_value: int
+
+    def _decode_height_type(self) -> SizeGeneration:
+        if field_offset := self.field_offset(0):
+            return SizeGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_heignt_value(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_weight_type(self) -> SizeGeneration:
+        if field_offset := self.field_offset(2):
+            return SizeGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_waight_value(self) -> int:
+        if field_offset := self.field_offset(3):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_scale_type(self) -> SizeGeneration:
+        if field_offset := self.field_offset(4):
+            return SizeGeneration(I32.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_scale_value(self) -> int:
+        if field_offset := self.field_offset(5):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
 
 class RaidBossData(FlatBufferObject):
     """Data that describes raid boss behavior"""
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.hp_coef: int = self.read_init_int(I16)
-        self.power_charge_triger_hp: int = self.read_init_int(I8)
-        self.power_charge_triger_time: int = self.read_init_int(I8)
-        self.power_charge_limit_time: int = self.read_init_int(I16)
-        self.power_charge_cancel_damage: int = self.read_init_int(I8)
-        self.power_charge_penalty_time: int = self.read_init_int(I16)
-        self.power_charge_penalty_action: int = self.read_init_int(U16)
-        self.power_charge_damage_rate: int = self.read_init_int(I8)
-        self.power_charge_gem_damage_rate: int = self.read_init_int(I8)
-        self.power_charge_change_gem_damage_rate: int = self.read_init_int(I8)
-        self.extra_action_1: RaidBossExtraData = self.read_init_object(RaidBossExtraData)
-        self.extra_action_2: RaidBossExtraData = self.read_init_object(RaidBossExtraData)
-        self.extra_action_3: RaidBossExtraData = self.read_init_object(RaidBossExtraData)
-        self.extra_action_4: RaidBossExtraData = self.read_init_object(RaidBossExtraData)
-        self.extra_action_5: RaidBossExtraData = self.read_init_object(RaidBossExtraData)
-        self.extra_action_6: RaidBossExtraData = self.read_init_object(RaidBossExtraData)
-        self.double_action_triger_hp: int = self.read_init_int(I8)
-        self.double_action_triger_time: int = self.read_init_int(I8)
-        self.double_action_rate: int = self.read_init_int(I8)
+    __slots__ = (
+        "hp_coef",
+        "power_charge_triger_hp",
+        "power_charge_triger_time",
+        "power_charge_limit_time",
+        "power_charge_cancel_damage",
+        "power_charge_penalty_time",
+        "power_charge_penalty_action",
+        "power_charge_damage_rate",
+        "power_charge_gem_damage_rate",
+        "power_charge_change_gem_damage_rate",
+        "extra_action_1",
+        "extra_action_2",
+        "extra_action_3",
+        "extra_action_4",
+        "extra_action_5",
+        "extra_action_6",
+        "double_action_triger_hp",
+        "double_action_triger_time",
+        "double_action_rate",
+    )
+    hp_coef: int
+    power_charge_triger_hp: int
+    power_charge_triger_time: int
+    power_charge_limit_time: int
+    power_charge_cancel_damage: int
+    power_charge_penalty_time: int
+    power_charge_penalty_action: int
+    power_charge_damage_rate: int
+    power_charge_gem_damage_rate: int
+    power_charge_change_gem_damage_rate: int
+    extra_action_1: RaidBossExtraData
+    extra_action_2: RaidBossExtraData
+    extra_action_3: RaidBossExtraData
+    extra_action_4: RaidBossExtraData
+    extra_action_5: RaidBossExtraData
+    extra_action_6: RaidBossExtraData
+    double_action_triger_hp: int
+    double_action_triger_time: int
+    double_action_rate: int
+
+    def _decode_hp_coef(self) -> int:
+        if field_offset := self.field_offset(0):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_triger_hp(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_triger_time(self) -> int:
+        if field_offset := self.field_offset(2):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_limit_time(self) -> int:
+        if field_offset := self.field_offset(3):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_cancel_damage(self) -> int:
+        if field_offset := self.field_offset(4):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_penalty_time(self) -> int:
+        if field_offset := self.field_offset(5):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_penalty_action(self) -> int:
+        if field_offset := self.field_offset(6):
+            return U16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_damage_rate(self) -> int:
+        if field_offset := self.field_offset(7):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_gem_damage_rate(self) -> int:
+        if field_offset := self.field_offset(8):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_power_charge_change_gem_damage_rate(self) -> int:
+        if field_offset := self.field_offset(9):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_extra_action_1(self) -> RaidBossExtraData:
+        return self.read_object(10, RaidBossExtraData)
+
+    def _decode_extra_action_2(self) -> RaidBossExtraData:
+        return self.read_object(11, RaidBossExtraData)
+
+    def _decode_extra_action_3(self) -> RaidBossExtraData:
+        return self.read_object(12, RaidBossExtraData)
+
+    def _decode_extra_action_4(self) -> RaidBossExtraData:
+        return self.read_object(13, RaidBossExtraData)
+
+    def _decode_extra_action_5(self) -> RaidBossExtraData:
+        return self.read_object(14, RaidBossExtraData)
+
+    def _decode_extra_action_6(self) -> RaidBossExtraData:
+        return self.read_object(15, RaidBossExtraData)
+
+    def _decode_double_action_triger_hp(self) -> int:
+        if field_offset := self.field_offset(16):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_double_action_triger_time(self) -> int:
+        if field_offset := self.field_offset(17):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_double_action_rate(self) -> int:
+        if field_offset := self.field_offset(18):
+            return I8.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
 
 class RaidBossExtraData(FlatBufferObject):
     """Data describing special actions a raid boss can do during a raid"""
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.timming: ExtraTimingType = self.read_init_int_enum(I16, ExtraTimingType)
-        self.action: ExtraActType = self.read_init_int_enum(I16, ExtraActType)
-        self.value: int = self.read_init_int(I16)
-        self.waza_no: Move = self.read_init_int_enum(U16, Move)
+    __slots__ = ("timming", "action", "value", "waza_no")
+    timming: ExtraTimingType
+    action: ExtraActType
+    value: int
+    waza_no: Move
+
+    def _decode_timming(self) -> ExtraTimingType:
+        if field_offset := self.field_offset(0):
+            return ExtraTimingType(I16.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_action(self) -> ExtraActType:
+        if field_offset := self.field_offset(1):
+            return ExtraActType(I16.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_value(self) -> int:
+        if field_offset := self.field_offset(2):
+            return I16.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_waza_no(self) -> Move:
+        if field_offset := self.field_offset(3):
+            return Move(U16.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
 
 class RaidTimeData(FlatBufferObject):
     """Data that describes the timer during raid battle"""
-    def __init__(self, buf: bytearray, offset: int):
-        FlatBufferObject.__init__(self, buf, offset)
-        self.is_active: bool = self.read_init_int_enum(U8, bool)
-        self.game_limit: int = self.read_init_int(I32)
-        self.client_limit: int = self.read_init_int(I32)
-        self.command_limit: int = self.read_init_int(I32)
-        self.poke_revive_time: int = self.read_init_int(I32)
-        self.ai_interval_time: int = self.read_init_int(I32)
-        self.ai_interval_rand: int = self.read_init_int(I32)
+    __slots__ = (
+        "is_active",
+        "game_limit",
+        "client_limit",
+        "command_limit",
+        "poke_revive_time",
+        "ai_interval_time",
+        "ai_interval_rand",
+    )
+    is_active: bool
+    game_limit: int
+    client_limit: int
+    command_limit: int
+    poke_revive_time: int
+    ai_interval_time: int
+    ai_interval_rand: int
+
+    def _decode_is_active(self) -> bool:
+        if field_offset := self.field_offset(0):
+            return bool(U8.unpack_from(self._buf, self._offset + field_offset)[0])
+        return None
+
+    def _decode_game_limit(self) -> int:
+        if field_offset := self.field_offset(1):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_client_limit(self) -> int:
+        if field_offset := self.field_offset(2):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_command_limit(self) -> int:
+        if field_offset := self.field_offset(3):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_poke_revive_time(self) -> int:
+        if field_offset := self.field_offset(4):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_ai_interval_time(self) -> int:
+        if field_offset := self.field_offset(5):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
+
+    def _decode_ai_interval_rand(self) -> int:
+        if field_offset := self.field_offset(6):
+            return I32.unpack_from(self._buf, self._offset + field_offset)[0]
+        return None
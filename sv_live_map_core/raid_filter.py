@@ -1,5 +1,7 @@
 """Filter for TeraRaids"""
 
+from typing import Self
+import numpy as np
 from .raid_block import TeraRaid
 from .sv_enums import AbilityIndex, Gender, Nature, Species, StarLevel
 
@@ -74,3 +76,100 @@ class RaidFilter:
             return False
 
         return bool(not self.shiny_filter or raid.is_shiny)
+
+    def compile(self) -> "CompiledRaidFilter":
+        """Compile filters into bitsets and lookup arrays"""
+        return CompiledRaidFilter(self)
+
+def _bitset(values: list, offset: int = 0) -> int:
+    """Integer bitset with the bit of each value + offset set"""
+    bits = 0
+    for value in values:
+        bits |= 1 << (value + offset)
+    return bits
+
+def _lookup(bits: int, size: int) -> np.ndarray:
+    """Boolean lookup array of the first size bits of a bitset"""
+    return np.array([(bits >> value) & 1 for value in range(size)], dtype = np.bool_)
+
+class CompiledRaidFilter:
+    """RaidFilter compiled into integer bitsets for single raids and boolean lookup arrays
+       for columnar batches, checks are ordered cheapest and most selective first"""
+    # pylint: disable=too-many-instance-attributes
+    SPECIES_COUNT = max(Species) + 1
+    # difficulties are offset by 1 so that StarLevel.EVENT (-1) has its own bit and index,
+    # event raids keep it when their slot does not force a difficulty
+    DIFFICULTY_OFFSET = -min(StarLevel)
+    DIFFICULTY_COUNT = max(StarLevel) + DIFFICULTY_OFFSET + 1
+    ABILITY_COUNT = max(AbilityIndex) + 1
+    GENDER_COUNT = max(Gender) + 1
+    NATURE_COUNT = max(Nature) + 1
+
+    def __init__(self, raid_filter: RaidFilter) -> None:
+        self.species_bits = _bitset(raid_filter.species_filter)
+        self.difficulty_bits = _bitset(raid_filter.star_filter, self.DIFFICULTY_OFFSET)
+        self.ability_bits = _bitset(raid_filter.ability_filter)
+        self.gender_bits = _bitset(raid_filter.gender_filter)
+        self.nature_bits = _bitset(raid_filter.nature_filter)
+        self.shiny_filter = raid_filter.shiny_filter
+        # iv filters are contiguous ranges, empty ranges never match
+        self.iv_bounds = tuple(
+            (iv_filter[0], iv_filter[-1]) if len(iv_filter) else (0, -1)
+            for iv_filter in raid_filter.iv_filters
+        )
+        self.iv_min = np.array([minimum for minimum, _ in self.iv_bounds], dtype = np.int64)
+        self.iv_max = np.array([maximum for _, maximum in self.iv_bounds], dtype = np.int64)
+        self.species_lookup = _lookup(self.species_bits, self.SPECIES_COUNT)
+        self.difficulty_lookup = _lookup(self.difficulty_bits, self.DIFFICULTY_COUNT)
+        self.ability_lookup = _lookup(self.ability_bits, self.ABILITY_COUNT)
+        self.gender_lookup = _lookup(self.gender_bits, self.GENDER_COUNT)
+        self.nature_lookup = _lookup(self.nature_bits, self.NATURE_COUNT)
+
+    def compile(self) -> Self:
+        """Already compiled"""
+        return self
+
+    def compare(self, raid: TeraRaid) -> bool:
+        """Compare raid to filters, only generating fields up to the first failing check"""
+        # pylint: disable=too-many-return-statements
+        # species + difficulty are known from the slot without the main rng
+        if not (self.species_bits >> raid.species) & 1:
+            return False
+        if raid.difficulty is None or not self.difficulty_matches(raid.difficulty):
+            return False
+
+        if self.shiny_filter and not raid.is_shiny:
+            return False
+
+        for (minimum, maximum), iv_val in zip(self.iv_bounds, raid.ivs):
+            if not minimum <= iv_val <= maximum:
+                return False
+
+        if not (self.ability_bits >> raid.ability_index) & 1:
+            return False
+
+        if not (self.gender_bits >> raid.gender) & 1:
+            return False
+
+        return bool((self.nature_bits >> raid.nature) & 1)
+
+    def difficulty_matches(self, difficulty: StarLevel) -> bool:
+        """Whether difficulty passes the star filter"""
+        return bool((self.difficulty_bits >> (difficulty + self.DIFFICULTY_OFFSET)) & 1)
+
+    def ivs_mask(self, ivs: np.ndarray) -> np.ndarray:
+        """Boolean mask of which rows of an (n, 6) iv array match the iv filters"""
+        return np.all((ivs >= self.iv_min) & (ivs <= self.iv_max), axis = 1)
+
+    def mask(self, columns: np.ndarray | dict[str, np.ndarray]) -> np.ndarray:
+        """Boolean mask of which raids in a columnar batch match the filters,
+           columns are species, difficulty, is_shiny, ivs, ability_index, gender and nature"""
+        lanes = self.species_lookup[columns["species"]]
+        lanes &= self.difficulty_lookup[columns["difficulty"] + self.DIFFICULTY_OFFSET]
+        if self.shiny_filter:
+            lanes &= columns["is_shiny"].astype(np.bool_)
+        lanes &= self.ivs_mask(columns["ivs"])
+        lanes &= self.ability_lookup[columns["ability_index"]]
+        lanes &= self.gender_lookup[columns["gender"]]
+        lanes &= self.nature_lookup[columns["nature"]]
+        return lanes
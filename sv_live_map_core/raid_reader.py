@@ -1,9 +1,9 @@
 """Subclass of NXReader with functions specifically for raids"""
 
-import contextlib
-import socket
 import io
+import binascii
 import struct
+import time
 from typing import Type
 import bytechomp
 from PIL import Image
@@ -11,46 +11,83 @@ from sv_live_map_core.nxreader import NXReader
 from sv_live_map_core.sv_enums import StarLevel, StoryProgress, Game
 from sv_live_map_core.raid_enemy_table_array import RaidEnemyTableArray
 from sv_live_map_core.delivery_raid_priority_array import DeliveryRaidPriorityArray
-from sv_live_map_core.raid_block import RaidBlock, process_raid_block
-from sv_live_map_core.rng import SCXorshift32
+from sv_live_map_core.raid_block import RaidBlock, RaidBlockView
+from sv_live_map_core.encounter_index import EncounterIndex
+from sv_live_map_core.rng import KeystreamCache
+from sv_live_map_core.memory_snapshot import MemorySnapshot
+from sv_live_map_core.raid_table_cache import RaidTableCache, FINGERPRINT_SIZE, fingerprint
 
 class RaidReader(NXReader):
     """Subclass of NXReader with functions specifically for raids"""
     RAID_BINARY_SIZES = (0x3128, 0x3058, 0x4400, 0x5A78, 0x6690, 0x4FB0)
+    # order of the raid binaries, EVENT last so that tables are indexable by StarLevel
+    RAID_BINARY_STAR_LEVELS = (
+        StarLevel.ONE_STAR,
+        StarLevel.TWO_STAR,
+        StarLevel.THREE_STAR,
+        StarLevel.FOUR_STAR,
+        StarLevel.FIVE_STAR,
+        StarLevel.SIX_STAR,
+        StarLevel.EVENT,
+    )
     RAID_PRIORITY_PTR = ("[[[[main+43A7798]+08]+2C0]+10]+88", 0x58)
     # https://github.com/Manu098vm/SVResearches/blob/master/RAM%20Pointers/RAM%20Pointers.txt
     RAID_BLOCK_PTR = ("[[main+43A77C8]+160]+40", 0xC98) # ty skylink!
+    # current_seed + tomorrow_seed
+    RAID_BLOCK_HEADER_SIZE = 0x10
     SAVE_BLOCK_PTR = "[[[main+4385F30]+80]+8]"
     DIFFICULTY_FLAG_LOCATIONS = (0x2BF20, 0x1F400, 0x1B640, 0x13EC0)
+    TRAINER_ICON_WIDTH_OFFSET = 0x1A3C0
+    TRAINER_ICON_HEIGHT_OFFSET = 0x1DA0
+    TRAINER_ICON_OFFSET = 0x273E0
 
     def __init__(
         self,
         ip_address: str = None,
         port: int = 6000,
         usb_connection: bool = False,
-        read_safety: bool = False,
         raid_enemy_table_arrays: tuple[RaidEnemyTableArray, 7] = None,
+        usb_chunk_size: int = 4080,
+        record_snapshot: bool = False,
+        table_cache: RaidTableCache = None,
     ):
-        super().__init__(ip_address, port, usb_connection)
-        self.read_safety = read_safety
+        # pylint: disable=too-many-arguments
+        # every read is recorded into this snapshot while set
+        self.recording: MemorySnapshot = MemorySnapshot() if record_snapshot else None
+        super().__init__(ip_address, port, usb_connection, usb_chunk_size)
+        # absolute addresses of resolved pointer chains, valid while main stays loaded at main_base
+        self.pointer_cache: dict[str, int] = {}
+        self.main_base: int = None
+        # save block keys are constant for the session
+        self.keystream_cache: KeystreamCache = KeystreamCache()
+        # read first so that a table cache of another game is never reused
+        self.game_version: Game = self.read_game_version()
+        # raw binaries the tables were parsed from, table_cache itself if all of it was reused
+        self.table_cache: RaidTableCache = None
         self.raid_enemy_table_arrays: tuple[RaidEnemyTableArray, 7] = \
-            raid_enemy_table_arrays or self.read_raid_enemy_table_arrays()
+            raid_enemy_table_arrays or self.read_raid_enemy_table_arrays(table_cache)
+        self.encounter_index: EncounterIndex = EncounterIndex(self.raid_enemy_table_arrays)
         # TODO: cache
         self.delivery_raid_priority: tuple[int] = self.read_delivery_raid_priority()
         self.story_progress: StoryProgress = self.read_story_progess()
-        self.game_version: Game = self.read_game_version()
 
     def read_delivery_raid_priority(self) -> tuple[int]:
         """Read the delivery priority flatbuffer from memory"""
-        delivery_raid_priority_array = DeliveryRaidPriorityArray(
-            self.read_pointer(*self.RAID_PRIORITY_PTR)
-        )
+        return self.parse_delivery_raid_priority(self.read_pointer(*self.RAID_PRIORITY_PTR))
+
+    @staticmethod
+    def parse_delivery_raid_priority(data: bytes) -> tuple[int]:
+        """Parse the group counts of the delivery priority flatbuffer"""
+        delivery_raid_priority_array = DeliveryRaidPriorityArray(data)
         if len(delivery_raid_priority_array.delivery_raid_prioritys) == 0:
             return (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
-        return delivery_raid_priority_array \
+        delivery_group_id = delivery_raid_priority_array \
             .delivery_raid_prioritys[0] \
-            .delivery_group_id \
-            .group_counts
+            .delivery_group_id
+        return (
+            0, # padding to ensure that id == index
+            *(getattr(delivery_group_id, f"group_id_{group_id:02}") for group_id in range(1, 11))
+        )
 
     @staticmethod
     def raid_binary_ptr(star_level: StarLevel) -> tuple[str, int]:
@@ -65,22 +102,23 @@ class RaidReader(NXReader):
 
     def read_story_progess(self) -> StoryProgress:
         """Read and decrypt story progress from save blocks"""
-        # each key remains constant and SCXorshift32(difficulty_{n}_key).next() can be precomputed
-        # for the sake of showing how to decrypt it this is not done
+        # each key remains constant so its keystream is only generated once by keystream_cache
+        return self.parse_story_progress(
+            self.read_save_blocks(
+                [(offset, 1) for offset in reversed(self.DIFFICULTY_FLAG_LOCATIONS)]
+            )
+        )
+
+    @staticmethod
+    def parse_story_progress(flags: list[bytearray]) -> StoryProgress:
+        """Story progress from the decrypted difficulty flags, highest difficulty first"""
         progress = StoryProgress.SIX_STAR_UNLOCKED
-        for offset in reversed(self.DIFFICULTY_FLAG_LOCATIONS):
-            if self.read_save_block_bool(offset):
+        for flag in flags:
+            if int.from_bytes(flag, 'little') == 2:
                 return progress
             progress -= 1
         return StoryProgress.DEFAULT
 
-    @staticmethod
-    def _decrypt_save_block(key: int, block: bytearray) -> bytearray:
-        rng = SCXorshift32(key)
-        for i, byte in enumerate(block):
-            block[i] = byte ^ rng.next()
-        return block
-
     def read_save_block_struct(self, offset: int, struct: Type):
         """Read decrypted save block of bytechomp struct at offset"""
         reader = bytechomp.Reader[struct](bytechomp.ByteOrder.LITTLE).allocate()
@@ -98,122 +136,276 @@ class RaidReader(NXReader):
 
     def read_save_block(self, offset: int, size: int) -> bytearray:
         """Read decrypted save block at offset"""
-        key = self.read_pointer_int(f"{self.SAVE_BLOCK_PTR}+{offset:X}", 4)
-        block = bytearray(self.read_pointer(f"[{self.SAVE_BLOCK_PTR}+{offset + 8:X}]", size))
-        return self._decrypt_save_block(key, block)
+        return self.read_save_blocks([(offset, size)])[0]
+
+    def read_save_blocks(self, blocks: list[tuple[int, int]]) -> list[bytearray]:
+        """Read decrypted save blocks of (offset, size) with all keys and data pipelined"""
+        return self.decrypt_save_blocks(
+            self.keystream_cache,
+            self.read_many(self.save_block_reads(blocks))
+        )
+
+    @classmethod
+    def save_block_reads(cls, blocks: list[tuple[int, int]]) -> list[tuple[str, str, int]]:
+        """Key and data reads of save blocks of (offset, size)"""
+        reads = []
+        for offset, size in blocks:
+            reads.append(("pointer", f"{cls.SAVE_BLOCK_PTR}+{offset:X}", 4))
+            reads.append(("pointer", f"[{cls.SAVE_BLOCK_PTR}+{offset + 8:X}]", size))
+        return reads
+
+    @staticmethod
+    def decrypt_save_blocks(
+        keystream_cache: KeystreamCache,
+        results: list[bytes]
+    ) -> list[bytearray]:
+        """Decrypt the results of save_block_reads"""
+        return [
+            keystream_cache.decrypt(int.from_bytes(key, 'little'), block)
+            for key, block in zip(results[::2], results[1::2])
+        ]
 
     def read_save_block_object(self, offset: int) -> bytearray:
         """Read decrypted save block object at offset"""
-        key = self.read_pointer_int(f"{self.SAVE_BLOCK_PTR}+{offset:X}", 4)
-        header = bytearray(self.read_pointer(f"[{self.SAVE_BLOCK_PTR}+{offset + 8:X}]", 5))
-        header = self._decrypt_save_block(key, header)
-        # discard type byte
-        size = int.from_bytes(header[1:], 'little')
-        full_object = bytearray(
-            self.read_pointer(
-                f"[{self.SAVE_BLOCK_PTR}+{offset + 8:X}]",
-                5 + size
-            )
-        )
+        key_data, header = self.read_many(self.save_block_object_header_reads(offset))
+        key = int.from_bytes(key_data, 'little')
+        size = self.parse_save_block_object_size(self.keystream_cache, key, header)
+        full_object = self.read_pointer(f"[{self.SAVE_BLOCK_PTR}+{offset + 8:X}]", 5 + size)
         # discard type and size bytes
-        return self._decrypt_save_block(key, full_object)[5:]
+        return self.keystream_cache.decrypt(key, full_object)[5:]
+
+    @classmethod
+    def save_block_object_header_reads(cls, offset: int) -> list[tuple[str, str, int]]:
+        """Key and type/size header reads of the save block object at offset"""
+        return [
+            ("pointer", f"{cls.SAVE_BLOCK_PTR}+{offset:X}", 4),
+            ("pointer", f"[{cls.SAVE_BLOCK_PTR}+{offset + 8:X}]", 5),
+        ]
+
+    @staticmethod
+    def parse_save_block_object_size(
+        keystream_cache: KeystreamCache,
+        key: int,
+        header: bytes
+    ) -> int:
+        """Size of a save block object from its encrypted header"""
+        # discard type byte
+        return int.from_bytes(keystream_cache.decrypt(key, header)[1:], 'little')
 
     def read_trainer_icon(self) -> Image:
         """Read trainer icon as PIL image"""
-        # thanks NPO! https://github.com/NPO-197
-        def build_dxt1_header(width, height):
-            """Build DXT1 header"""
-            return b'\x44\x44\x53\x20\x7C\x00\x00\x00\x07\x10\x08\x00' \
-                + struct.pack("<II", height, width) \
-                + b'\x00\x7E\x09\x00\x00\x00\x00\x00\x01\x00\x00\x00' \
-                b'\x49\x4D\x41\x47\x45\x4D\x41\x47\x49\x43\x4B\x00' \
-                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00' \
-                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00' \
-                b'\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x00\x00' \
-                b'\x04\x00\x00\x00\x44\x58\x54\x31\x00\x00\x00\x00' \
-                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00' \
-                b'\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00' \
-                b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
-        return Image.open(
-            io.BytesIO(
-                build_dxt1_header(
-                    self.read_save_block_int(0x1a3c0),
-                    self.read_save_block_int(0x1da0)
-                ) + self.read_save_block_object(0x273e0)
-            )
+        return self.parse_trainer_icon(
+            self.read_save_block_int(self.TRAINER_ICON_WIDTH_OFFSET),
+            self.read_save_block_int(self.TRAINER_ICON_HEIGHT_OFFSET),
+            self.read_save_block_object(self.TRAINER_ICON_OFFSET)
         )
 
+    @staticmethod
+    def parse_trainer_icon(width: int, height: int, icon: bytes) -> Image:
+        """Open DXT1 compressed trainer icon data as PIL image"""
+        # thanks NPO! https://github.com/NPO-197
+        dxt1_header = b'\x44\x44\x53\x20\x7C\x00\x00\x00\x07\x10\x08\x00' \
+            + struct.pack("<II", height, width) \
+            + b'\x00\x7E\x09\x00\x00\x00\x00\x00\x01\x00\x00\x00' \
+            b'\x49\x4D\x41\x47\x45\x4D\x41\x47\x49\x43\x4B\x00' \
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00' \
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00' \
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x20\x00\x00\x00' \
+            b'\x04\x00\x00\x00\x44\x58\x54\x31\x00\x00\x00\x00' \
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00' \
+            b'\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00' \
+            b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+        return Image.open(io.BytesIO(dxt1_header + icon))
+
     def read_game_version(self) -> Game:
         """Read game version"""
         return Game.from_game_id(self.read_main_int(0x4385FD0, 4))
 
-    def read_raid_enemy_table_arrays(self) -> tuple[RaidEnemyTableArray, 7]:
-        """Read all raid flatbuffer binaries from memory"""
+    def read_raid_enemy_table_arrays(
+        self,
+        table_cache: RaidTableCache = None
+    ) -> tuple[RaidEnemyTableArray, 7]:
+        """Read all raid flatbuffer binaries from memory, binaries of table_cache whose
+           fingerprint still matches the one in memory are reused instead of read again,
+           EVENT is always read again and table_cache is kept if it is unchanged"""
+        reads = self.raid_enemy_table_reads()
+        binaries = [None] * len(reads)
+        if table_cache is not None and table_cache.game_version != self.game_version:
+            table_cache = None
+        if table_cache is not None:
+            for index, (star_level, current_fingerprint) in enumerate(
+                zip(self.RAID_BINARY_STAR_LEVELS, self.read_raid_binary_fingerprints())
+            ):
+                if (
+                    current_fingerprint is not None
+                    and star_level in table_cache.binaries
+                    and table_cache.fingerprint(star_level) == current_fingerprint
+                ):
+                    binaries[index] = table_cache.binaries[star_level]
+        stale = [index for index, binary in enumerate(binaries) if binary is None]
+        for index, binary in zip(stale, self.read_many([reads[index] for index in stale])):
+            binaries[index] = binary
+        if table_cache is None or any(
+            table_cache.binaries.get(self.RAID_BINARY_STAR_LEVELS[index]) != binaries[index]
+            for index in stale
+        ):
+            # reused binaries are copied out of the old cache so that it can be replaced
+            binaries = [bytes(binary) for binary in binaries]
+            table_cache = RaidTableCache(
+                self.game_version,
+                dict(zip(self.RAID_BINARY_STAR_LEVELS, binaries))
+            )
+        self.table_cache = table_cache
+        return tuple(RaidEnemyTableArray(binary) for binary in binaries)
+
+    def read_raid_binary_fingerprints(self) -> tuple[bytes, 7]:
+        """Read the fingerprint of every raid flatbuffer binary in StarLevel order,
+           None for binaries whose pointer currently cannot be resolved and for EVENT"""
+        # the event binary changes with every event and is read into a window larger than
+        # the binary itself, so its suffix is not its end and it is always read in full
+        reads = [
+            (star_level, pointer, size)
+            for star_level, (_, pointer, size) in zip(
+                self.RAID_BINARY_STAR_LEVELS,
+                self.raid_enemy_table_reads()
+            )
+            if star_level != StarLevel.EVENT
+        ]
+        addresses = dict(zip(
+            (star_level for star_level, _, _ in reads),
+            self.resolve_cached_pointers([pointer for _, pointer, _ in reads])
+        ))
+        # prefix and suffix of every binary are read in one pipelined batch
+        results = iter(self.read_many([
+            ("absolute", addresses[star_level] + offset, FINGERPRINT_SIZE)
+            for star_level, _, size in reads
+            if addresses[star_level] is not None
+            for offset in (0, size - FINGERPRINT_SIZE)
+        ]))
+        return tuple(
+            None if addresses.get(star_level) is None else fingerprint(next(results), next(results))
+            for star_level in self.RAID_BINARY_STAR_LEVELS
+        )
+
+    @staticmethod
+    def raid_enemy_table_reads() -> list[tuple[str, str, int]]:
+        """Reads of all raid flatbuffer binaries in StarLevel order"""
+        return [
+            ("pointer", *RaidReader.raid_binary_ptr(star_level))
+            for star_level in RaidReader.RAID_BINARY_STAR_LEVELS
+        ]
+
+    def read_raid_block_seeds(self) -> tuple[int, int]:
+        """Read only the current_seed and tomorrow_seed header of the raid block"""
+        return self.parse_raid_block_seeds(
+            self.read_pointer(self.RAID_BLOCK_PTR[0], self.RAID_BLOCK_HEADER_SIZE)
+        )
+
+    @staticmethod
+    def parse_raid_block_seeds(header: bytes) -> tuple[int, int]:
+        """Parse current_seed and tomorrow_seed from the raid block header"""
         return (
-            RaidEnemyTableArray(
-                self.read_pointer(*self.raid_binary_ptr(StarLevel.ONE_STAR))
-            ),
-            RaidEnemyTableArray(
-                self.read_pointer(*self.raid_binary_ptr(StarLevel.TWO_STAR))
-            ),
-            RaidEnemyTableArray(
-                self.read_pointer(*self.raid_binary_ptr(StarLevel.THREE_STAR))
-            ),
-            RaidEnemyTableArray(
-                self.read_pointer(*self.raid_binary_ptr(StarLevel.FOUR_STAR))
-            ),
-            RaidEnemyTableArray(
-                self.read_pointer(*self.raid_binary_ptr(StarLevel.FIVE_STAR))
-            ),
-            RaidEnemyTableArray(
-                self.read_pointer(*self.raid_binary_ptr(StarLevel.SIX_STAR))
-            ),
-            RaidEnemyTableArray(
-                self.read_pointer(*self.raid_binary_ptr(StarLevel.EVENT))
-            ),
+            int.from_bytes(header[:8], 'little'),
+            int.from_bytes(header[8:], 'little')
         )
 
+    def wait_for_seed_change(
+        self,
+        last_seed: int,
+        timeout: float,
+        interval: float = 0.1
+    ) -> int:
+        """Poll the raid block header until current_seed differs from last_seed
+           or timeout seconds pass, returning the last current_seed read"""
+        deadline = time.monotonic() + timeout
+        current_seed, _ = self.read_raid_block_seeds()
+        while current_seed == last_seed and time.monotonic() < deadline:
+            self.pause(interval)
+            current_seed, _ = self.read_raid_block_seeds()
+        return current_seed
+
+    def read_raid_block_view(self) -> RaidBlockView:
+        """Read raid block data from memory as a columnar view"""
+        return RaidBlockView(self.read_pointer(*self.RAID_BLOCK_PTR))
+
     def read_raid_block_data(self) -> RaidBlock:
         """Read raid block data from memory and process"""
-        raid_block = process_raid_block(self.read_pointer(*self.RAID_BLOCK_PTR))
+        raid_block = self.read_raid_block_view().to_raid_block()
         raid_block.initialize_data(
-            self.raid_enemy_table_arrays,
+            self.encounter_index,
             self.story_progress,
             self.game_version,
             self.delivery_raid_priority
         )
         return raid_block
 
-    def check_if_data_avaiable(self):
-        """Check if data is avaiable to be read from socket"""
-        try:
-            self.socket.recv(1, socket.MSG_PEEK)
-            return True
-        except TimeoutError:
+    def clear_pointer_cache(self) -> None:
+        """Forget all resolved pointer chains"""
+        self.pointer_cache.clear()
+        self.main_base = None
+
+    def validate_pointer_cache(self) -> bool:
+        """Clear the pointer cache if the game has been restarted since it was built"""
+        main_base = self.read_main_nso_base()
+        if main_base != self.main_base:
+            self.clear_pointer_cache()
+            self.main_base = main_base
             return False
+        return True
 
-    def clear_all_data(self):
-        """Clear all data waiting to be read"""
-        with contextlib.suppress(TimeoutError):
-            while self.check_if_data_avaiable():
-                self.socket.recv(0x8000)
-
-    def read(self, address, size):
-        if self.read_safety and not self.usb_connection:
-            self.clear_all_data()
-        return super().read(address, size)
-
-    def read_absolute(self, address, size):
-        if self.read_safety and not self.usb_connection:
-            self.clear_all_data()
-        return super().read_absolute(address, size)
-
-    def read_main(self, address, size):
-        if self.read_safety and not self.usb_connection:
-            self.clear_all_data()
-        return super().read_main(address, size)
-
-    def read_pointer(self, pointer, size):
-        if self.read_safety and not self.usb_connection:
-            self.clear_all_data()
-        return super().read_pointer(pointer, size)
+    def resolve_cached_pointers(self, pointers: list[str]) -> list[int]:
+        """Resolve pointer chains to absolute addresses, each chain is only walked once,
+           None for chains that currently cannot be resolved"""
+        if missing := [
+            pointer for pointer in dict.fromkeys(pointers) if pointer not in self.pointer_cache
+        ]:
+            if self.main_base is None:
+                self.main_base = self.read_main_nso_base()
+            for pointer, address in zip(missing, self.resolve_pointers(missing)):
+                # null jumps are retried on the next read
+                if address != 0:
+                    self.pointer_cache[pointer] = address
+        return [self.pointer_cache.get(pointer) for pointer in pointers]
+
+    def read_many(self, reads):
+        addresses = iter(
+            self.resolve_cached_pointers(
+                [location for kind, location, _ in reads if kind == "pointer"]
+            )
+        )
+        absolute_reads = []
+        for kind, location, size in reads:
+            if kind == "pointer" and (address := next(addresses)) is not None:
+                absolute_reads.append(("absolute", address, size))
+            else:
+                absolute_reads.append((kind, location, size))
+        try:
+            results = super().read_many(absolute_reads)
+        except (TimeoutError, ConnectionError, binascii.Error):
+            # re-resolve every chain after a failed read
+            self.clear_pointer_cache()
+            raise
+        if self.recording is not None:
+            self.record_reads(reads, absolute_reads, results)
+        return results
+
+    def record_reads(
+        self,
+        reads: list[tuple[str, int | str, int]],
+        absolute_reads: list[tuple[str, int | str, int]],
+        results: list[bytes]
+    ) -> None:
+        """Record the results of reads into self.recording"""
+        if self.main_base is not None:
+            self.recording.main_base = self.main_base
+        for (kind, location, _), (absolute_kind, address, _), data in zip(
+            reads,
+            absolute_reads,
+            results
+        ):
+            match kind:
+                case "heap" | "main" | "absolute":
+                    self.recording.add(kind, location, data)
+                # chains that could not be resolved have no address to be replayed from
+                case "pointer" if absolute_kind == "absolute":
+                    self.recording.add_pointer(location, address, data)
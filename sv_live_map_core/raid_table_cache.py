@@ -0,0 +1,113 @@
+"""Cache of the raw raid flatbuffer binaries, memory mapped when loaded"""
+
+import hashlib
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from .sv_enums import Game, StarLevel
+from .raid_enemy_table_array import RaidEnemyTableArray
+
+CACHE_MAGIC = b"SVRT"
+CACHE_VERSION = 1
+# magic, version, game version, binary count
+CACHE_HEADER = struct.Struct("<4sHhH")
+# star level, offset of the binary from the start of the file, size, content hash
+CACHE_ENTRY = struct.Struct("<bxxxII16s")
+# bytes read from each end of a binary to fingerprint it
+FINGERPRINT_SIZE = 0x40
+
+def content_hash(binary: bytes) -> bytes:
+    """Hash of the content of a binary"""
+    return hashlib.blake2b(binary, digest_size = 16).digest()
+
+def fingerprint(prefix: bytes, suffix: bytes) -> bytes:
+    """Cheap fingerprint of a binary from its first and last FINGERPRINT_SIZE bytes,
+       the root table and vector lengths are at the start of a flatbuffer
+       and the first tables built at its end, only meaningful for binaries read with their
+       exact size (not EVENT)"""
+    return content_hash(bytes(prefix) + bytes(suffix))
+
+@dataclass
+class RaidTableCache:
+    """Raw raid flatbuffer binaries keyed by star level in RaidReader order
+       along with the game version they were read from"""
+    game_version: Game
+    binaries: dict[StarLevel, bytes]
+
+    @staticmethod
+    def from_tables(
+        game_version: Game,
+        raid_enemy_table_arrays: tuple[RaidEnemyTableArray, 7]
+    ) -> "RaidTableCache":
+        """Cache of the binaries raid_enemy_table_arrays were parsed from"""
+        # tables are ordered like RaidReader.raid_enemy_table_reads with EVENT last
+        star_levels = (
+            StarLevel.ONE_STAR,
+            StarLevel.TWO_STAR,
+            StarLevel.THREE_STAR,
+            StarLevel.FOUR_STAR,
+            StarLevel.FIVE_STAR,
+            StarLevel.SIX_STAR,
+            StarLevel.EVENT,
+        )
+        return RaidTableCache(
+            game_version,
+            {
+                star_level: bytes(raid_enemy_table_array.buf)
+                for star_level, raid_enemy_table_array in zip(
+                    star_levels,
+                    raid_enemy_table_arrays
+                )
+            }
+        )
+
+    def save(self, path: str) -> None:
+        """Save the binaries after a header describing them, replacing the file at path"""
+        entries = []
+        offset = CACHE_HEADER.size + CACHE_ENTRY.size * len(self.binaries)
+        for star_level, binary in self.binaries.items():
+            entries.append(CACHE_ENTRY.pack(star_level, offset, len(binary), content_hash(binary)))
+            offset += len(binary)
+        # written next to the cache and swapped in so a partial write never replaces it
+        with open(f"{path}.tmp", "wb") as cache_file:
+            cache_file.write(
+                CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, self.game_version, len(entries))
+            )
+            cache_file.writelines(entries)
+            cache_file.writelines(self.binaries.values())
+        os.replace(f"{path}.tmp", path)
+
+    @staticmethod
+    def load(path: str) -> "RaidTableCache":
+        """Load a cache written by save, binaries are views of the memory mapped file"""
+        with open(path, "rb") as cache_file:
+            # the mapping stays open for as long as a view of it is referenced
+            data = memoryview(mmap.mmap(cache_file.fileno(), 0, access = mmap.ACCESS_READ))
+        if len(data) < CACHE_HEADER.size:
+            raise ValueError("Cached raid data is truncated")
+        magic, version, game_version, count = CACHE_HEADER.unpack_from(data)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            raise ValueError("Cached raid data is of an unknown format")
+        if CACHE_HEADER.size + count * CACHE_ENTRY.size > len(data):
+            raise ValueError("Cached raid data is truncated")
+        binaries = {}
+        for index in range(count):
+            star_level, offset, size, binary_hash = CACHE_ENTRY.unpack_from(
+                data,
+                CACHE_HEADER.size + index * CACHE_ENTRY.size
+            )
+            binary = data[offset:offset + size]
+            if len(binary) != size or content_hash(binary) != binary_hash:
+                raise ValueError(f"Cached raid data of {StarLevel(star_level).name} is corrupt")
+            binaries[StarLevel(star_level)] = binary
+        return RaidTableCache(Game(game_version), binaries)
+
+    def fingerprint(self, star_level: StarLevel) -> bytes:
+        """Fingerprint of the cached binary of star_level"""
+        binary = self.binaries[star_level]
+        return fingerprint(binary[:FINGERPRINT_SIZE], binary[-FINGERPRINT_SIZE:])
+
+    def raid_enemy_table_arrays(self) -> tuple[RaidEnemyTableArray, 7]:
+        """Parse the binaries in place, indexable by StarLevel like RaidReader's tables"""
+        return tuple(RaidEnemyTableArray(binary) for binary in self.binaries.values())
@@ -1,5 +1,7 @@
 """Pseudorandom number generators used in game"""
 
+from collections import OrderedDict
+from typing import Self
 import numpy as np
 
 class Xoroshiro128Plus:
@@ -55,6 +57,132 @@ class Xoroshiro128Plus:
             result = self.next() & mask
         return int(result)
 
+class Xoroshiro128PlusInt:
+    """Xoroshiro128+ Implementation using plain python ints masked to 64 bits"""
+    __slots__ = ("seed0", "seed1")
+    _XORO_CONST: int = 0x82A2B175229D6A5B
+    _ULONG_MASK: int = 0xFFFFFFFFFFFFFFFF
+    # get_mask(maximum) == _MASK_TABLE[(maximum - 1).bit_length()]
+    _MASK_TABLE: tuple[int, ...] = tuple((1 << i) - 1 for i in range(65))
+
+    def __init__(self, seed0: int, seed1: int = _XORO_CONST) -> None:
+        # ensure numpy inputs are casted to python ints
+        self.seed0: int = int(seed0) & self._ULONG_MASK
+        self.seed1: int = int(seed1) & self._ULONG_MASK
+
+    def next(self) -> int:
+        """Generate next pseudorandom number"""
+        seed0 = self.seed0
+        seed1 = self.seed1
+        rand = (seed0 + seed1) & self._ULONG_MASK
+        seed1 ^= seed0
+        self.seed0 = (((seed0 << 24) | (seed0 >> 40)) ^ seed1 ^ (seed1 << 16)) & self._ULONG_MASK
+        self.seed1 = ((seed1 << 37) | (seed1 >> 27)) & self._ULONG_MASK
+        return rand
+
+    @staticmethod
+    def get_mask(maximum: int) -> int:
+        """Generate a bitmask for rand generation"""
+        return Xoroshiro128PlusInt._MASK_TABLE[(maximum - 1).bit_length()]
+
+    def rand(self, maximum: int = 0xFFFFFFFF) -> int:
+        """Generate a pseudorandom number in range [0, maximum)"""
+        assert maximum != 0
+        mask = self._MASK_TABLE[(maximum - 1).bit_length()]
+        result = self.next() & mask
+        while result >= maximum:
+            result = self.next() & mask
+        return result
+
+# either scalar engine, they generate identical sequences
+Xoroshiro128PlusScalar = Xoroshiro128Plus | Xoroshiro128PlusInt
+
+class Xoroshiro128PlusBatch:
+    """Xoroshiro128+ Implementation advancing many states in lockstep"""
+    _XORO_CONST: np.uint64 = np.uint64(0x82A2B175229D6A5B)
+    _ULONG_SIZE: np.uint64 = np.uint64(64)
+    _ROT_24: np.uint64 = np.uint64(24)
+    _ROT_37: np.uint64 = np.uint64(37)
+    _SHIFT_16: np.uint64 = np.uint64(16)
+    _ONE: np.uint64 = np.uint64(1)
+
+    def __init__(self, seed0: np.ndarray, seed1: np.ndarray | np.uint64 = _XORO_CONST) -> None:
+        # copy inputs so that advancing never mutates the caller's arrays
+        self.seed0: np.ndarray = np.array(seed0, dtype = np.uint64, ndmin = 1)
+        self.seed1: np.ndarray = np.array(
+            np.broadcast_to(np.asarray(seed1, dtype = np.uint64), self.seed0.shape)
+        )
+
+    def __len__(self) -> int:
+        return len(self.seed0)
+
+    def __getitem__(self, index: np.ndarray) -> Self:
+        """Build a new batch from a subset of lanes (boolean mask or indices)"""
+        return Xoroshiro128PlusBatch(self.seed0[index], self.seed1[index])
+
+    @staticmethod
+    def _rotl(num: np.ndarray, k: np.uint64) -> np.ndarray:
+        """Rotate each lane of num left by k"""
+        return (num << k) | (num >> (Xoroshiro128PlusBatch._ULONG_SIZE - k))
+
+    @staticmethod
+    def _advance(seed0: np.ndarray, seed1: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advance the states (seed0, seed1) and return (rand, seed0, seed1)"""
+        rand = seed0 + seed1
+        seed1 = seed1 ^ seed0
+        seed0 = (
+            Xoroshiro128PlusBatch._rotl(seed0, Xoroshiro128PlusBatch._ROT_24)
+            ^ seed1
+            ^ (seed1 << Xoroshiro128PlusBatch._SHIFT_16)
+        )
+        seed1 = Xoroshiro128PlusBatch._rotl(seed1, Xoroshiro128PlusBatch._ROT_37)
+        return rand, seed0, seed1
+
+    def next(self) -> np.ndarray:
+        """Generate next pseudorandom number for every lane"""
+        rand, self.seed0, self.seed1 = self._advance(self.seed0, self.seed1)
+        return rand
+
+    def _next_lanes(self, lanes: np.ndarray) -> np.ndarray:
+        """Generate next pseudorandom number for only the lanes at the given indices"""
+        rand, self.seed0[lanes], self.seed1[lanes] = \
+            self._advance(self.seed0[lanes], self.seed1[lanes])
+        return rand
+
+    @staticmethod
+    def get_mask(maximum: np.ndarray) -> np.ndarray:
+        """Generate a bitmask for rand generation for each lane"""
+        mask = maximum - Xoroshiro128PlusBatch._ONE
+        for i in range(6):
+            mask |= mask >> (Xoroshiro128PlusBatch._ONE << np.uint64(i))
+        return mask
+
+    def rand(self, maximum: np.ndarray | int = 0xFFFFFFFF, lanes: np.ndarray = None) -> np.ndarray:
+        """Generate a pseudorandom number in range [0, maximum) for every lane
+           (or only the lanes at the given indices),
+           maximum may either be shared or given per lane"""
+        maximum = np.asarray(maximum, dtype = np.uint64)
+        assert np.all(maximum != 0)
+        mask = self.get_mask(maximum)
+        if lanes is None:
+            result = self.next() & mask
+        else:
+            result = self._next_lanes(lanes) & mask
+        # masked rejection sampling, only lanes that were rejected are advanced again
+        retry = np.flatnonzero(result >= maximum)
+        if maximum.ndim != 0:
+            maximum = maximum[retry]
+            mask = mask[retry]
+        while len(retry):
+            retry_result = self._next_lanes(retry if lanes is None else lanes[retry]) & mask
+            result[retry] = retry_result
+            rejected = retry_result >= maximum
+            retry = retry[rejected]
+            if maximum.ndim != 0:
+                maximum = maximum[rejected]
+                mask = mask[rejected]
+        return result
+
 class SCXorshift32:
     """Xorshift32 Implementation for saveblock decryption"""
     _SHIFT2: np.uint32 = np.uint32(2)
@@ -105,3 +233,99 @@ class SCXorshift32:
         val += (val >> SCXorshift32._SHIFT8)
         val += (val >> SCXorshift32._SHIFT16)
         return val & 0x3F
+
+    @staticmethod
+    def _advance_int(seed: int) -> int:
+        """Advance a plain int state once"""
+        seed ^= (seed << 2) & 0xFFFFFFFF
+        seed ^= seed >> 15
+        seed ^= (seed << 13) & 0xFFFFFFFF
+        return seed
+
+    @staticmethod
+    def _jump(columns: tuple[int], seed: int) -> int:
+        """Apply a GF(2) matrix given by its columns to a plain int state"""
+        result = 0
+        for bit, column in enumerate(columns):
+            if (seed >> bit) & 1:
+                result ^= column
+        return result
+
+    @staticmethod
+    def warm_up(key: int) -> int:
+        """State of a plain int key after the pop count warm-up"""
+        seed = int(key) & 0xFFFFFFFF
+        for _ in range(seed.bit_count()):
+            seed = SCXorshift32._advance_int(seed)
+        return seed
+
+    @staticmethod
+    def keystream_words(key: int, count: int) -> np.ndarray:
+        """Generate count keystream words at once,
+           word i is the state after i advances past the pop count warm-up"""
+        return SCXorshift32.words_from_state(SCXorshift32.warm_up(key), count)
+
+    @staticmethod
+    def words_after(last_word: int, count: int) -> np.ndarray:
+        """Generate the count keystream words following the word last_word"""
+        return SCXorshift32.words_from_state(SCXorshift32._advance_int(last_word), count)
+
+    @staticmethod
+    def words_from_state(seed: int, count: int) -> np.ndarray:
+        """Generate count keystream words starting with the word of state seed"""
+        words = np.empty(count, dtype = "<u4")
+        if count == 0:
+            return words
+        words[0] = seed
+        # xorshift is linear over GF(2): the words [filled, 2 * filled) are the words
+        # [0, filled) jumped ahead by filled advances, which doubles each round
+        jump = tuple(SCXorshift32._advance_int(1 << bit) for bit in range(32))
+        filled = 1
+        while filled < count:
+            step = min(filled, count - filled)
+            source = words[:step]
+            target = np.zeros(step, dtype = np.uint32)
+            for bit, column in enumerate(jump):
+                target ^= ((source >> np.uint32(bit)) & np.uint32(1)) * np.uint32(column)
+            words[filled:filled + step] = target
+            filled += step
+            jump = tuple(SCXorshift32._jump(jump, column) for column in jump)
+        return words
+
+    @staticmethod
+    def keystream(key: int, size: int) -> np.ndarray:
+        """Generate the first size keystream bytes identical to repeated next() calls"""
+        return SCXorshift32.keystream_words(key, (size + 3) >> 2).view(np.uint8)[:size]
+
+class KeystreamCache:
+    """LRU cache of SCXorshift32 keystreams, each key keeps its longest generated prefix
+       which is extended in place when a longer prefix is requested"""
+    def __init__(self, max_keys: int = 32) -> None:
+        self.max_keys = max_keys
+        self._words: OrderedDict[int, np.ndarray] = OrderedDict()
+
+    def get(self, key: int, size: int) -> np.ndarray:
+        """Get the first size keystream bytes of key"""
+        count = (size + 3) >> 2
+        if (words := self._words.get(key)) is None:
+            words = SCXorshift32.keystream_words(key, count)
+        elif len(words) < count:
+            # continue from the state after the last cached word
+            words = np.concatenate((
+                words,
+                SCXorshift32.words_after(int(words[-1]), count - len(words))
+            ))
+        self._words[key] = words
+        self._words.move_to_end(key)
+        while len(self._words) > self.max_keys:
+            self._words.popitem(last = False)
+        return words.view(np.uint8)[:size]
+
+    def decrypt(self, key: int, block: bytes) -> bytearray:
+        """Decrypt a save block of key with one XOR over the cached keystream"""
+        data = np.frombuffer(block, dtype = np.uint8)
+        return bytearray(np.bitwise_xor(data, self.get(key, len(data))).tobytes())
+
+    def clear(self) -> None:
+        """Drop all cached keystreams"""
+        self._words.clear()
@@ -0,0 +1,421 @@
+"""Offline search of the 32-bit TeraRaid.seed space for raids matching a RaidFilter"""
+
+import os
+import multiprocessing
+import multiprocessing.synchronize
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator
+import numpy as np
+from .rng import Xoroshiro128PlusBatch
+from .raid_block import (
+    calc_difficulty,
+    TOXTRICITY_AMPED_NATURES,
+    TOXTRICITY_LOWKEY_NATURES,
+)
+from .raid_filter import RaidFilter
+from .raid_enemy_table_array import RaidEnemyTableArray, RaidEnemyInfo
+from .flatbuffer_object import FlatBufferObject
+from .encounter_index import EncounterIndex
+from .personal_data_handler import PersonalDataHandler
+from .sv_enums import (
+    StoryProgress,
+    StarLevel,
+    Species,
+    Game,
+    Gender,
+    GenderGeneration,
+    NatureGeneration,
+    Nature,
+    AbilityGeneration,
+    IVGeneration,
+    ShinyGeneration,
+)
+
+SEED_SPACE = 1 << 32
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_SHARD_SIZE = 1 << 24
+
+# difficulty as a function of story progress and difficulty_rand
+DIFFICULTY_TABLES = {
+    story_progress: np.array(
+        [calc_difficulty(story_progress, difficulty_rand) for difficulty_rand in range(100)],
+        dtype = np.int8
+    )
+    for story_progress in StoryProgress
+}
+
+class SeedSearch:
+    """Search the 32-bit TeraRaid.seed space for raids matching a RaidFilter
+
+       Either a fixed raid_enemy_info slot is searched directly, or the slot is selected per seed
+       from raid_enemy_table_arrays for the given story_progress, game and difficulty
+       (SIX_STAR searches black dens, EVENT searches event dens of delivery_group_id,
+       any other difficulty searches normal dens that roll that difficulty)"""
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        raid_filter: RaidFilter,
+        raid_enemy_info: RaidEnemyInfo = None,
+        raid_enemy_table_arrays: tuple[RaidEnemyTableArray] = None,
+        story_progress: StoryProgress = None,
+        game: Game = None,
+        difficulty: StarLevel = None,
+        delivery_group_id: int = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        assert raid_enemy_info is not None or (
+            raid_enemy_table_arrays is not None
+            and story_progress is not None
+            and game is not None
+            and difficulty is not None
+        ), "Either a slot or tables, story progress, game and difficulty are required"
+        # ensure personal data is loaded
+        PersonalDataHandler()
+        self.raid_filter = raid_filter
+        self.compiled_filter = raid_filter.compile()
+        self.raid_enemy_info = raid_enemy_info
+        self.raid_enemy_table_arrays = raid_enemy_table_arrays
+        self.story_progress = story_progress
+        self.game = game
+        self.difficulty = difficulty
+        self.delivery_group_id = delivery_group_id
+        self.chunk_size = chunk_size
+        # possible slots only depend on the search parameters
+        self.slots: list[RaidEnemyInfo] = None
+        self.cumulative_rates: np.ndarray = None
+        if raid_enemy_info is None:
+            self.slots, self.cumulative_rates = self.build_encounter_table()
+
+    def __getstate__(self) -> dict:
+        # workers only need the slots, which may be views of a memory mapped table cache
+        state = self.__dict__.copy()
+        state["raid_enemy_table_arrays"] = None
+        buffers = {}
+        if isinstance(self.raid_enemy_info, FlatBufferObject):
+            state["raid_enemy_info"] = self.raid_enemy_info.detach(buffers)
+        if self.slots is not None:
+            state["slots"] = [
+                slot.detach(buffers) if isinstance(slot, FlatBufferObject) else slot
+                for slot in self.slots
+            ]
+        return state
+
+    def search(self) -> np.ndarray:
+        """Search the full seed space"""
+        return self.search_range(0, SEED_SPACE)
+
+    def search_range(
+        self,
+        start: int,
+        end: int,
+        cancel_event: multiprocessing.synchronize.Event = None
+    ) -> np.ndarray:
+        """Search seeds in [start, end) in vectorized chunks,
+           stopping early between chunks if cancel_event is set"""
+        results = [np.empty(0, dtype = np.uint32)]
+        for chunk_start in range(start, end, self.chunk_size):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            results.append(self.search_chunk(chunk_start, min(chunk_start + self.chunk_size, end)))
+        return np.concatenate(results)
+
+    def iter_search_parallel(
+        self,
+        start: int = 0,
+        end: int = SEED_SPACE,
+        max_workers: int = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        progress_callback: Callable[[int, int], None] = None,
+        cancel_event: multiprocessing.synchronize.Event = None,
+    ) -> Iterator[tuple[int, int, np.ndarray]]:
+        """Search seeds in [start, end) split into shards across processes,
+           yielding (shard_start, shard_end, matches) as each shard completes
+
+           progress_callback(searched, total) is called after every shard and setting
+           cancel_event (a multiprocessing.Event) stops all workers at their next chunk"""
+        # pylint: disable=too-many-arguments
+        # workers also stop on an internal event so that the caller's event is never set here
+        # and can be reused for another search
+        stop_event = multiprocessing.Event()
+        cancel_events = (stop_event,) if cancel_event is None else (stop_event, cancel_event)
+        total = end - start
+        searched = 0
+        # each worker receives the search (and its encounter slots) once via its initializer,
+        # pickled without the tables by __getstate__
+        with ProcessPoolExecutor(
+            max_workers = max_workers or os.cpu_count(),
+            initializer = _init_worker,
+            initargs = (self, *cancel_events),
+        ) as executor:
+            futures = [
+                executor.submit(_search_shard, shard_start, min(shard_start + shard_size, end))
+                for shard_start in range(start, end, shard_size)
+            ]
+            try:
+                for future in as_completed(futures):
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
+                    shard_start, shard_end, matches = future.result()
+                    searched += shard_end - shard_start
+                    if progress_callback is not None:
+                        progress_callback(searched, total)
+                    yield shard_start, shard_end, matches
+            finally:
+                # runs on completion, cancellation or when the consumer stops iterating
+                stop_event.set()
+                for future in futures:
+                    future.cancel()
+
+    def search_parallel(
+        self,
+        start: int = 0,
+        end: int = SEED_SPACE,
+        max_workers: int = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        progress_callback: Callable[[int, int], None] = None,
+        cancel_event: multiprocessing.synchronize.Event = None,
+    ) -> np.ndarray:
+        """Search seeds in [start, end) across processes and return the sorted matches,
+           only the completed shards are included if cancelled"""
+        # pylint: disable=too-many-arguments
+        results = [np.empty(0, dtype = np.uint32)]
+        for _, _, matches in self.iter_search_parallel(
+            start,
+            end,
+            max_workers,
+            shard_size,
+            progress_callback,
+            cancel_event
+        ):
+            results.append(matches)
+        return np.sort(np.concatenate(results))
+
+    def search_chunk(self, start: int, end: int) -> np.ndarray:
+        """Search seeds in [start, end) all at once"""
+        seeds = np.arange(start, end, dtype = np.uint64)
+        if self.raid_enemy_info is not None:
+            matches = self.generate_pokemon(seeds, self.raid_enemy_info, self.difficulty)
+        else:
+            matches = self.generate_from_tables(seeds)
+        return np.sort(matches).astype(np.uint32)
+
+    def build_encounter_table(self) -> tuple[list[RaidEnemyInfo], np.ndarray]:
+        """Build the possible slots and their cumulative rates"""
+        encounter_table = EncounterIndex(self.raid_enemy_table_arrays).get(
+            self.difficulty,
+            self.story_progress,
+            self.game,
+            self.delivery_group_id
+        )
+        return (
+            list(encounter_table.slots),
+            np.array(encounter_table.cumulative_rates, dtype = np.uint64)
+        )
+
+    def generate_from_tables(self, seeds: np.ndarray) -> np.ndarray:
+        """Select a slot per seed from the encounter tables and return the matching seeds"""
+        slots, cumulative_rates = self.slots, self.cumulative_rates
+        if not slots or cumulative_rates[-1] == 0:
+            return np.empty(0, dtype = np.uint64)
+
+        rng_slot = Xoroshiro128PlusBatch(seeds)
+        # black dens do not roll difficulty
+        if self.difficulty != StarLevel.SIX_STAR:
+            difficulty_rand = rng_slot.rand(100)
+            # difficulty_rand is unused by events but still happens
+            if self.difficulty != StarLevel.EVENT:
+                rolled = DIFFICULTY_TABLES[self.story_progress][difficulty_rand]
+                lanes = rolled == self.difficulty
+                seeds = seeds[lanes]
+                rng_slot = rng_slot[lanes]
+
+        slot_index = np.searchsorted(
+            cumulative_rates,
+            rng_slot.rand(cumulative_rates[-1]),
+            side = "right"
+        )
+        matches = [
+            self.generate_pokemon(seeds[slot_index == i], slot, self.difficulty)
+            for i, slot in enumerate(slots)
+        ]
+        return np.concatenate(matches)
+
+    def generate_pokemon(
+        self,
+        seeds: np.ndarray,
+        raid_enemy_info: RaidEnemyInfo,
+        difficulty: StarLevel = None
+    ) -> np.ndarray:
+        """Vectorized TeraRaid.generate_pokemon that returns only the seeds matching the filter,
+           lanes are dropped as soon as a field fails the filter"""
+        # pylint: disable=too-many-return-statements
+        boss_poke_para = raid_enemy_info.boss_poke_para
+        species = boss_poke_para.dev_id
+        form = boss_poke_para.form_id
+        # events who force their own difficulty, ONE_STAR (0) included
+        if raid_enemy_info.difficulty is not None:
+            difficulty = raid_enemy_info.difficulty
+
+        compiled_filter = self.compiled_filter
+
+        # slot directly determines species + difficulty
+        if not compiled_filter.species_lookup[species]:
+            return seeds[:0]
+        if difficulty is not None and not compiled_filter.difficulty_matches(difficulty):
+            return seeds[:0]
+
+        # tera type is not filtered so its rng is skipped entirely
+        rng = Xoroshiro128PlusBatch(seeds)
+        # encryption constant
+        rng.rand()
+        sidtid = rng.rand()
+        pid = rng.rand()
+
+        if compiled_filter.shiny_filter:
+            match boss_poke_para.rare_type:
+                case ShinyGeneration.RANDOM_SHININESS | None:
+                    temp = pid ^ sidtid
+                    lanes = ((temp & 0xFFFF) ^ (temp >> 16)) < 0x10
+                    seeds, rng = seeds[lanes], rng[lanes]
+                case ShinyGeneration.SHINY_LOCKED:
+                    return seeds[:0]
+
+        ivs = self.rand_ivs(rng, raid_enemy_info)
+        lanes = compiled_filter.ivs_mask(ivs)
+        seeds, rng = seeds[lanes], rng[lanes]
+
+        ability_index = self.rand_ability(rng, raid_enemy_info)
+        lanes = compiled_filter.ability_lookup[ability_index]
+        seeds, rng = seeds[lanes], rng[lanes]
+
+        gender = self.rand_gender(rng, species, form, raid_enemy_info)
+        lanes = compiled_filter.gender_lookup[gender]
+        seeds, rng = seeds[lanes], rng[lanes]
+
+        nature = self.rand_nature(rng, species, form, raid_enemy_info)
+        lanes = compiled_filter.nature_lookup[nature]
+        return seeds[lanes]
+
+    @staticmethod
+    def rand_ivs(rng: Xoroshiro128PlusBatch, raid_enemy_info: RaidEnemyInfo) -> np.ndarray:
+        """Vectorized TeraRaid.rand_ivs"""
+        boss_poke_para = raid_enemy_info.boss_poke_para
+        match boss_poke_para.talent_type:
+            case IVGeneration.RANDOM_IVS:
+                return np.stack([rng.rand(32) for _ in range(6)], axis = 1).astype(np.int64)
+            case IVGeneration.SET_GUARANTEED_IVS:
+                ivs = np.full((len(rng), 6), -1, dtype = np.int64)
+                for _ in range(boss_poke_para.talent_vnum or 0):
+                    index = rng.rand(6).astype(np.int64)
+                    # reroll only the lanes whose index is already guaranteed
+                    retry = np.flatnonzero(ivs[np.arange(len(ivs)), index] != -1)
+                    while len(retry):
+                        index[retry] = rng.rand(6, retry)
+                        retry = retry[ivs[retry, index[retry]] != -1]
+                    ivs[np.arange(len(ivs)), index] = 31
+                for i in range(6):
+                    lanes = np.flatnonzero(ivs[:, i] == -1)
+                    ivs[lanes, i] = rng.rand(32, lanes)
+                return ivs
+            case IVGeneration.SET_IVS:
+                talent_value = boss_poke_para.talent_value
+                return np.tile(
+                    np.array(
+                        (
+                            talent_value.hp,
+                            talent_value.atk,
+                            talent_value.def_,
+                            talent_value.spa,
+                            talent_value.spd,
+                            talent_value.spe
+                        ),
+                        dtype = np.int64
+                    ),
+                    (len(rng), 1)
+                )
+
+    @staticmethod
+    def rand_ability(rng: Xoroshiro128PlusBatch, raid_enemy_info: RaidEnemyInfo) -> np.ndarray:
+        """Vectorized TeraRaid.rand_ability (index only)"""
+        raid_fixed_ability = raid_enemy_info.boss_poke_para.tokusei
+        match raid_fixed_ability:
+            case AbilityGeneration.RANDOM_12 | None:
+                return rng.rand(2).astype(np.int64)
+            case AbilityGeneration.RANDOM_12HA:
+                return rng.rand(3).astype(np.int64)
+            case _:
+                return np.full(len(rng), raid_fixed_ability.to_ability_index(), dtype = np.int64)
+
+    @staticmethod
+    def rand_gender(
+        rng: Xoroshiro128PlusBatch,
+        species: Species,
+        form: int,
+        raid_enemy_info: RaidEnemyInfo
+    ) -> np.ndarray:
+        """Vectorized TeraRaid.rand_gender"""
+        raid_fixed_gender = raid_enemy_info.boss_poke_para.sex
+        match raid_fixed_gender:
+            case None | GenderGeneration.RANDOM_GENDER:
+                species_fixed_gender = PersonalDataHandler.fixed_gender(species, form)
+                match species_fixed_gender:
+                    case GenderGeneration.RANDOM_GENDER:
+                        gender_ratio = PersonalDataHandler.get_data(species, form)["gender_ratio"]
+                        return np.where(
+                            rng.rand(100) < gender_ratio,
+                            Gender.FEMALE,
+                            Gender.MALE
+                        ).astype(np.int64)
+                    case _:
+                        fixed_gender = Gender.from_generation(species_fixed_gender)
+            case _:
+                fixed_gender = Gender.from_generation(raid_fixed_gender)
+        return np.full(len(rng), fixed_gender, dtype = np.int64)
+
+    @staticmethod
+    def rand_nature(
+        rng: Xoroshiro128PlusBatch,
+        species: Species,
+        form: int,
+        raid_enemy_info: RaidEnemyInfo
+    ) -> np.ndarray:
+        """Vectorized TeraRaid.rand_nature"""
+        raid_fixed_nature = raid_enemy_info.boss_poke_para.seikaku
+        match raid_fixed_nature:
+            case None | NatureGeneration.NONE:
+                if species == Species.TOXTRICITY:
+                    match form:
+                        case 0: # amped
+                            return np.array(TOXTRICITY_AMPED_NATURES)[rng.rand(13)]
+                        case 1: # lowkey
+                            return np.array(TOXTRICITY_LOWKEY_NATURES)[rng.rand(12)]
+                return rng.rand(25).astype(np.int64)
+            case _:
+                fixed_nature = Nature.from_generation(raid_fixed_nature)
+                return np.full(len(rng), fixed_nature, dtype = np.int64)
+
+# per-process state of parallel search workers
+_WORKER_SEED_SEARCH: SeedSearch = None
+_WORKER_CANCEL_EVENT: "_AnyEvent" = None
+
+class _AnyEvent:
+    """Set while any of several events is set, checked by search_range like a single event"""
+    def __init__(self, *events: multiprocessing.synchronize.Event) -> None:
+        self.events = events
+
+    def is_set(self) -> bool:
+        """Whether any of the events is set"""
+        return any(event.is_set() for event in self.events)
+
+def _init_worker(seed_search: SeedSearch, *cancel_events: multiprocessing.synchronize.Event):
+    """Store the search and cancellation events for the lifetime of the worker process"""
+    # pylint: disable=global-statement
+    global _WORKER_SEED_SEARCH, _WORKER_CANCEL_EVENT
+    _WORKER_SEED_SEARCH = seed_search
+    _WORKER_CANCEL_EVENT = _AnyEvent(*cancel_events)
+    # ensure personal data is loaded when processes are spawned rather than forked
+    PersonalDataHandler()
+
+def _search_shard(start: int, end: int) -> tuple[int, int, np.ndarray]:
+    """Search a single shard in a worker process"""
+    return start, end, _WORKER_SEED_SEARCH.search_range(start, end, _WORKER_CANCEL_EVENT)
@@ -0,0 +1,39 @@
+"""RaidReader replaying a recorded MemorySnapshot"""
+
+import binascii
+from collections import deque
+from sv_live_map_core.raid_reader import RaidReader
+from sv_live_map_core.raid_enemy_table_array import RaidEnemyTableArray
+from sv_live_map_core.memory_snapshot import MemorySnapshot
+
+class SnapshotRaidReader(RaidReader):
+    """RaidReader answering every command from a MemorySnapshot without any network I/O"""
+    def __init__(
+        self,
+        snapshot: MemorySnapshot,
+        raid_enemy_table_arrays: tuple[RaidEnemyTableArray, 7] = None,
+    ):
+        self.snapshot = snapshot
+        # responses of sent commands waiting to be received
+        self._responses: deque[bytes] = deque()
+        super().__init__("snapshot", raid_enemy_table_arrays = raid_enemy_table_arrays)
+
+    @classmethod
+    def from_file(cls, path: str) -> "SnapshotRaidReader":
+        """Replay a snapshot file written by MemorySnapshot.save"""
+        return cls(MemorySnapshot.load(path))
+
+    def _connect(self, ip_address: str, port: int) -> None:
+        """Nothing to connect to"""
+
+    def _send_command(self, content: str) -> None:
+        command, *args = content.split(" ")
+        if (response := self.snapshot.respond(command, args)) is not None:
+            self._responses.append(response)
+
+    def _recv(self, size: int) -> bytes:
+        # hex encoded bytes + newline
+        return binascii.unhexlify(self._responses.popleft()[:-1])
+
+    def close(self) -> None:
+        """Nothing to disconnect from"""
@@ -0,0 +1,107 @@
+"""Local TCP server speaking the sys-botbase text protocol from a memory snapshot"""
+
+import socket
+import threading
+from time import sleep, monotonic
+from typing import Callable, Self
+from .memory_snapshot import MemorySnapshot
+
+class SysBotEmulator:
+    """Threaded TCP server answering sys-botbase commands from a MemorySnapshot with
+       configurable latency (seconds from receiving a command to answering it, overlapping
+       for pipelined commands), bandwidth (bytes per second) and fragmentation (bytes per send)"""
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        snapshot: MemorySnapshot,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        bandwidth: float = None,
+        fragment_size: int = None,
+        on_command: Callable[[str, list[str]], None] = None,
+    ) -> None:
+        self.snapshot = snapshot
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.fragment_size = fragment_size
+        # called with every command and its arguments before it is answered
+        self.on_command = on_command
+        # every command received, in order
+        self.commands: list[str] = []
+        self.server = socket.create_server((host, port))
+        self.host, self.port = self.server.getsockname()[:2]
+        self._thread: threading.Thread = None
+        self._running = False
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def start(self) -> Self:
+        """Start accepting connections in a background thread"""
+        self._running = True
+        self._thread = threading.Thread(target = self._accept_connections, daemon = True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop accepting connections"""
+        self._running = False
+        self.server.close()
+
+    def _accept_connections(self) -> None:
+        """Serve every connection in its own thread"""
+        while self._running:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            # fragments are sent as configured instead of being coalesced
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(
+                target = self._serve_connection,
+                args = (connection,),
+                daemon = True
+            ).start()
+
+    def _serve_connection(self, connection: socket.socket) -> None:
+        """Answer commands until the client disconnects"""
+        with connection:
+            buffer = b""
+            try:
+                while data := connection.recv(0x1000):
+                    received_at = monotonic()
+                    buffer += data
+                    while b"\r\n" in buffer:
+                        line, buffer = buffer.split(b"\r\n", 1)
+                        if (response := self.handle_command(line.decode())) is not None:
+                            self._send_response(connection, response, received_at)
+            except OSError:
+                return
+
+    def handle_command(self, line: str) -> bytes:
+        """Response of a command line, None for commands without a response"""
+        self.commands.append(line)
+        command, *args = line.split(" ")
+        if self.on_command is not None:
+            self.on_command(command, args)
+        return self.snapshot.respond(command, args)
+
+    def _send_response(
+        self,
+        connection: socket.socket,
+        response: bytes,
+        received_at: float
+    ) -> None:
+        """Send a response with the configured latency, bandwidth and fragmentation"""
+        if (delay := received_at + self.latency - monotonic()) > 0:
+            sleep(delay)
+        fragment_size = self.fragment_size or len(response)
+        for start in range(0, len(response), fragment_size):
+            fragment = response[start:start + fragment_size]
+            if self.bandwidth:
+                sleep(len(fragment) / self.bandwidth)
+            connection.sendall(fragment)
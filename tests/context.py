@@ -2,9 +2,33 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from sv_live_map_core.raid_block import TeraRaid
+from sv_live_map_core.raid_block import (
+    TeraRaid,
+    RaidBlockView,
+    process_raid_block,
+    generate_if_matches
+)
+from sv_live_map_core.raid_filter import RaidFilter, CompiledRaidFilter
+from sv_live_map_core.nxreader import NXReader, pointer_jumps
+from sv_live_map_core.async_nxreader import AsyncNXReader
+from sv_live_map_core.async_raid_reader import AsyncRaidReader
+from sv_live_map_core.memory_snapshot import MemorySnapshot
+from sv_live_map_core.sysbot_emulator import SysBotEmulator
+from sv_live_map_core.raid_reader import RaidReader
+from sv_live_map_core.snapshot_raid_reader import SnapshotRaidReader
+from sv_live_map_core.seed_search import SeedSearch
+from sv_live_map_core.encounter_index import EncounterIndex
+from sv_live_map_core.rng import (
+    Xoroshiro128Plus,
+    Xoroshiro128PlusInt,
+    Xoroshiro128PlusBatch,
+    SCXorshift32,
+    KeystreamCache
+)
 from sv_live_map_core.sv_enums import (
     StarLevel,
+    StoryProgress,
+    Game,
     Species,
     GenderGeneration,
     TeraTypeGeneration,
@@ -18,6 +42,10 @@ from sv_live_map_core.sv_enums import (
     Gender,
     Nature
 )
+from sv_live_map_core.raid_enemy_table_array import RaidEnemyTableArray
+from sv_live_map_core.raid_enemy_columns import RAID_ENEMY_DTYPE
+from sv_live_map_core.raid_table_cache import CACHE_HEADER, RaidTableCache
+from sv_live_map_core.flatbuffer_schema import SCHEMAS
 from sv_live_map_core.personal_data_handler import PersonalDataHandler
 
 PersonalDataHandler()
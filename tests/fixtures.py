@@ -0,0 +1,242 @@
+"""Builders and constants shared by several test modules"""
+# pylint: disable=import-error
+import random
+import flatbuffers
+from .context import (
+    RaidFilter,
+    RaidReader,
+    MemorySnapshot,
+    SCXorshift32,
+    StarLevel,
+    Game,
+    Species,
+    GenderGeneration,
+    TeraTypeGeneration,
+    NatureGeneration,
+    AbilityGeneration,
+    IVGeneration,
+    ShinyGeneration,
+    Nature,
+    Gender,
+    AbilityIndex,
+)
+
+class MockParamSet:
+    """Mock version of ParamSet"""
+    def __init__(
+        self,
+        hp: int,
+        atk: int,
+        def_: int,
+        spa: int,
+        spd: int,
+        spe: int
+    ) -> None:
+        self.hp = hp
+        self.atk = atk
+        self.def_ = def_
+        self.spa = spa
+        self.spd = spd
+        self.spe = spe
+
+class MockPokeDataBattle:
+    """Mock version of PokeDataBattle"""
+    def __init__(
+        self,
+        dev_id: Species,
+        form_id: int,
+        sex: GenderGeneration = GenderGeneration.RANDOM_GENDER,
+        gem_type: TeraTypeGeneration = TeraTypeGeneration.RANDOM,
+        seikaku: NatureGeneration = NatureGeneration.NONE,
+        tokusei: AbilityGeneration = AbilityGeneration.RANDOM_12,
+        talent_type: IVGeneration = IVGeneration.SET_GUARANTEED_IVS,
+        talent_value: MockParamSet = MockParamSet(0, 0, 0, 0, 0, 0),
+        talent_vnum: int = 0,
+        rare_type: ShinyGeneration = ShinyGeneration.RANDOM_SHININESS,
+    ) -> None:
+        self.dev_id = dev_id
+        self.form_id = form_id
+        self.sex = sex
+        self.gem_type = gem_type
+        self.seikaku = seikaku
+        self.tokusei = tokusei
+        self.talent_type = talent_type
+        self.talent_value = talent_value
+        self.talent_vnum = talent_vnum
+        self.rare_type = rare_type
+
+class MockRaidEnemyInfo:
+    """Mock version of RaidEnemyInfo with encounter table info"""
+    def __init__(
+        self,
+        boss_poke_para: MockPokeDataBattle,
+        rate: int = 10,
+        rom_ver: Game = Game.BOTH,
+        difficulty: StarLevel = None,
+        delivery_group_id: int = None,
+    ) -> None:
+        self.boss_poke_para = boss_poke_para
+        self.rate = rate
+        self.rom_ver = rom_ver
+        self.difficulty = difficulty
+        self.delivery_group_id = delivery_group_id
+
+class MockRaidEnemyTable:
+    """Mock version of RaidEnemyTable"""
+    def __init__(self, raid_enemy_info: MockRaidEnemyInfo) -> None:
+        self.raid_enemy_info = raid_enemy_info
+
+class MockRaidEnemyTableArray:
+    """Mock version of RaidEnemyTableArray"""
+    def __init__(self, *raid_enemy_infos: MockRaidEnemyInfo) -> None:
+        self.raid_enemy_tables = [MockRaidEnemyTable(info) for info in raid_enemy_infos]
+
+MOCK_SLOTS = (
+    MockRaidEnemyInfo(MockPokeDataBattle(Species.PIKACHU, 0), rate = 30),
+    MockRaidEnemyInfo(
+        MockPokeDataBattle(
+            Species.MAUSHOLD,
+            0,
+            talent_vnum = 3,
+            tokusei = AbilityGeneration.RANDOM_12HA
+        ),
+        rate = 20,
+        rom_ver = Game.SCARLET
+    ),
+    MockRaidEnemyInfo(MockPokeDataBattle(Species.TOXTRICITY, 1, talent_vnum = 2), rate = 25),
+    MockRaidEnemyInfo(
+        MockPokeDataBattle(
+            Species.CHARIZARD,
+            0,
+            talent_type = IVGeneration.SET_IVS,
+            talent_value = MockParamSet(31, 31, 31, 31, 31, 31),
+            sex = GenderGeneration.MALE,
+            seikaku = NatureGeneration.MODEST,
+            tokusei = AbilityGeneration.ABILITY_HA,
+        ),
+        rate = 15,
+        rom_ver = Game.VIOLET
+    ),
+    MockRaidEnemyInfo(
+        MockPokeDataBattle(Species.GIMMIGHOUL, 0, talent_type = IVGeneration.RANDOM_IVS),
+        rate = 5
+    ),
+)
+
+RAID_ENEMY_TABLE_ARRAYS = tuple(
+    MockRaidEnemyTableArray(*MOCK_SLOTS) for _ in range(6)
+) + (
+    MockRaidEnemyTableArray(
+        MockRaidEnemyInfo(
+            MockPokeDataBattle(Species.PIKACHU, 0, rare_type = ShinyGeneration.FORCED_SHINY),
+            rate = 50,
+            delivery_group_id = 1,
+            difficulty = StarLevel.FOUR_STAR,
+        ),
+        MockRaidEnemyInfo(
+            MockPokeDataBattle(Species.EEVEE, 0, talent_vnum = 4),
+            rate = 50,
+            delivery_group_id = 1,
+        ),
+        MockRaidEnemyInfo(MockPokeDataBattle(Species.DITTO, 0), rate = 100, delivery_group_id = 2),
+    ),
+)
+
+def build_filter(**kwargs) -> RaidFilter:
+    """Build a RaidFilter that accepts every IV unless specified"""
+    for stat in ("hp", "atk", "def", "spa", "spd", "spe"):
+        kwargs.setdefault(f"{stat}_filter", range(0, 32))
+    return RaidFilter(**kwargs)
+
+FILTERS = (
+    build_filter(),
+    build_filter(hp_filter = range(20, 32), nature_filter = [Nature.MODEST, Nature.JOLLY]),
+    build_filter(
+        atk_filter = range(0, 5),
+        ability_filter = [AbilityIndex.ABILITY_2, AbilityIndex.ABILITY_HA],
+        gender_filter = [Gender.FEMALE],
+    ),
+    build_filter(species_filter = [Species.TOXTRICITY], spe_filter = range(31, 32)),
+    build_filter(species_filter = [Species.MAUSHOLD, Species.EEVEE], spa_filter = range(31, 32)),
+    build_filter(shiny_filter = True),
+)
+
+# (rom_ver, difficulty (in game), rate, species, form, talent_type, talent_vnum)
+FLATBUFFER_SLOTS = (
+    (Game.SCARLET, 3, 20, Species.PIKACHU, 0, IVGeneration.SET_GUARANTEED_IVS, 3),
+    (Game.BOTH, 5, 40, Species.TOXTRICITY, 1, IVGeneration.RANDOM_IVS, 0),
+    (Game.VIOLET, 1, 1, Species.MAUSHOLD, 1, IVGeneration.SET_GUARANTEED_IVS, 5),
+)
+
+def build_raid_enemy_table_array() -> bytes:
+    """Build a RaidEnemyTableArray binary of FLATBUFFER_SLOTS"""
+    builder = flatbuffers.Builder(0)
+    tables = []
+    for rom_ver, difficulty, rate, species, form, talent_type, talent_vnum in FLATBUFFER_SLOTS:
+        builder.StartObject(21)
+        builder.PrependUint16Slot(0, species, 0)
+        builder.PrependInt16Slot(1, form, 0)
+        builder.PrependInt32Slot(14, talent_type, 0)
+        builder.PrependInt8Slot(16, talent_vnum, 0)
+        boss_poke_para = builder.EndObject()
+        builder.StartObject(13)
+        builder.PrependInt16Slot(0, rom_ver, 0)
+        builder.PrependInt32Slot(3, difficulty, 0)
+        builder.PrependInt8Slot(4, rate, 0)
+        builder.PrependUOffsetTRelativeSlot(9, boss_poke_para, 0)
+        raid_enemy_info = builder.EndObject()
+        builder.StartObject(1)
+        builder.PrependUOffsetTRelativeSlot(0, raid_enemy_info, 0)
+        tables.append(builder.EndObject())
+    builder.StartVector(4, len(tables), 4)
+    for table in reversed(tables):
+        builder.PrependUOffsetTRelative(table)
+    raid_enemy_tables = builder.EndVector()
+    builder.StartObject(1)
+    builder.PrependUOffsetTRelativeSlot(0, raid_enemy_tables, 0)
+    builder.Finish(builder.EndObject())
+    return bytes(builder.Output())
+
+RAID_BLOCK_POINTER = "[[main+43A77C8]+160]+40"
+
+def build_snapshot() -> MemorySnapshot:
+    """Snapshot of random memory in every region"""
+    rand = random.Random(0)
+    snapshot = MemorySnapshot()
+    snapshot.add("heap", 0x1000, rand.randbytes(0x10))
+    snapshot.add("main", 0x4385FD0, rand.randbytes(4))
+    snapshot.add("absolute", 0x80000000, rand.randbytes(0x7530))
+    snapshot.add_pointer(RAID_BLOCK_POINTER, 0x8812345670, rand.randbytes(0xC98))
+    return snapshot
+
+# root table without any fields
+EMPTY_FLATBUFFER = bytes((8, 0, 0, 0, 4, 0, 4, 0, 4, 0, 0, 0))
+
+def build_raid_snapshot() -> MemorySnapshot:
+    """Snapshot of a game with empty encounter tables, five star raids unlocked,
+       and a random raid block"""
+    rand = random.Random(0)
+    snapshot = MemorySnapshot()
+    address = 0x8800000000
+    for _, pointer, _ in RaidReader.raid_enemy_table_reads():
+        snapshot.add_pointer(pointer, address, EMPTY_FLATBUFFER)
+        address += 0x10000
+    snapshot.add_pointer(RaidReader.RAID_PRIORITY_PTR[0], address, EMPTY_FLATBUFFER)
+    address += 0x10000
+    for offset in RaidReader.DIFFICULTY_FLAG_LOCATIONS:
+        key = rand.getrandbits(32)
+        flag = 2 if offset == 0x1B640 else 1
+        snapshot.add_pointer(
+            f"{RaidReader.SAVE_BLOCK_PTR}+{offset:X}",
+            address,
+            key.to_bytes(4, 'little')
+        )
+        snapshot.add_pointer(
+            f"[{RaidReader.SAVE_BLOCK_PTR}+{offset + 8:X}]",
+            address + 8,
+            bytes((flag ^ int(SCXorshift32.keystream(key, 1)[0]),))
+        )
+        address += 0x10
+    snapshot.add("main", 0x4385FD0, (50).to_bytes(4, 'little'))
+    snapshot.add_pointer(RaidReader.RAID_BLOCK_PTR[0], 0x8900000000, rand.randbytes(0xC98))
+    return snapshot
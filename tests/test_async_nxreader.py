@@ -0,0 +1,122 @@
+"""Test asyncio sys-botbase client reads"""
+# pylint: disable=import-error
+import asyncio
+import random
+import pytest
+from .context import (
+    AsyncNXReader,
+    AsyncRaidReader,
+    RaidReader,
+    KeystreamCache,
+    SysBotEmulator,
+    MemorySnapshot,
+)
+from .fixtures import build_snapshot, build_raid_snapshot, RAID_BLOCK_POINTER
+
+async def concurrent_reads(snapshot: MemorySnapshot, port: int) -> None:
+    """Reads from several tasks share one connection"""
+    reader = await AsyncNXReader("127.0.0.1", port).connect()
+    block, header, binaries, address = await asyncio.gather(
+        reader.read_pointer(RAID_BLOCK_POINTER, 0xC98),
+        reader.read_main(0x4385FD0, 4),
+        reader.read_many([("absolute", 0x80000000, 0x7530), ("heap", 0x1000, 0x10)]),
+        reader.resolve_pointer(RAID_BLOCK_POINTER),
+    )
+    assert block == snapshot.absolute[0x8812345670]
+    assert header == snapshot.main[0x4385FD0]
+    assert binaries == [snapshot.absolute[0x80000000], snapshot.heap[0x1000]]
+    assert address == 0x8812345670
+    assert await reader.read_absolute(address, 0xC98) == block
+    reader.writer.close()
+
+def test_async_reads():
+    """Concurrent coroutine reads are matched to their own responses"""
+    snapshot = build_snapshot()
+    with SysBotEmulator(snapshot, fragment_size = 0x333) as emulator:
+        asyncio.run(concurrent_reads(snapshot, emulator.port))
+
+async def timed_reads(port: int, transfer_rate: float) -> bytes:
+    """Read the largest recorded binary with a base timeout shorter than its transfer"""
+    reader = await AsyncNXReader("127.0.0.1", port, 0.05, transfer_rate).connect()
+    try:
+        return await reader.read_absolute(0x80000000, 0x7530)
+    finally:
+        reader.writer.close()
+
+def test_async_timeout():
+    """Response timeouts scale with the size of the read"""
+    snapshot = build_snapshot()
+    with SysBotEmulator(snapshot, bandwidth = 0x40000) as emulator:
+        assert asyncio.run(timed_reads(emulator.port, 0x20000)) == snapshot.absolute[0x80000000]
+        with pytest.raises(TimeoutError):
+            asyncio.run(timed_reads(emulator.port, 0x1000000))
+
+def add_save_block(snapshot: MemorySnapshot, offset: int, key: int, data: bytes) -> None:
+    """Record encrypted save block data of key at offset"""
+    address = 0x8A00000000 + offset * 0x10
+    snapshot.add_pointer(
+        f"{RaidReader.SAVE_BLOCK_PTR}+{offset:X}",
+        address,
+        key.to_bytes(4, 'little')
+    )
+    snapshot.add_pointer(
+        f"[{RaidReader.SAVE_BLOCK_PTR}+{offset + 8:X}]",
+        address + 8,
+        bytes(KeystreamCache().decrypt(key, data))
+    )
+
+async def async_trainer_icon(port: int) -> bytes:
+    """Trainer icon read by AsyncRaidReader"""
+    reader = await AsyncRaidReader("127.0.0.1", port).connect()
+    icon = await reader.read_trainer_icon()
+    reader.writer.close()
+    return icon.tobytes()
+
+def test_async_trainer_icon():
+    """AsyncRaidReader reads the same trainer icon as RaidReader"""
+    snapshot = build_raid_snapshot()
+    rand = random.Random(0)
+    # type byte followed by a u32 or the size of an object
+    add_save_block(snapshot, RaidReader.TRAINER_ICON_WIDTH_OFFSET, 1, b"\x04\x08\x00\x00\x00")
+    add_save_block(snapshot, RaidReader.TRAINER_ICON_HEIGHT_OFFSET, 2, b"\x04\x08\x00\x00\x00")
+    # 4 DXT1 blocks of 8 bytes
+    add_save_block(
+        snapshot,
+        RaidReader.TRAINER_ICON_OFFSET,
+        3,
+        b"\x04\x20\x00\x00\x00" + rand.randbytes(32)
+    )
+    with SysBotEmulator(snapshot) as emulator:
+        reader = RaidReader(emulator.host, emulator.port)
+        icon = reader.read_trainer_icon()
+        assert icon.size == (8, 8)
+        assert asyncio.run(async_trainer_icon(emulator.port)) == icon.tobytes()
+        reader.socket.close()
+
+async def reads_after_failure(port: int) -> None:
+    """Reads waiting for the send lock when the receiver stops, and reads pending on close"""
+    reader = await AsyncNXReader("127.0.0.1", port, 0.05, 0x1000000).connect()
+    first = asyncio.create_task(reader.read_main(0x4385FD0, 4))
+    await asyncio.sleep(0)
+    # pylint: disable=protected-access
+    async with reader._send_lock:
+        second = asyncio.create_task(reader.read_main(0x4385FD0, 4))
+        with pytest.raises(TimeoutError):
+            await first
+    done, _ = await asyncio.wait({second}, timeout = 1)
+    assert second in done
+    assert isinstance(second.exception(), TimeoutError)
+    reader.writer.close()
+
+    reader = await AsyncNXReader("127.0.0.1", port).connect()
+    pending = asyncio.create_task(reader.read_main(0x4385FD0, 4))
+    await asyncio.sleep(0)
+    await reader.close()
+    done, _ = await asyncio.wait({pending}, timeout = 1)
+    assert pending in done
+    assert isinstance(pending.exception(), ConnectionError)
+
+def test_async_failed_connection():
+    """Requests fail instead of waiting forever once responses can no longer be received"""
+    with SysBotEmulator(build_snapshot(), latency = 0.6) as emulator:
+        asyncio.run(reads_after_failure(emulator.port))
@@ -0,0 +1,65 @@
+"""Test EncounterIndex"""
+# pylint: disable=import-error
+from bisect import bisect_right
+from .context import EncounterIndex, StarLevel, StoryProgress, Game, Species
+from .fixtures import RAID_ENEMY_TABLE_ARRAYS
+
+def test_encounter_table_slots():
+    """Encounter tables only contain valid slots"""
+    encounter_index = EncounterIndex(RAID_ENEMY_TABLE_ARRAYS)
+    scarlet = encounter_index.get(StarLevel.THREE_STAR, StoryProgress.DEFAULT, Game.SCARLET)
+    assert [slot.boss_poke_para.dev_id for slot in scarlet.slots] \
+        == [Species.PIKACHU, Species.MAUSHOLD, Species.TOXTRICITY, Species.GIMMIGHOUL]
+    assert scarlet.cumulative_rates == (30, 50, 75, 80)
+    assert scarlet.total == 80
+
+    # forced difficulty of event slots must be unlocked
+    event = encounter_index.get(StarLevel.EVENT, StoryProgress.DEFAULT, Game.VIOLET, 1)
+    assert [slot.boss_poke_para.dev_id for slot in event.slots] == [Species.EEVEE]
+    event = encounter_index.get(StarLevel.EVENT, StoryProgress.SIX_STAR_UNLOCKED, Game.VIOLET, 1)
+    assert [slot.boss_poke_para.dev_id for slot in event.slots] == [Species.PIKACHU, Species.EEVEE]
+    assert encounter_index.get(StarLevel.EVENT, StoryProgress.DEFAULT, Game.VIOLET, 3).total == 0
+
+def test_encounter_table_cached():
+    """Encounter tables are built once per key"""
+    encounter_index = EncounterIndex(RAID_ENEMY_TABLE_ARRAYS)
+    table = encounter_index.get(StarLevel.FIVE_STAR, StoryProgress.DEFAULT, Game.SCARLET, None)
+    # story progress and delivery group do not matter for normal dens
+    assert table is encounter_index.get(
+        StarLevel.FIVE_STAR,
+        StoryProgress.SIX_STAR_UNLOCKED,
+        Game.SCARLET,
+        4
+    )
+
+def test_slot_selection():
+    """Bisecting cumulative rates selects the same slot as a linear walk"""
+    encounter_index = EncounterIndex(RAID_ENEMY_TABLE_ARRAYS)
+    table = encounter_index.get(StarLevel.ONE_STAR, StoryProgress.DEFAULT, Game.VIOLET)
+    for encounter_slot_rand in range(table.total):
+        remaining = encounter_slot_rand
+        for linear_slot in table.slots:
+            if remaining < linear_slot.rate:
+                break
+            remaining -= linear_slot.rate
+        assert table.slots[bisect_right(table.cumulative_rates, encounter_slot_rand)] \
+            is linear_slot
+
+def test_delivery_group_ids():
+    """Raid indices are assigned to delivery groups with spawnable pokemon"""
+    encounter_index = EncounterIndex(RAID_ENEMY_TABLE_ARRAYS)
+    # group 3 has no slots and is skipped
+    delivery_raid_priority = (0, 2, 1, 3, 0, 0, 0, 0, 0, 0, 0)
+    delivery_group_ids = encounter_index.get_delivery_group_ids(
+        delivery_raid_priority,
+        StoryProgress.DEFAULT,
+        Game.SCARLET,
+        8
+    )
+    assert delivery_group_ids == (1, 1, 2, None, None, None, None, None)
+    assert delivery_group_ids is encounter_index.get_delivery_group_ids(
+        delivery_raid_priority,
+        StoryProgress.DEFAULT,
+        Game.SCARLET,
+        8
+    )
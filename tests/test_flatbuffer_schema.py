@@ -0,0 +1,32 @@
+"""Test flatbuffer reader generation"""
+# pylint: disable=import-error
+import flatbuffers
+from .context import SCHEMAS, RaidReader
+
+def test_generated_modules_match_schemas():
+    """Generated reader modules are up to date with their schemas"""
+    for schema in SCHEMAS:
+        with open(schema.path, encoding = "utf-8") as module_file:
+            assert module_file.read() == schema.source(), \
+                f"run python -m sv_live_map_core.flatbuffer_schema to regenerate {schema.module}"
+
+def test_delivery_raid_priority():
+    """Group counts are read from the first DeliveryRaidPriority"""
+    group_counts = (3, 0, 5, 1, 0, 0, 0, 0, 0, 2)
+    builder = flatbuffers.Builder(0)
+    builder.StartObject(10)
+    for slot, group_count in enumerate(group_counts):
+        # written even when 0 so that every group count is present
+        builder.PrependInt8Slot(slot, group_count, -1)
+    delivery_group_id = builder.EndObject()
+    builder.StartObject(2)
+    builder.PrependInt32Slot(0, 1, 0)
+    builder.PrependUOffsetTRelativeSlot(1, delivery_group_id, 0)
+    delivery_raid_priority = builder.EndObject()
+    builder.StartVector(4, 1, 4)
+    builder.PrependUOffsetTRelative(delivery_raid_priority)
+    delivery_raid_prioritys = builder.EndVector()
+    builder.StartObject(1)
+    builder.PrependUOffsetTRelativeSlot(0, delivery_raid_prioritys, 0)
+    builder.Finish(builder.EndObject())
+    assert RaidReader.parse_delivery_raid_priority(bytes(builder.Output())) == (0, *group_counts)
@@ -0,0 +1,67 @@
+"""Test sys-botbase client reads"""
+# pylint: disable=import-error
+import array
+import random
+from .context import NXReader, SysBotEmulator
+from .fixtures import build_snapshot, RAID_BLOCK_POINTER
+
+def test_read_many():
+    """Pipelined reads return every response in order, even when fragmented"""
+    snapshot = build_snapshot()
+    with SysBotEmulator(snapshot, fragment_size = 0x333) as emulator:
+        reader = NXReader(emulator.host, emulator.port)
+        reads = [
+            ("heap", 0x1000, 0x10),
+            ("main", 0x4385FD0, 4),
+            ("pointer", RAID_BLOCK_POINTER, 0xC98),
+            ("absolute", 0x80000000, 0x7530),
+        ] * 3
+        expected = [
+            snapshot.heap[0x1000],
+            snapshot.main[0x4385FD0],
+            snapshot.absolute[0x8812345670],
+            snapshot.absolute[0x80000000],
+        ] * 3
+        assert reader.read_many(reads) == expected
+        assert reader.read(0x1000, 0x10) == expected[0]
+        assert reader.read_pointer(RAID_BLOCK_POINTER, 0xC98) == expected[2]
+        # partial and unrecorded reads
+        assert reader.read_absolute(0x80000010, 0x10) == expected[3][0x10:0x20]
+        assert reader.read(0x2000, 4) == bytes(4)
+        reader.socket.close()
+
+def test_resolve_pointer():
+    """Resolved pointer chains can be read with absolute reads"""
+    snapshot = build_snapshot()
+    with SysBotEmulator(snapshot, latency = 0.001) as emulator:
+        reader = NXReader(emulator.host, emulator.port)
+        address = reader.resolve_pointer(RAID_BLOCK_POINTER)
+        assert address == 0x8812345670
+        assert reader.resolve_pointer("[main+1234]+10") == 0
+        assert reader.read_main_nso_base() == snapshot.main_base
+        assert reader.read_absolute(address, 0xC98) == \
+            reader.read_pointer(RAID_BLOCK_POINTER, 0xC98)
+        reader.socket.close()
+
+class FakeUSBEndpoint:
+    """IN endpoint returning a queued response in reads of at most the requested size"""
+    def __init__(self, response: bytes) -> None:
+        self.data = len(response).to_bytes(4, 'little') + response
+        self.read_sizes = []
+
+    def read(self, size: int, timeout: int = None) -> array.array:
+        """Read up to size bytes"""
+        assert timeout == 0
+        self.read_sizes.append(size)
+        chunk, self.data = self.data[:size], self.data[size:]
+        return array.array('B', chunk)
+
+def test_usb_recv():
+    """USB responses are received in configurable chunks"""
+    response = random.Random(1).randbytes(0x7530)
+    reader = NXReader.__new__(NXReader)
+    reader.usb_connection = True
+    reader.usb_chunk_size = 0x1000
+    reader.global_in = FakeUSBEndpoint(response)
+    assert reader._recv(0x7530) == response # pylint: disable=protected-access
+    assert reader.global_in.read_sizes == [4] + [0x1000] * 7 + [0x530]
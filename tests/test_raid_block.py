@@ -0,0 +1,79 @@
+"""Test raid block decoding"""
+# pylint: disable=import-error
+import random
+from .context import (
+    RaidBlockView,
+    TeraRaid,
+    Species,
+    StarLevel,
+    process_raid_block,
+    generate_if_matches
+)
+from .fixtures import MockRaidEnemyInfo, MockPokeDataBattle, FILTERS, build_filter
+
+def test_raid_block_view_parity():
+    """The columnar decoder matches the bytechomp reference decoder"""
+    rand = random.Random(0)
+    for _ in range(8):
+        raw_block = rand.randbytes(0xC98)
+        reference = process_raid_block(raw_block)
+        view = RaidBlockView(raw_block)
+        assert view.current_seed == reference.current_seed
+        assert view.tomorrow_seed == reference.tomorrow_seed
+        assert list(view.seeds) == [raid.seed for raid in reference.raids]
+        assert list(view.area_ids) == [raid.area_id for raid in reference.raids]
+        assert list(view.den_ids) == [raid.den_id for raid in reference.raids]
+        assert list(view.content) == [raid.content for raid in reference.raids]
+        assert view.build_raid(5) == reference.raids[5]
+        assert view.to_raid_block() == reference
+
+def test_lazy_generation():
+    """Derived fields are only generated up to the accessed field and match full generation"""
+    mock_info = MockRaidEnemyInfo(
+        boss_poke_para = MockPokeDataBattle(
+            dev_id = Species.MAUSHOLD,
+            form_id = 0,
+            talent_vnum = 3,
+        )
+    )
+    full_raid = TeraRaid(1, 0, 0, 0, 0x88776655, 0, 0, 0)
+    full_raid.difficulty = StarLevel.THREE_STAR
+    full_raid.generate_pokemon(mock_info)
+    assert full_raid.scale == 57
+
+    lazy_raid = TeraRaid(1, 0, 0, 0, 0x88776655, 0, 0, 0)
+    lazy_raid.difficulty = StarLevel.THREE_STAR
+    lazy_raid.generate_pokemon(mock_info)
+    assert not lazy_raid.is_shiny
+    # nothing past the pid has been generated
+    assert lazy_raid._ivs is None # pylint: disable=protected-access
+    assert lazy_raid.nature == full_raid.nature
+    assert str(lazy_raid) == str(full_raid)
+    assert not hasattr(lazy_raid, "__dict__")
+
+def test_generate_if_matches():
+    """Early-exit filtering agrees with RaidFilter.compare and skips the main rng on a miss"""
+    mock_info = MockRaidEnemyInfo(
+        boss_poke_para = MockPokeDataBattle(
+            dev_id = Species.MAUSHOLD,
+            form_id = 0,
+            talent_vnum = 3,
+        )
+    )
+    compiled_filters = [raid_filter.compile() for raid_filter in FILTERS]
+    for seed in range(0x200):
+        for raid_filter, compiled_filter in zip(FILTERS, compiled_filters):
+            raid = TeraRaid(1, 0, 0, 0, seed, 0, 0, 0)
+            raid.difficulty = StarLevel.THREE_STAR
+            raid.generate_pokemon(mock_info)
+            assert generate_if_matches(raid, compiled_filter) == raid_filter.compare(raid)
+
+    raid = TeraRaid(1, 0, 0, 0, 0x88776655, 0, 0, 0)
+    raid.difficulty = StarLevel.THREE_STAR
+    raid.generate_pokemon(mock_info)
+    assert not generate_if_matches(
+        raid,
+        build_filter(species_filter = [Species.EEVEE]).compile()
+    )
+    assert raid._rng is None # pylint: disable=protected-access
+    assert raid._encryption_constant is None # pylint: disable=protected-access
@@ -0,0 +1,57 @@
+"""Test raid enemy table flatbuffer parsing"""
+# pylint: disable=import-error
+import numpy as np
+from .context import RAID_ENEMY_DTYPE, RaidEnemyTableArray, StarLevel
+from .fixtures import FLATBUFFER_SLOTS, build_raid_enemy_table_array
+
+def is_decoded(flatbuffer_object, name: str) -> bool:
+    """Whether the slot of a field has been filled"""
+    try:
+        getattr(type(flatbuffer_object), name).__get__(flatbuffer_object)
+    except AttributeError:
+        return False
+    return True
+
+def test_lazy_fields():
+    """Fields decode to the built values on first access and are cached afterwards"""
+    table_array = RaidEnemyTableArray(build_raid_enemy_table_array())
+    assert len(table_array.raid_enemy_tables) == len(FLATBUFFER_SLOTS)
+    for table, slot in zip(table_array.raid_enemy_tables, FLATBUFFER_SLOTS):
+        rom_ver, difficulty, rate, species, form, talent_type, talent_vnum = slot
+        info = table.raid_enemy_info
+        assert not is_decoded(info, "boss_poke_para")
+        # fields equal to their default are not stored
+        assert info.rom_ver == (rom_ver or None)
+        assert info.difficulty == StarLevel.from_game(difficulty)
+        assert info.rate == rate
+        assert info.boss_poke_para.dev_id == species
+        assert info.boss_poke_para.form_id == (form or None)
+        assert info.boss_poke_para.talent_type == (talent_type or None)
+        assert info.boss_poke_para.talent_vnum == (talent_vnum or None)
+        # absent fields keep their defaults
+        assert info.boss_desc is None
+        assert info.boss_poke_para.waza_1 is None
+        assert info.boss_poke_para is info.boss_poke_para
+        assert is_decoded(info, "boss_poke_para")
+        # unused fields are never decoded
+        assert not is_decoded(info, "raid_time_data")
+        assert not is_decoded(info, "drop_table_fix")
+
+def test_to_columns(tmp_path):
+    """Columns hold one row per slot with absent fields at their defaults"""
+    columns = RaidEnemyTableArray(build_raid_enemy_table_array()).to_columns()
+    assert columns.dtype == RAID_ENEMY_DTYPE
+    assert len(columns) == len(FLATBUFFER_SLOTS)
+    for row, slot in zip(columns, FLATBUFFER_SLOTS):
+        rom_ver, difficulty, rate, species, form, talent_type, talent_vnum = slot
+        assert row["rom_ver"] == rom_ver
+        assert row["difficulty"] == StarLevel.from_game(difficulty)
+        assert row["rate"] == rate
+        assert row["species"] == species
+        assert row["form"] == form
+        assert row["talent_type"] == talent_type
+        assert row["talent_vnum"] == talent_vnum
+        assert row["delivery_group_id"] == 0
+        assert row["ivs"].tolist() == [0] * 6
+    np.save(tmp_path / "columns.npy", columns)
+    assert np.array_equal(np.load(tmp_path / "columns.npy"), columns)
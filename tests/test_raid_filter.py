@@ -0,0 +1,50 @@
+"""Test compiled raid filters"""
+# pylint: disable=import-error
+import numpy as np
+from .context import TeraRaid, CompiledRaidFilter, Species, StarLevel
+from .fixtures import MockRaidEnemyInfo, MockPokeDataBattle, FILTERS, build_filter
+
+SPECIES = (Species.MAUSHOLD, Species.EEVEE, Species.TOXTRICITY)
+
+def build_raids() -> list[TeraRaid]:
+    """Fully generated raids of a few species and difficulties"""
+    raids = []
+    for seed in range(0x300):
+        raid = TeraRaid(1, 0, 0, 0, seed * 0x9E3779B1 & 0xFFFFFFFF, 0, 0, 0)
+        # includes StarLevel.EVENT kept by event slots without a difficulty
+        raid.difficulty = StarLevel(seed % 6 - 1)
+        raid.generate_pokemon(
+            MockRaidEnemyInfo(
+                boss_poke_para = MockPokeDataBattle(
+                    dev_id = SPECIES[seed % len(SPECIES)],
+                    form_id = 0,
+                    talent_vnum = 0,
+                )
+            )
+        )
+        raids.append(raid)
+    return raids
+
+def test_compiled_filter():
+    """Compiled filters agree with RaidFilter.compare for single raids and columnar batches"""
+    raids = build_raids()
+    columns = {
+        "species": np.array([raid.species for raid in raids]),
+        "difficulty": np.array([raid.difficulty for raid in raids]),
+        "is_shiny": np.array([raid.is_shiny for raid in raids]),
+        "ivs": np.array([raid.ivs for raid in raids]),
+        "ability_index": np.array([raid.ability_index for raid in raids]),
+        "gender": np.array([raid.gender for raid in raids]),
+        "nature": np.array([raid.nature for raid in raids]),
+    }
+    for raid_filter in (
+        *FILTERS,
+        build_filter(star_filter = [StarLevel.EVENT]),
+        build_filter(star_filter = [StarLevel.ONE_STAR, StarLevel.FOUR_STAR]),
+        build_filter(star_filter = [StarLevel.SEVEN_STAR], species_filter = [Species.EEVEE]),
+    ):
+        compiled_filter = raid_filter.compile()
+        assert isinstance(compiled_filter, CompiledRaidFilter)
+        expected = [raid_filter.compare(raid) for raid in raids]
+        assert [compiled_filter.compare(raid) for raid in raids] == expected
+        assert list(compiled_filter.mask(columns)) == expected
@@ -2,7 +2,6 @@
 # pylint: disable=import-error
 from .context import (
     TeraRaid,
-    StarLevel,
     Species,
     GenderGeneration,
     TeraTypeGeneration,
@@ -16,60 +15,7 @@ from .context import (
     Gender,
     Nature
 )
-
-class MockParamSet:
-    """Mock version of ParamSet"""
-    def __init__(
-        self,
-        hp: int,
-        atk: int,
-        def_: int,
-        spa: int,
-        spd: int,
-        spe: int
-    ) -> None:
-        self.hp = hp
-        self.atk = atk
-        self.def_ = def_
-        self.spa = spa
-        self.spd = spd
-        self.spe = spe
-
-class MockPokeDataBattle:
-    """Mock version of PokeDataBattle"""
-    def __init__(
-        self,
-        dev_id: Species,
-        form_id: int,
-        sex: GenderGeneration = GenderGeneration.RANDOM_GENDER,
-        gem_type: TeraTypeGeneration = TeraTypeGeneration.RANDOM,
-        seikaku: NatureGeneration = NatureGeneration.NONE,
-        tokusei: AbilityGeneration = AbilityGeneration.RANDOM_12,
-        talent_type: IVGeneration = IVGeneration.SET_GUARANTEED_IVS,
-        talent_value: MockParamSet = MockParamSet(0, 0, 0, 0, 0, 0),
-        talent_vnum: int = 0,
-        rare_type: ShinyGeneration = ShinyGeneration.RANDOM_SHININESS,
-    ) -> None:
-        self.dev_id = dev_id
-        self.form_id = form_id
-        self.sex = sex
-        self.gem_type = gem_type
-        self.seikaku = seikaku
-        self.tokusei = tokusei
-        self.talent_type = talent_type
-        self.talent_value = talent_value
-        self.talent_vnum = talent_vnum
-        self.rare_type = rare_type
-
-class MockRaidEnemyInfo:
-    """Mock version of RaidEnemyInfo"""
-    def __init__(
-        self,
-        boss_poke_para: MockPokeDataBattle,
-        difficulty: StarLevel = None,
-    ) -> None:
-        self.difficulty = difficulty
-        self.boss_poke_para = boss_poke_para
+from .fixtures import MockParamSet, MockPokeDataBattle, MockRaidEnemyInfo
 
 def test_basic_generation():
     """Basic test of tera raid generation"""
@@ -0,0 +1,124 @@
+"""Test RaidReader against the sys-botbase emulator"""
+# pylint: disable=import-error
+import zlib
+import pytest
+from .context import (
+    RaidReader,
+    SnapshotRaidReader,
+    RaidBlockView,
+    MemorySnapshot,
+    SysBotEmulator,
+    StoryProgress,
+    StarLevel,
+    Game,
+    Species,
+    RaidEnemyTableArray,
+    pointer_jumps,
+)
+from .fixtures import build_raid_snapshot, build_raid_enemy_table_array
+
+def test_raid_reader():
+    """Startup data, raid block reads and pointer cache validation"""
+    snapshot = build_raid_snapshot()
+
+    def skip_date(command: str, _):
+        """Change the raid block seed on a touch like the date skip does"""
+        if command == "touchHold":
+            snapshot.add("absolute", 0x8900000000, b"\x01" * 16)
+
+    with SysBotEmulator(snapshot, fragment_size = 0x200, on_command = skip_date) as emulator:
+        reader = RaidReader(emulator.host, emulator.port)
+        assert reader.story_progress == StoryProgress.FIVE_STAR_UNLOCKED
+        assert reader.game_version == Game.SCARLET
+        assert reader.delivery_raid_priority == (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        assert all(
+            len(table_array.raid_enemy_tables) == 0
+            for table_array in reader.raid_enemy_table_arrays
+        )
+
+        view = reader.read_raid_block_view()
+        expected = RaidBlockView(snapshot.absolute[0x8900000000])
+        assert list(view.seeds) == list(expected.seeds)
+        assert reader.read_raid_block_seeds() == (expected.current_seed, expected.tomorrow_seed)
+        # every pointer chain was resolved once and then read with peekAbsolute
+        assert not any(command.startswith("pointerPeek") for command in emulator.commands)
+        assert sum(command.startswith("pointerAll") for command in emulator.commands) == 17
+
+        reader.touch_hold(1102, 470, 50)
+        assert reader.wait_for_seed_change(expected.current_seed, 1) == 0x0101010101010101
+
+        assert reader.validate_pointer_cache()
+        snapshot.main_base += 0x100000
+        assert not reader.validate_pointer_cache()
+        assert not reader.pointer_cache
+        reader.socket.close()
+
+def test_table_cache():
+    """Only the event binary and raid binaries whose fingerprint changed are read again"""
+    snapshot = build_raid_snapshot()
+    event_pointer, event_size = RaidReader.raid_binary_ptr(StarLevel.EVENT)
+    event_address = snapshot.resolve(pointer_jumps(event_pointer))
+    event_binary = build_raid_enemy_table_array()
+    # padded like the in game event binary inside its fixed size read
+    snapshot.add("absolute", event_address, event_binary.ljust(event_size, b"\x00"))
+    with SysBotEmulator(snapshot) as emulator:
+        reader = RaidReader(emulator.host, emulator.port)
+        table_cache = reader.table_cache
+        assert len(table_cache.binaries) == 7
+        reader.socket.close()
+
+        reader = RaidReader(emulator.host, emulator.port, table_cache = table_cache)
+        assert reader.table_cache is table_cache
+        reader.socket.close()
+
+        # a new event with the same layout only changes the species of a middle slot
+        boss_poke_para = RaidEnemyTableArray(event_binary).raid_enemy_tables[1] \
+            .raid_enemy_info.boss_poke_para
+        # pylint: disable-next=protected-access
+        species_offset = boss_poke_para._offset + boss_poke_para.field_offset(0)
+        snapshot.add(
+            "absolute",
+            event_address + species_offset,
+            int(Species.EEVEE).to_bytes(2, 'little')
+        )
+        emulator.commands.clear()
+        reader = RaidReader(emulator.host, emulator.port, table_cache = table_cache)
+        full_reads = [
+            command for command in emulator.commands
+            if command.startswith("peekAbsolute") and int(command.split(" ")[2], 16) > 0x1000
+        ]
+        assert full_reads == [f"peekAbsolute 0x{event_address:X} 0x{event_size:X}"]
+        assert reader.table_cache is not table_cache
+        assert reader.raid_enemy_table_arrays[StarLevel.EVENT].raid_enemy_tables[1] \
+            .raid_enemy_info.boss_poke_para.dev_id == Species.EEVEE
+        assert reader.table_cache.binaries[StarLevel.ONE_STAR] \
+            == table_cache.binaries[StarLevel.ONE_STAR]
+        reader.socket.close()
+
+def test_record_and_replay(tmp_path):
+    """A recorded session replays the same data without a connection"""
+    snapshot = build_raid_snapshot()
+    with SysBotEmulator(snapshot) as emulator:
+        reader = RaidReader(emulator.host, emulator.port, record_snapshot = True)
+        raid_block_data = reader.read_raid_block_view().raids.tobytes()
+        reader.recording.save(tmp_path / "session.snapshot")
+        reader.socket.close()
+
+    replay = SnapshotRaidReader.from_file(tmp_path / "session.snapshot")
+    assert not hasattr(replay, "socket")
+    assert replay.story_progress == reader.story_progress
+    assert replay.game_version == reader.game_version
+    assert replay.delivery_raid_priority == reader.delivery_raid_priority
+    assert replay.read_raid_block_view().raids.tobytes() == raid_block_data
+    assert replay.snapshot.main_base == snapshot.main_base
+
+def test_snapshot_file(tmp_path):
+    """Snapshots round trip through their data only file format and reject corrupt files"""
+    snapshot = build_raid_snapshot()
+    snapshot.save(tmp_path / "session.snapshot")
+    assert MemorySnapshot.load(tmp_path / "session.snapshot") == snapshot
+
+    data = zlib.decompress((tmp_path / "session.snapshot").read_bytes())
+    (tmp_path / "session.snapshot").write_bytes(zlib.compress(data[:-1]))
+    with pytest.raises(ValueError):
+        MemorySnapshot.load(tmp_path / "session.snapshot")
@@ -0,0 +1,91 @@
+"""Test the raw raid table cache"""
+# pylint: disable=import-error
+import pickle
+import pytest
+from .context import (
+    CACHE_HEADER,
+    RaidTableCache,
+    RaidEnemyTableArray,
+    RaidFilter,
+    SeedSearch,
+    Game,
+    StarLevel,
+    StoryProgress,
+)
+from .fixtures import FLATBUFFER_SLOTS, build_raid_enemy_table_array
+
+# order of the binaries read by RaidReader
+STAR_LEVELS = (
+    StarLevel.ONE_STAR,
+    StarLevel.TWO_STAR,
+    StarLevel.THREE_STAR,
+    StarLevel.FOUR_STAR,
+    StarLevel.FIVE_STAR,
+    StarLevel.SIX_STAR,
+    StarLevel.EVENT,
+)
+
+def test_save_and_load(tmp_path):
+    """Loaded binaries parse to the same tables without copying"""
+    raid_enemy_table_arrays = tuple(
+        RaidEnemyTableArray(build_raid_enemy_table_array()) for _ in range(7)
+    )
+    RaidTableCache.from_tables(Game.VIOLET, raid_enemy_table_arrays) \
+        .save(tmp_path / "raid_tables.bin")
+    table_cache = RaidTableCache.load(tmp_path / "raid_tables.bin")
+    assert table_cache.game_version == Game.VIOLET
+    assert list(table_cache.binaries)[-1] == StarLevel.EVENT
+    assert all(isinstance(binary, memoryview) for binary in table_cache.binaries.values())
+    loaded = table_cache.raid_enemy_table_arrays()
+    event_tables = loaded[StarLevel.EVENT].raid_enemy_tables
+    assert len(event_tables) == len(FLATBUFFER_SLOTS)
+    assert [table.raid_enemy_info.boss_poke_para.dev_id for table in event_tables] \
+        == [slot[3] for slot in FLATBUFFER_SLOTS]
+
+def test_corrupt_cache(tmp_path):
+    """Modified binaries fail their content hash"""
+    binary = build_raid_enemy_table_array()
+    RaidTableCache(Game.SCARLET, {StarLevel.ONE_STAR: binary}).save(tmp_path / "raid_tables.bin")
+    data = bytearray((tmp_path / "raid_tables.bin").read_bytes())
+    data[-1] ^= 0xFF
+    (tmp_path / "raid_tables.bin").write_bytes(data)
+    with pytest.raises(ValueError):
+        RaidTableCache.load(tmp_path / "raid_tables.bin")
+
+def test_truncated_cache(tmp_path):
+    """Truncated entry tables are rejected like any other invalid cache"""
+    binary = build_raid_enemy_table_array()
+    RaidTableCache(Game.SCARLET, {StarLevel.ONE_STAR: binary}).save(tmp_path / "raid_tables.bin")
+    data = (tmp_path / "raid_tables.bin").read_bytes()
+    (tmp_path / "raid_tables.bin").write_bytes(data[:CACHE_HEADER.size + 4])
+    with pytest.raises(ValueError):
+        RaidTableCache.load(tmp_path / "raid_tables.bin")
+
+def test_pickle_mapped_tables(tmp_path):
+    """Tables parsed from the memory mapped cache can be sent to seed search workers"""
+    binary = build_raid_enemy_table_array()
+    RaidTableCache(Game.SCARLET, dict.fromkeys(STAR_LEVELS, binary)) \
+        .save(tmp_path / "raid_tables.bin")
+    raid_enemy_table_arrays = RaidTableCache.load(tmp_path / "raid_tables.bin") \
+        .raid_enemy_table_arrays()
+    unpickled = pickle.loads(pickle.dumps(raid_enemy_table_arrays[StarLevel.EVENT]))
+    assert [table.raid_enemy_info.rate for table in unpickled.raid_enemy_tables] \
+        == [slot[2] for slot in FLATBUFFER_SLOTS]
+
+    table_search = SeedSearch(
+        RaidFilter(),
+        raid_enemy_table_arrays = raid_enemy_table_arrays,
+        story_progress = StoryProgress.SIX_STAR_UNLOCKED,
+        game = Game.SCARLET,
+        difficulty = StarLevel.SIX_STAR,
+    )
+    assert pickle.loads(pickle.dumps(table_search)).slots[0].rate == FLATBUFFER_SLOTS[0][2]
+
+    slot_search = SeedSearch(
+        RaidFilter(),
+        raid_enemy_info = raid_enemy_table_arrays[0].raid_enemy_tables[0].raid_enemy_info,
+        difficulty = StarLevel.THREE_STAR,
+        chunk_size = 0x100
+    )
+    assert list(pickle.loads(pickle.dumps(slot_search)).search_range(0, 0x400)) \
+        == list(slot_search.search_range(0, 0x400))
@@ -0,0 +1,92 @@
+"""Test pseudorandom number generators"""
+# pylint: disable=import-error
+import numpy as np
+from .context import (
+    Xoroshiro128Plus,
+    Xoroshiro128PlusInt,
+    Xoroshiro128PlusBatch,
+    SCXorshift32,
+    KeystreamCache
+)
+
+SEEDS = np.array(
+    (0x00000000, 0x11223344, 0x88776655, 0xDEADBEEF, 0x66774455, 0xFFFFFFFF, 0x12345678),
+    dtype = np.uint64
+)
+
+def test_int_parity():
+    """Pure int implementation is bit-identical to the numpy implementation"""
+    for seed in SEEDS:
+        reference = Xoroshiro128Plus(seed)
+        fast = Xoroshiro128PlusInt(seed)
+        for _ in range(16):
+            assert fast.next() == reference.next()
+        for maximum in (0xFFFFFFFF, 18, 100, 32, 6, 3, 2, 25, 0x81, 0x80, 1, 13, 12):
+            assert fast.rand(maximum) == reference.rand(maximum)
+            assert Xoroshiro128PlusInt.get_mask(maximum) \
+                == Xoroshiro128Plus.get_mask(np.uint64(maximum))
+
+def test_batch_next_parity():
+    """Batch next() is bit-identical to the scalar implementation"""
+    batch = Xoroshiro128PlusBatch(SEEDS)
+    scalars = [Xoroshiro128Plus(seed) for seed in SEEDS]
+    for _ in range(64):
+        batch_result = batch.next()
+        assert list(batch_result) == [scalar.next() for scalar in scalars]
+
+def test_batch_rand_parity():
+    """Batch rand() is bit-identical to the scalar implementation"""
+    batch = Xoroshiro128PlusBatch(SEEDS)
+    scalars = [Xoroshiro128Plus(seed) for seed in SEEDS]
+    for maximum in (0xFFFFFFFF, 18, 100, 32, 6, 3, 2, 25, 0x81, 0x80, 1, 13, 12):
+        batch_result = batch.rand(maximum)
+        assert list(batch_result) == [scalar.rand(maximum) for scalar in scalars]
+
+def test_batch_rand_per_lane_maximum():
+    """Batch rand() with a different maximum for each lane"""
+    batch = Xoroshiro128PlusBatch(SEEDS)
+    scalars = [Xoroshiro128Plus(seed) for seed in SEEDS]
+    maximums = np.array((3, 5, 6, 7, 100, 0xFFFFFFFF, 33), dtype = np.uint64)
+    for _ in range(16):
+        batch_result = batch.rand(maximums)
+        assert list(batch_result) == [
+            scalar.rand(maximum) for scalar, maximum in zip(scalars, maximums)
+        ]
+
+def test_batch_lane_selection():
+    """Selecting lanes of a batch keeps their states intact"""
+    batch = Xoroshiro128PlusBatch(SEEDS)
+    batch.rand(6)
+    selected = batch[np.array((1, 3))]
+    scalars = [Xoroshiro128Plus(SEEDS[1]), Xoroshiro128Plus(SEEDS[3])]
+    for scalar in scalars:
+        scalar.rand(6)
+    assert list(selected.rand(25)) == [scalar.rand(25) for scalar in scalars]
+
+def test_batch_rand_subset_of_lanes():
+    """Batch rand() on a subset of lanes only advances those lanes"""
+    batch = Xoroshiro128PlusBatch(SEEDS)
+    scalars = [Xoroshiro128Plus(seed) for seed in SEEDS]
+    lanes = np.array((0, 2, 5, 6))
+    for _ in range(16):
+        assert list(batch.rand(6, lanes)) == [scalars[lane].rand(6) for lane in lanes]
+    assert list(batch.rand(100)) == [scalar.rand(100) for scalar in scalars]
+
+def test_sc_xorshift_keystream_parity():
+    """Word-wise keystream generation matches byte-by-byte generation"""
+    for key in (0, 1, 0xDEADBEEF, 0x12345678, 0xFFFFFFFF):
+        rng = SCXorshift32(key)
+        reference = bytes(int(rng.next()) for _ in range(0x403))
+        for size in (0, 1, 5, 0x100, 0x403):
+            assert SCXorshift32.keystream(key, size).tobytes() == reference[:size]
+
+def test_keystream_cache():
+    """Cached keystreams extend to longer prefixes and evict the least recently used key"""
+    cache = KeystreamCache(max_keys = 2)
+    for size in (3, 0x10, 0x7, 0x403):
+        assert cache.get(0xDEADBEEF, size).tobytes() == \
+            SCXorshift32.keystream(0xDEADBEEF, size).tobytes()
+    cache.get(1, 8)
+    cache.get(0xDEADBEEF, 8)
+    cache.get(2, 8)
+    assert list(cache._words) == [0xDEADBEEF, 2] # pylint: disable=protected-access
@@ -0,0 +1,159 @@
+"""Test the vectorized seed search against scalar TeraRaid generation"""
+# pylint: disable=import-error
+import multiprocessing
+from .context import (
+    TeraRaid,
+    generate_if_matches,
+    SeedSearch,
+    EncounterIndex,
+    StarLevel,
+    StoryProgress,
+    Game,
+)
+from .fixtures import (
+    MockRaidEnemyInfo,
+    RAID_ENEMY_TABLE_ARRAYS,
+    MOCK_SLOTS,
+    FILTERS,
+    build_filter,
+)
+
+SEED_COUNT = 0x1000
+
+ENCOUNTER_INDEX = EncounterIndex(RAID_ENEMY_TABLE_ARRAYS)
+
+def build_raid(seed: int, content: int) -> TeraRaid:
+    """Build a raid for seed"""
+    return TeraRaid(
+        is_enabled = 1,
+        area_id = 0,
+        display_type = 0,
+        den_id = 0,
+        seed = seed,
+        _unused_14 = 0,
+        content = content,
+        collected_league_points = 0,
+    )
+
+def scalar_raids_slot(slot: MockRaidEnemyInfo) -> list[TeraRaid]:
+    """Reference generation of a fixed slot with scalar generation"""
+    raids = []
+    for seed in range(SEED_COUNT):
+        raid = build_raid(seed, 0)
+        raid.difficulty = StarLevel.THREE_STAR
+        raid.generate_pokemon(slot)
+        raids.append(raid)
+    return raids
+
+def scalar_raids_tables(
+    story_progress: StoryProgress,
+    game: Game,
+    difficulty: StarLevel,
+    delivery_group_id: int = None,
+) -> list[TeraRaid]:
+    """Reference generation of encounter tables with scalar generation"""
+    content = {StarLevel.SIX_STAR: 1, StarLevel.EVENT: 2}.get(difficulty, 0)
+    raids = []
+    for seed in range(SEED_COUNT):
+        raid = build_raid(seed, content)
+        raid.initialize_data(ENCOUNTER_INDEX, story_progress, game, delivery_group_id)
+        # normal dens must roll the searched difficulty
+        if content != 0 or raid.difficulty == difficulty:
+            raids.append(raid)
+    return raids
+
+def test_search_slot():
+    """Searching a fixed slot matches scalar generation"""
+    for slot in MOCK_SLOTS:
+        raids = scalar_raids_slot(slot)
+        for raid_filter in FILTERS:
+            seed_search = SeedSearch(
+                raid_filter,
+                raid_enemy_info = slot,
+                difficulty = StarLevel.THREE_STAR,
+                chunk_size = 0x400
+            )
+            assert list(seed_search.search_range(0, SEED_COUNT)) \
+                == [raid.seed for raid in raids if raid_filter.compare(raid)]
+
+def test_search_tables():
+    """Searching encounter tables matches scalar generation"""
+    for story_progress, game, difficulty, delivery_group_id in (
+        (StoryProgress.FOUR_STAR_UNLOCKED, Game.SCARLET, StarLevel.THREE_STAR, None),
+        (StoryProgress.SIX_STAR_UNLOCKED, Game.VIOLET, StarLevel.FIVE_STAR, None),
+        (StoryProgress.SIX_STAR_UNLOCKED, Game.SCARLET, StarLevel.SIX_STAR, None),
+        (StoryProgress.SIX_STAR_UNLOCKED, Game.VIOLET, StarLevel.EVENT, 1),
+        (StoryProgress.DEFAULT, Game.VIOLET, StarLevel.EVENT, 2),
+    ):
+        raids = scalar_raids_tables(story_progress, game, difficulty, delivery_group_id)
+        for raid_filter in FILTERS:
+            seed_search = SeedSearch(
+                raid_filter,
+                raid_enemy_table_arrays = RAID_ENEMY_TABLE_ARRAYS,
+                story_progress = story_progress,
+                game = game,
+                difficulty = difficulty,
+                delivery_group_id = delivery_group_id,
+                chunk_size = 0x400
+            )
+            assert list(seed_search.search_range(0, SEED_COUNT)) \
+                == [raid.seed for raid in raids if raid_filter.compare(raid)]
+
+def test_search_star_filter():
+    """Slots forcing a difficulty and event raids keeping StarLevel.EVENT
+       are filtered by difficulty like scalar generation"""
+    story_progress, game = StoryProgress.SIX_STAR_UNLOCKED, Game.VIOLET
+    raids = scalar_raids_tables(story_progress, game, StarLevel.EVENT, 1)
+    for star_filter in (
+        [StarLevel.SEVEN_STAR],
+        [StarLevel.EVENT],
+        [StarLevel.FOUR_STAR],
+        [StarLevel.ONE_STAR, StarLevel.EVENT],
+    ):
+        compiled_filter = build_filter(star_filter = star_filter).compile()
+        seed_search = SeedSearch(
+            compiled_filter,
+            raid_enemy_table_arrays = RAID_ENEMY_TABLE_ARRAYS,
+            story_progress = story_progress,
+            game = game,
+            difficulty = StarLevel.EVENT,
+            delivery_group_id = 1,
+            chunk_size = 0x400
+        )
+        assert list(seed_search.search_range(0, SEED_COUNT)) \
+            == [raid.seed for raid in raids if generate_if_matches(raid, compiled_filter)]
+
+def test_search_parallel():
+    """Sharded multi-process search matches the single process search"""
+    seed_search = SeedSearch(
+        FILTERS[1],
+        raid_enemy_table_arrays = RAID_ENEMY_TABLE_ARRAYS,
+        story_progress = StoryProgress.SIX_STAR_UNLOCKED,
+        game = Game.VIOLET,
+        difficulty = StarLevel.FIVE_STAR,
+        chunk_size = 0x400
+    )
+    progress = []
+    matches = seed_search.search_parallel(
+        0,
+        SEED_COUNT,
+        max_workers = 2,
+        shard_size = 0x300,
+        progress_callback = lambda searched, total: progress.append((searched, total))
+    )
+    assert list(matches) == list(seed_search.search_range(0, SEED_COUNT))
+    assert len(progress) == 6
+    assert progress[-1] == (SEED_COUNT, SEED_COUNT)
+
+def test_search_parallel_cancel():
+    """Cancelled multi-process search stops without yielding partial shards"""
+    seed_search = SeedSearch(FILTERS[0], raid_enemy_info = MOCK_SLOTS[0], chunk_size = 0x400)
+    cancel_event = multiprocessing.Event()
+    # an event that was never set is left unset and can be reused
+    expected = seed_search.search_range(0, SEED_COUNT)
+    for _ in range(2):
+        matches = seed_search.search_parallel(0, SEED_COUNT, 2, 0x400, None, cancel_event)
+        assert list(matches) == list(expected)
+        assert not cancel_event.is_set()
+    cancel_event.set()
+    assert len(seed_search.search_parallel(0, SEED_COUNT, 2, 0x400, None, cancel_event)) == 0